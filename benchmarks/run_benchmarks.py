@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+VibeSafe Scanner Benchmarks
+
+Times the scanners on synthetic projects from synthetic_repo.py and compares
+the results with stored baselines (benchmarks/baseline.json):
+
+- scan_project, scan_cips, scan_backlog (whats_next.py)
+- collect_all_ids, fix_reverse_links (validate_vibesafe_structure.py, dry run)
+- update_index (backlog/update_index.py)
+- whats_next and the validator as full command-line runs, without and with
+  the frontmatter cache
+
+In-process cases run with VIBESAFE_NO_CACHE=1, so every file is parsed.
+Each case is run --repeat times and the fastest time is kept. A case
+regresses when it is slower than its baseline by more than the threshold
+(a fraction, default 0.25) and by more than MIN_DELTA seconds, which keeps
+millisecond-scale cases from failing on noise.
+
+Usage:
+    python benchmarks/run_benchmarks.py                      # 1k, compared with the baseline
+    python benchmarks/run_benchmarks.py --sizes 1k,10k,100k --work-dir /tmp/vibesafe-bench
+    python benchmarks/run_benchmarks.py --sizes 1k,10k --update-baseline
+
+Baselines depend on the machine; re-record them with --update-baseline
+before comparing on a different one.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+SCRIPTS_DIR = os.path.join(REPO_ROOT, 'templates', 'scripts')
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+
+sys.path.insert(0, BENCH_DIR)
+import synthetic_repo  # noqa: E402
+
+DEFAULT_THRESHOLD = 0.25
+MIN_DELTA = 0.01
+
+WHATS_NEXT_ARGS = ['--no-git', '--no-update', '--no-color']
+VALIDATE_ARGS = ['--no-color', '--no-governance-drift']
+
+CASES = [
+    'scan_project', 'scan_cips', 'scan_backlog', 'collect_all_ids', 'fix_reverse_links',
+    'update_index', 'cli_whats_next', 'cli_whats_next_cached', 'cli_validate',
+]
+
+
+def _load(name: str, path: str):
+    """Import a script from its file path under the given module name."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    """Return the fastest of repeat runs of function, in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _run_cli(script: str, args: List[str]):
+    proc = subprocess.run([sys.executable, script] + args, capture_output=True, text=True)
+    # The validator exits 1 on the legacy files the generator writes
+    if proc.returncode not in (0, 1):
+        raise RuntimeError(f'{os.path.basename(script)} failed ({proc.returncode}):\n{proc.stderr}')
+
+
+def run_cases(root: str, cases: List[str], repeat: int) -> Dict[str, float]:
+    """Time the given cases on the project in root; returns {case: seconds}."""
+    whats_next = _load('whats_next', os.path.join(SCRIPTS_DIR, 'whats_next.py'))
+    validator = _load('validate_vibesafe_structure', os.path.join(SCRIPTS_DIR, 'validate_vibesafe_structure.py'))
+    from vibesafe_project import scan_project
+
+    results = {}
+    original_dir = os.getcwd()
+    os.chdir(root)
+    try:
+        with _environ({'VIBESAFE_NO_CACHE': '1', 'VIBESAFE_DAEMON': ''}):
+            project = scan_project('.')
+            update_index = _load('update_index_' + os.path.basename(root), os.path.join(root, 'backlog', 'update_index.py'))
+            functions = {
+                'scan_project': lambda: scan_project('.'),
+                'scan_cips': lambda: whats_next.scan_cips(project),
+                'scan_backlog': lambda: whats_next.scan_backlog(project),
+                'collect_all_ids': lambda: validator.collect_all_ids('.'),
+                'fix_reverse_links': lambda: validator.fix_reverse_links(
+                    '.', validator.ValidationResult(), dry_run=True),
+                'update_index': update_index.update_index,
+            }
+            for case in cases:
+                if case in functions:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        results[case] = best_time(functions[case], repeat)
+
+        with _environ({'VIBESAFE_DAEMON': ''}):
+            whats_next_script = os.path.join('scripts', 'whats_next.py')
+            validate_script = os.path.join('scripts', 'validate_vibesafe_structure.py')
+            if 'cli_whats_next' in cases:
+                results['cli_whats_next'] = best_time(
+                    lambda: _run_cli(whats_next_script, WHATS_NEXT_ARGS + ['--no-cache']), repeat)
+            if 'cli_whats_next_cached' in cases:
+                _run_cli(whats_next_script, WHATS_NEXT_ARGS)  # fill the cache
+                results['cli_whats_next_cached'] = best_time(
+                    lambda: _run_cli(whats_next_script, WHATS_NEXT_ARGS), repeat)
+            if 'cli_validate' in cases:
+                results['cli_validate'] = best_time(
+                    lambda: _run_cli(validate_script, VALIDATE_ARGS + ['--no-cache']), repeat)
+    finally:
+        os.chdir(original_dir)
+    return results
+
+
+@contextlib.contextmanager
+def _environ(values: Dict[str, str]):
+    """Set environment variables for the duration of a block."""
+    saved = {name: os.environ.get(name) for name in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float = DEFAULT_THRESHOLD, min_delta: float = MIN_DELTA) -> List[str]:
+    """Return a message for every case slower than its baseline by more than the threshold."""
+    regressions = []
+    for size, cases in results.items():
+        for case, seconds in cases.items():
+            base = baseline.get(size, {}).get(case)
+            if base is None:
+                continue
+            if seconds > base * (1 + threshold) and seconds - base > min_delta:
+                regressions.append(f'{size} {case}: {seconds:.3f}s vs baseline {base:.3f}s '
+                                   f'(+{(seconds / base - 1) * 100:.0f}%)')
+    return regressions
+
+
+def load_baseline(path: str) -> Dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, results: Dict[str, Dict[str, float]], threshold: float):
+    """Merge results into the baseline file, replacing the sizes that were run."""
+    data = load_baseline(path)
+    data['threshold'] = threshold
+    data['environment'] = {'python': platform.python_version(), 'machine': platform.machine(),
+                           'system': platform.system()}
+    data.setdefault('results', {}).update(
+        {size: {case: round(seconds, 4) for case, seconds in cases.items()} for size, cases in results.items()})
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def prepare_tree(size: str, work_dir: str, seed: int) -> str:
+    """Generate the project for a size in work_dir, reusing one from an earlier run."""
+    root = os.path.join(work_dir, f'vibesafe-{size}-seed{seed}')
+    if not os.path.exists(os.path.join(root, '.generated')):
+        shutil.rmtree(root, ignore_errors=True)
+        synthetic_repo.generate(root, seed=seed, **synthetic_repo.counts_for_size(synthetic_repo.SIZES[size]))
+        with open(os.path.join(root, '.generated'), 'w') as f:
+            f.write('')
+    # The scripts under test are always the current ones
+    synthetic_repo.install_scripts(root)
+    shutil.rmtree(os.path.join(root, '.vibesafe', 'cache'), ignore_errors=True)
+    return root
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the VibeSafe scanners on synthetic projects')
+    parser.add_argument('--sizes', default='1k',
+                        help=f"Comma-separated sizes from {', '.join(synthetic_repo.SIZES)} (default: 1k)")
+    parser.add_argument('--cases', default=','.join(CASES), help='Comma-separated cases to run (default: all)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case; the fastest counts (default: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic projects (default: 0)')
+    parser.add_argument('--work-dir', help='Keep generated projects here for reuse (default: a temporary directory)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline file (default: benchmarks/baseline.json)')
+    parser.add_argument('--threshold', type=float,
+                        help=f'Allowed slowdown as a fraction (default: from the baseline file, else {DEFAULT_THRESHOLD})')
+    parser.add_argument('--update-baseline', action='store_true', help='Record these results as the baseline')
+    parser.add_argument('--json', metavar='PATH', help='Also write the results to PATH as JSON')
+    args = parser.parse_args(argv)
+
+    sizes = [size.strip() for size in args.sizes.split(',') if size.strip()]
+    cases = [case.strip() for case in args.cases.split(',') if case.strip()]
+    unknown = [s for s in sizes if s not in synthetic_repo.SIZES] + [c for c in cases if c not in CASES]
+    if unknown:
+        parser.error(f"unknown size or case: {', '.join(unknown)}")
+
+    baseline = load_baseline(args.baseline)
+    threshold = args.threshold if args.threshold is not None else baseline.get('threshold', DEFAULT_THRESHOLD)
+
+    results = {}
+    with contextlib.ExitStack() as stack:
+        work_dir = args.work_dir or stack.enter_context(tempfile.TemporaryDirectory(prefix='vibesafe-bench-'))
+        os.makedirs(work_dir, exist_ok=True)
+        for size in sizes:
+            root = prepare_tree(size, work_dir, args.seed)
+            results[size] = run_cases(root, cases, args.repeat)
+            base = baseline.get('results', {}).get(size, {})
+            print(f'{size}:')
+            for case, seconds in results[size].items():
+                note = f'  (baseline {base[case]:.3f}s)' if case in base else ''
+                print(f'  {case:<24}{seconds:8.3f}s{note}')
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+    if args.update_baseline:
+        save_baseline(args.baseline, results, threshold)
+        print(f'Baseline updated: {args.baseline}')
+        return 0
+
+    regressions = compare(results, baseline.get('results', {}), threshold)
+    if regressions:
+        print(f'\nRegressions (threshold {threshold:.0%}):')
+        for message in regressions:
+            print(f'  {message}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
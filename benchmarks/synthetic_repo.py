@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Synthetic VibeSafe Repository Generator
+
+Creates a VibeSafe project tree of a chosen size for benchmarking the
+scanners: CIPs, backlog items, requirements and tenets with realistic YAML
+frontmatter and bodies, a share of legacy files without frontmatter (as left
+by projects that predate REQ-0001), bottom-up cross-links, and a few reverse
+links for the validator's --fix-links to move. The VibeSafe scripts are
+installed from templates/ the way the installer does, so the full CLI can run
+against the tree.
+
+Usage:
+    python benchmarks/synthetic_repo.py DEST --size 10k
+    python benchmarks/synthetic_repo.py DEST --cips 500 --backlog 2000 --requirements 300 --tenets 40
+
+The output is deterministic for a given size and --seed.
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+from typing import Dict
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATES_DIR = os.path.join(REPO_ROOT, 'templates')
+
+# Named sizes: total component files across all four directories
+SIZES = {
+    '1k': 1_000,
+    '10k': 10_000,
+    '100k': 100_000,
+}
+
+# How a total is shared out between the components
+SHARES = {
+    'cips': 0.25,
+    'backlog': 0.45,
+    'requirements': 0.20,
+    'tenets': 0.10,
+}
+
+# CIP and requirement IDs are four hex digits
+MAX_HEX_IDS = 0x10000
+
+BACKLOG_CATEGORIES = ['features', 'bugs', 'documentation', 'infrastructure']
+CIP_STATUSES = ['Proposed', 'Accepted', 'In Progress', 'Implemented', 'Closed', 'Closed', 'Closed']
+BACKLOG_STATUSES = ['Proposed', 'Ready', 'In Progress', 'Completed', 'Completed', 'Abandoned']
+REQUIREMENT_STATUSES = ['Proposed', 'Ready', 'In Progress', 'Implemented', 'Validated']
+PRIORITIES = ['High', 'Medium', 'Medium', 'Low']
+WORDS = [
+    'cache', 'index', 'scanner', 'frontmatter', 'validator', 'backlog', 'tenet',
+    'requirement', 'report', 'install', 'template', 'compression', 'status',
+    'prompt', 'link', 'review', 'startup', 'watcher', 'daemon', 'manifest',
+]
+
+
+def counts_for_size(total: int) -> Dict[str, int]:
+    """Share a total number of component files out between the components."""
+    counts = {component: int(total * share) for component, share in SHARES.items()}
+    counts['backlog'] += total - sum(counts.values())
+    return counts
+
+
+def _title(rng: random.Random) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(4)).capitalize()
+
+
+def _slug(title: str, n: int) -> str:
+    return '-'.join(title.lower().split()[:3]) + f'-{n}'
+
+
+def _date(rng: random.Random) -> str:
+    return f'20{rng.randint(23, 26)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}'
+
+
+def _body(rng: random.Random, heading: str) -> str:
+    """A markdown body of a few kilobytes, so reading whole files costs what it would."""
+    sections = [heading, '']
+    for name in ['Description', 'Motivation', 'Implementation', 'Notes']:
+        sections.append(f'## {name}')
+        sections.append('')
+        for _ in range(rng.randint(2, 5)):
+            sections.append(' '.join(rng.choice(WORDS) for _ in range(rng.randint(15, 40))) + '.')
+            sections.append('')
+    return '\n'.join(sections)
+
+
+def _yaml_list(name: str, values) -> str:
+    if not values:
+        return f'{name}: []\n'
+    return f'{name}:\n' + ''.join(f'- {value}\n' for value in values)
+
+
+def _write(path: str, content: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def install_scripts(dest: str):
+    """Copy the VibeSafe scripts into the tree, as the installer does."""
+    scripts_dir = os.path.join(dest, 'scripts')
+    os.makedirs(scripts_dir, exist_ok=True)
+    source_dir = os.path.join(TEMPLATES_DIR, 'scripts')
+    for name in sorted(os.listdir(source_dir)):
+        if name.endswith('.py'):
+            shutil.copy2(os.path.join(source_dir, name), os.path.join(scripts_dir, name))
+    os.makedirs(os.path.join(dest, 'backlog'), exist_ok=True)
+    shutil.copy2(os.path.join(TEMPLATES_DIR, 'backlog', 'update_index.py'),
+                 os.path.join(dest, 'backlog', 'update_index.py'))
+
+
+def generate(dest: str, cips: int, backlog: int, requirements: int, tenets: int,
+             legacy_fraction: float = 0.05, reverse_link_fraction: float = 0.01,
+             seed: int = 0, scripts: bool = True) -> Dict[str, int]:
+    """Generate a synthetic VibeSafe project in dest.
+
+    Args:
+        dest: Directory to create the project in (created if missing)
+        cips, backlog, requirements, tenets: Number of files of each component
+        legacy_fraction: Share of CIPs and backlog items written without frontmatter
+        reverse_link_fraction: Share of tenets, requirements and CIPs given a
+            reverse (top-down) link that --fix-links would move
+        seed: Random seed; the same arguments always give the same tree
+        scripts: Install the VibeSafe scripts into dest/scripts and dest/backlog
+
+    Returns:
+        Counts of what was written: files per component, legacy files and reverse links.
+    """
+    if cips > MAX_HEX_IDS or requirements > MAX_HEX_IDS:
+        raise ValueError(f'CIP and requirement IDs are 4 hex digits: at most {MAX_HEX_IDS} of each')
+    rng = random.Random(seed)
+    stats = {'cips': cips, 'backlog': backlog, 'requirements': requirements, 'tenets': tenets,
+             'legacy_cips': 0, 'legacy_backlog': 0, 'reverse_links': 0}
+
+    for directory in ['cip', 'requirements', 'tenets'] + [f'backlog/{c}' for c in BACKLOG_CATEGORIES]:
+        os.makedirs(os.path.join(dest, directory), exist_ok=True)
+    if scripts:
+        install_scripts(dest)
+
+    tenet_ids = []
+    for n in range(tenets):
+        title = _title(rng)
+        tenet_id = _slug(title, n)
+        tenet_ids.append(tenet_id)
+        group = os.path.join(dest, 'tenets', f'group-{n // 50:03d}')
+        os.makedirs(group, exist_ok=True)
+        header = (
+            f'---\nid: "{tenet_id}"\ntitle: "{title}"\nstatus: "Active"\n'
+            f'created: "{_date(rng)}"\nlast_reviewed: "{_date(rng)}"\nreview_frequency: "Annual"\n'
+            + _yaml_list('tags', rng.sample(WORDS, 2))
+        )
+        if rng.random() < reverse_link_fraction and requirements:
+            header += _yaml_list('related_requirements', [f"'{rng.randrange(requirements):04X}'"])
+            stats['reverse_links'] += 1
+        _write(os.path.join(group, f'{tenet_id}.md'),
+               header + '---\n\n' + _body(rng, f'## Tenet: {tenet_id}'))
+
+    requirement_ids = [f'{n:04X}' for n in range(requirements)]
+    for n, req_id in enumerate(requirement_ids):
+        title = _title(rng)
+        header = (
+            f"---\nid: '{req_id}'\ntitle: {title}\nstatus: {rng.choice(REQUIREMENT_STATUSES)}\n"
+            f"priority: {rng.choice(PRIORITIES)}\ncreated: '{_date(rng)}'\nlast_updated: '{_date(rng)}'\n"
+            + _yaml_list('related_tenets', rng.sample(tenet_ids, min(2, len(tenet_ids))))
+            + _yaml_list('stakeholders', ['developers'])
+            + _yaml_list('tags', rng.sample(WORDS, 3))
+        )
+        if rng.random() < reverse_link_fraction and cips:
+            header += _yaml_list('related_cips', [f"'{rng.randrange(cips):04X}'"])
+            stats['reverse_links'] += 1
+        _write(os.path.join(dest, 'requirements', f'req{req_id}_{_slug(title, n)}.md'),
+               header + '---\n\n' + _body(rng, f'# Requirement {req_id}: {title}'))
+
+    backlog_ids = []
+    for n in range(backlog):
+        title = _title(rng)
+        date = _date(rng)
+        backlog_ids.append((f'{date}_{_slug(title, n)}', rng.choice(BACKLOG_CATEGORIES), title, date))
+
+    for n in range(cips):
+        cip_id = f'{n:04X}'
+        title = _title(rng)
+        status = rng.choice(CIP_STATUSES)
+        path = os.path.join(dest, 'cip', f'cip{cip_id}.md')
+        heading = f'# CIP-{cip_id}: {title}'
+        if rng.random() < legacy_fraction:
+            stats['legacy_cips'] += 1
+            _write(path, f'{heading}\n\n## Status\n\n- [x] {status.split()[0]}: {_date(rng)}\n\n'
+                   + _body(rng, '## Summary'))
+            continue
+        header = (
+            f"---\nid: '{cip_id}'\ntitle: {title}\nstatus: {status}\nauthor: Ada Lovelace\n"
+            f"created: '{_date(rng)}'\nlast_updated: '{_date(rng)}'\n"
+            + _yaml_list('related_requirements',
+                         [f"'{r}'" for r in rng.sample(requirement_ids, min(2, len(requirement_ids)))])
+            + _yaml_list('tags', rng.sample(WORDS, 3))
+        )
+        if status == 'Closed' and rng.random() < 0.5:
+            header += 'compressed: true\n'
+        if rng.random() < reverse_link_fraction and backlog_ids:
+            header += _yaml_list('related_backlog', [rng.choice(backlog_ids)[0]])
+            stats['reverse_links'] += 1
+        _write(path, header + '---\n\n' + _body(rng, heading))
+
+    for backlog_id, category, title, date in backlog_ids:
+        status = rng.choice(BACKLOG_STATUSES)
+        priority = rng.choice(PRIORITIES)
+        path = os.path.join(dest, 'backlog', category, f'{backlog_id}.md')
+        details = (
+            f'# Task: {title}\n\n- **ID**: {backlog_id}\n- **Title**: {title}\n'
+            f'- **Status**: {status}\n- **Priority**: {priority}\n- **Created**: {date}\n'
+        )
+        if rng.random() < legacy_fraction:
+            stats['legacy_backlog'] += 1
+            _write(path, details + '\n' + _body(rng, '## Details'))
+            continue
+        header = (
+            f"---\nid: {backlog_id}\ntitle: {title}\nstatus: {status}\npriority: {priority}\n"
+            f"created: '{date}'\nlast_updated: '{_date(rng)}'\ncategory: {category}\nowner: Ada Lovelace\n"
+            + _yaml_list('related_cips', [f"'{rng.randrange(cips):04X}'"] if cips else [])
+            + _yaml_list('tags', rng.sample(WORDS, 2))
+        )
+        _write(path, header + '---\n\n' + details + '\n' + _body(rng, '## Details'))
+
+    return stats
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Generate a synthetic VibeSafe project for benchmarks')
+    parser.add_argument('dest', help='Directory to create the project in')
+    parser.add_argument('--size', choices=sorted(SIZES), default='1k',
+                        help='Total component files (default: 1k); overridden per component by the options below')
+    for component in SHARES:
+        parser.add_argument(f'--{component}', type=int, metavar='N', help=f'Number of {component}')
+    parser.add_argument('--legacy-fraction', type=float, default=0.05,
+                        help='Share of CIPs and backlog items without frontmatter (default: 0.05)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--no-scripts', action='store_true', help='Do not install the VibeSafe scripts')
+    args = parser.parse_args(argv)
+
+    counts = counts_for_size(SIZES[args.size])
+    for component in SHARES:
+        if getattr(args, component) is not None:
+            counts[component] = getattr(args, component)
+
+    try:
+        stats = generate(args.dest, legacy_fraction=args.legacy_fraction, seed=args.seed,
+                         scripts=not args.no_scripts, **counts)
+    except ValueError as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
+    print(f"Generated {args.dest}: {stats['cips']} CIPs ({stats['legacy_cips']} legacy), "
+          f"{stats['backlog']} backlog items ({stats['legacy_backlog']} legacy), "
+          f"{stats['requirements']} requirements, {stats['tenets']} tenets, "
+          f"{stats['reverse_links']} reverse links")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
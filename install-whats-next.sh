@@ -3,7 +3,7 @@
 #
 # This script sets up the What's Next script by:
 # 1. Creating a Python virtual environment
-# 2. Installing required dependencies
+# 2. Installing required dependencies (skipped while the venv's stamp matches)
 # 3. Making the script executable
 # 4. Creating a convenience wrapper script
 #
@@ -25,30 +25,44 @@ set -e
 
 echo "Installing 'What's Next' Script..."
 
-# Create and activate a virtual environment if it doesn't exist
 VENV_DIR=".venv-vibesafe"
-if [ ! -d "$VENV_DIR" ]; then
-    echo "Creating virtual environment..."
-    python3 -m venv "$VENV_DIR"
-    if [ $? -ne 0 ]; then
-        echo "Error: Failed to create virtual environment."
-        echo "Make sure python3-venv is installed on your system."
-        echo "  - Ubuntu/Debian: apt-get install python3-venv"
-        echo "  - macOS: Python 3 should include venv by default"
-        exit 1
+DEPENDENCIES="PyYAML python-frontmatter"
+# Records the interpreter version and dependency hash the venv was set up for
+STAMP_FILE="$VENV_DIR/.vibesafe-stamp"
+
+venv_stamp() {
+    "$VENV_DIR/bin/python" -c 'import hashlib, sys
+print("python " + sys.version.split()[0])
+print("deps " + hashlib.sha256(sys.argv[1].encode()).hexdigest())' "$DEPENDENCIES" 2>/dev/null
+}
+
+if [ -f "$STAMP_FILE" ] && [ "$(venv_stamp)" = "$(cat "$STAMP_FILE")" ]; then
+    echo "Dependencies are up to date ($VENV_DIR)."
+else
+    # Create the virtual environment if it doesn't exist or its Python no longer runs
+    if ! "$VENV_DIR/bin/python" -c '' 2>/dev/null; then
+        if [ -d "$VENV_DIR" ]; then
+            echo "Recreating virtual environment (its Python no longer runs)..."
+            rm -rf "$VENV_DIR"
+        else
+            echo "Creating virtual environment..."
+        fi
+        if ! python3 -m venv "$VENV_DIR"; then
+            echo "Error: Failed to create virtual environment."
+            echo "Make sure python3-venv is installed on your system."
+            echo "  - Ubuntu/Debian: apt-get install python3-venv"
+            echo "  - macOS: Python 3 should include venv by default"
+            exit 1
+        fi
     fi
-fi
-
-# Activate the virtual environment
-echo "Activating virtual environment..."
-source "$VENV_DIR/bin/activate"
 
-# Install dependencies
-echo "Installing dependencies..."
-python3 -m pip install PyYAML python-frontmatter
-if [ $? -ne 0 ]; then
-    echo "Error: Failed to install dependencies."
-    exit 2
+    # Install dependencies (pip leaves the ones already satisfied alone)
+    echo "Installing dependencies..."
+    if ! "$VENV_DIR/bin/python" -m pip install $DEPENDENCIES; then
+        echo "Error: Failed to install dependencies."
+        exit 2
+    fi
+    venv_stamp > "$STAMP_FILE"
 fi
 
 # Ensure scripts/whats_next.py exists (dogfood installs copy from templates/)
@@ -57,6 +71,9 @@ if [ ! -f "scripts/whats_next.py" ]; then
         echo "Installing scripts/whats_next.py from templates..."
         mkdir -p scripts
         cp -f "templates/scripts/whats_next.py" "scripts/whats_next.py"
+        for helper in templates/scripts/vibesafe_*.py; do
+            [ -f "$helper" ] && cp -f "$helper" "scripts/$(basename "$helper")"
+        done
     else
         echo "Error: scripts/whats_next.py not found."
         echo "Run the installer first (scripts/install-minimal.sh) or provide templates/scripts/whats_next.py."
@@ -121,9 +138,6 @@ else
     echo "Warning: Requirements cursor rule template not found."
 fi
 
-# Deactivate virtual environment
-deactivate
-
 echo ""
 echo "Installation complete!"
 echo "You can now run the 'What's Next' script using:"
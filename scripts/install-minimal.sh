@@ -18,6 +18,18 @@ NC='\033[0m' # No Color
 : "${VIBESAFE_TEMPLATES_DIR:=}"
 : "${VIBESAFE_DEBUG:=false}"
 : "${VIBESAFE_INSTALL_WHATS_NEXT:=true}"
+# Template bundle cache, shared by every project installed on this machine
+: "${VIBESAFE_CACHE_DIR:=${XDG_CACHE_HOME:-$HOME/.cache}/vibesafe}"
+: "${VIBESAFE_REF:=}"            # Branch or tag to install (default: the repository's default branch)
+: "${VIBESAFE_REFRESH:=false}"   # Fetch the templates again even if they are cached
+: "${VIBESAFE_OFFLINE:=false}"   # Never fetch; install from the cache only
+: "${VIBESAFE_NO_BUNDLE_CACHE:=false}"  # Clone into a temporary directory, bypassing the cache
+: "${VIBESAFE_DRY_RUN:=false}"   # Print the install plan without changing anything
+
+# Installed system files and their hashes, compared on reinstall
+INSTALL_MANIFEST=".vibesafe/manifest"
+# "<status> <path>" line per system file considered by this install
+INSTALL_PLAN=""
 
 # Function to check if a command exists
 command_exists() {
@@ -47,17 +59,98 @@ print_banner() {
   echo ""
 }
 
+# Function to print the SHA-256 of a file
+file_sha256() {
+  local hash_cmd
+  hash_cmd=$(sha256_command) || return 1
+  $hash_cmd "$1" | cut -c1-64
+}
+
+# Function to print the hash INSTALL_MANIFEST recorded for a path, if any
+manifest_hash() {
+  [ -f "$INSTALL_MANIFEST" ] || return 0
+  awk -v path="$1" 'substr($0, 67) == path { print substr($0, 1, 64) }' "$INSTALL_MANIFEST"
+}
+
+# Function to install a system file, copying it only if its content changed.
+# Records in INSTALL_PLAN whether the file is added, updated, unchanged or
+# locally-modified (edited since the last install; overwritten all the same).
+install_system_file() {
+  local src="$1"
+  local dest="$2"
+  local status recorded
+  
+  case $'\n'"$INSTALL_PLAN" in
+    *" $dest"$'\n'*) return 0 ;;  # Already installed by this run
+  esac
+  
+  if [ ! -f "$dest" ]; then
+    status="added"
+  elif cmp -s "$src" "$dest"; then
+    status="unchanged"
+  else
+    recorded=$(manifest_hash "$dest")
+    if [ -n "$recorded" ] && [ "$recorded" != "$(file_sha256 "$dest")" ]; then
+      status="locally-modified"
+    else
+      status="updated"
+    fi
+  fi
+  INSTALL_PLAN+="$status $dest"$'\n'
+  
+  if [ "$status" != "unchanged" ] && [ "$VIBESAFE_DRY_RUN" != "true" ]; then
+    mkdir -p "$(dirname "$dest")"
+    cp -f "$src" "$dest"
+    debug "Installed system file ($status): $dest"
+  fi
+}
+
+# Function to list the system files of INSTALL_PLAN with a given status
+install_plan_files() {
+  printf '%s' "$INSTALL_PLAN" | grep "^$1 " | cut -d' ' -f2-
+}
+
+# Function to print the install plan, grouped by status
+print_install_plan() {
+  local status files
+  
+  for status in added updated locally-modified unchanged; do
+    files=$(install_plan_files "$status")
+    if [ -z "$files" ]; then
+      echo "$status: 0"
+      continue
+    fi
+    echo "$status: $(echo "$files" | wc -l | tr -d ' ')"
+    echo "$files" | sed 's/^/  /'
+  done
+}
+
+# Function to record the installed system files and their hashes in INSTALL_MANIFEST
+write_install_manifest() {
+  local hash_cmd
+  if ! hash_cmd=$(sha256_command); then
+    debug "Neither sha256sum nor shasum found; not writing $INSTALL_MANIFEST"
+    return 0
+  fi
+  
+  mkdir -p "$(dirname "$INSTALL_MANIFEST")"
+  printf '%s' "$INSTALL_PLAN" | cut -d' ' -f2- | while IFS= read -r path; do
+    [ -f "$path" ] && printf '%s\0' "$path"
+  done | xargs -0 $hash_cmd > "$INSTALL_MANIFEST.tmp" && mv "$INSTALL_MANIFEST.tmp" "$INSTALL_MANIFEST"
+  debug "Recorded installed system files in $INSTALL_MANIFEST"
+}
+
 # Function to create system template files (always overwrite)
 create_system_template() {
   local dir="$1"
   local file="$2"
   local content="$3"
+  local tmp_file
   
-  # Make sure the directory exists
-  mkdir -p "$dir"
-  
-  echo "$content" > "$dir/$file"
-  debug "Created/updated system template: $dir/$file"
+  tmp_file=$(mktemp)
+  echo "$content" > "$tmp_file"
+  install_system_file "$tmp_file" "$dir/$file"
+  rm -f "$tmp_file"
 }
 
 # Function to check for and offer ai-requirements migration
@@ -113,32 +206,33 @@ install_system_files() {
     
     for template in "${system_templates[@]}"; do
       if [ -f "$templates_dir/templates/$template" ]; then
-        target_dir=$(dirname "$template")
-        mkdir -p "$target_dir"
-        cp -f "$templates_dir/templates/$template" "$template"
-        debug "Installed system file: $template"
+        install_system_file "$templates_dir/templates/$template" "$template"
       fi
     done
     
     # Install Requirements framework (replaces AI-Requirements)
     if [ -d "$templates_dir/templates/requirements" ]; then
       debug "Installing Requirements framework"
-      mkdir -p requirements
-      cp -f "$templates_dir/templates/requirements/"* requirements/ 2>/dev/null || true
+      for requirement_file in "$templates_dir/templates/requirements/"*; do
+        [ -f "$requirement_file" ] && install_system_file "$requirement_file" "requirements/$(basename "$requirement_file")"
+      done
       echo "  ✅ Requirements framework installed (ai-requirements is deprecated)"
     fi
     
     # Generate AI assistant context files from base prompts (CIP-0012 Phase 2)
     # Default: generate for all platforms (respects user autonomy)
     local target_platform="${VIBESAFE_PLATFORM:-all}"
-    if [ -d "$templates_dir/templates/prompts" ]; then
+    if [ "$VIBESAFE_DRY_RUN" = "true" ]; then
+      debug "Dry run: not generating AI context for platform: $target_platform"
+    elif [ -d "$templates_dir/templates/prompts" ]; then
       debug "Generating AI context for platform: $target_platform"
       generate_prompts_for_platform "$target_platform" "$templates_dir"
     elif [ -d "$templates_dir/templates/.cursor" ]; then
       # Fallback: Legacy cursor rules installation (backward compatibility)
       debug "Using legacy cursor rules installation (templates/prompts not found)"
-      mkdir -p .cursor/rules
-      cp -f "$templates_dir/templates/.cursor/rules/"* .cursor/rules/ 2>/dev/null || true
+      for rule_file in "$templates_dir/templates/.cursor/rules/"*; do
+        [ -f "$rule_file" ] && install_system_file "$rule_file" ".cursor/rules/$(basename "$rule_file")"
+      done
     fi
     
   else
@@ -154,10 +248,12 @@ install_minimal_system_files() {
   debug "Installing minimal system files"
   
   # Create directory structure
-  mkdir -p backlog/{documentation,features,infrastructure,bugs}
-  mkdir -p cip
-  mkdir -p tenets
-  mkdir -p requirements
+  if [ "$VIBESAFE_DRY_RUN" != "true" ]; then
+    mkdir -p backlog/{documentation,features,infrastructure,bugs}
+    mkdir -p cip
+    mkdir -p tenets
+    mkdir -p requirements
+  fi
   
   # Backlog system files
   create_system_template "backlog" "README.md" "# Backlog System
@@ -294,6 +390,18 @@ EOL
   fi
 }
 
+# Dependencies of the What's Next script, and the stamp recording what
+# .venv-vibesafe was set up for (same format as install-whats-next.sh)
+WHATS_NEXT_DEPENDENCIES="PyYAML python-frontmatter"
+WHATS_NEXT_VENV_STAMP=".venv-vibesafe/.vibesafe-stamp"
+
+# Function to print the stamp of .venv-vibesafe: interpreter version and dependency hash
+whats_next_venv_stamp() {
+  .venv-vibesafe/bin/python -c 'import hashlib, sys
+print("python " + sys.version.split()[0])
+print("deps " + hashlib.sha256(sys.argv[1].encode()).hexdigest())' "$WHATS_NEXT_DEPENDENCIES" 2>/dev/null
+}
+
 # Function to setup the "What's Next" script
 setup_whats_next() {
   echo "Setting up 'What's Next' script..."
@@ -359,16 +467,22 @@ setup_whats_next() {
     else
       echo "Creating basic What's Next setup..."
       
-      # Create virtual environment if it doesn't exist (preserve if exists)
-      if [ ! -d ".venv-vibesafe" ]; then
-        python3 -m venv .venv-vibesafe
-        debug "Created virtual environment"
+      if [ -f "$WHATS_NEXT_VENV_STAMP" ] && [ "$(whats_next_venv_stamp)" = "$(cat "$WHATS_NEXT_VENV_STAMP")" ]; then
+        debug "Virtual environment is up to date, skipping dependency install"
       else
-        debug "Preserved existing virtual environment"
-      fi
+        # Create virtual environment if it doesn't exist or no longer runs (preserve if it does)
+        if ! .venv-vibesafe/bin/python -c '' 2>/dev/null; then
+          rm -rf .venv-vibesafe
+          python3 -m venv .venv-vibesafe
+          debug "Created virtual environment"
+        else
+          debug "Preserved existing virtual environment"
+        fi
 
-      # Install dependencies
-      .venv-vibesafe/bin/pip install -q PyYAML python-frontmatter
+        # Install dependencies
+        .venv-vibesafe/bin/python -m pip install -q $WHATS_NEXT_DEPENDENCIES && \
+          whats_next_venv_stamp > "$WHATS_NEXT_VENV_STAMP"
+      fi
       
       # Create wrapper script (always overwrite - it's a system file)
 cat > whats-next << 'EOF'
@@ -434,8 +548,14 @@ AGENTS.md
 
 # VibeSafe scripts and tools
 scripts/whats_next.py
+scripts/vibesafe_*.py
 install-whats-next.sh
 whats-next
+
+# VibeSafe local caches and generated-file manifests
+.vibesafe/cache/
+.vibesafe/prompts.json
+.vibesafe/manifest
 EOF
 
   # Only add templates/ to gitignore for non-dogfood installs
@@ -653,13 +773,47 @@ run_vibesafe_validation() {
 # in templates/prompts/. Implemented as stubs in Phase 1, full implementation
 # in Phase 2.
 
+# Set when generate_prompts_for_platform() has also generated the tenet rules
+TENET_PROMPTS_GENERATED=false
+
 # Main dispatcher function for platform-specific prompt generation
 generate_prompts_for_platform() {
   local platform="$1"
   local base_dir="${2:-.}"
+  local engine="$base_dir/templates/scripts/vibesafe_prompts.py"
   
   debug "Generating prompts for platform: $platform"
   
+  # Preferred: one Python pass reads the prompts and tenets once for all
+  # platforms and only rewrites files whose content changed
+  case "$platform" in
+    cursor|copilot|claude|codex|all)
+      if [ -f "$engine" ] && command_exists python3; then
+        local tenet_args=()
+        if [ "$platform" = "cursor" ] || [ "$platform" = "all" ]; then
+          if [ -f "tenets/combine_tenets.py" ]; then
+            cleanup_spurious_cursor_rules
+            tenet_args=(--tenets-dir tenets)
+          fi
+        fi
+        local status=0
+        python3 "$engine" --prompts-dir "$base_dir/templates/prompts" --platform "$platform" "${tenet_args[@]}" || status=$?
+        if [ $status -eq 0 ]; then
+          if [ ${#tenet_args[@]} -gt 0 ]; then
+            TENET_PROMPTS_GENERATED=true
+          fi
+          return 0
+        fi
+        # 3: the base prompts were generated, only the tenet rules failed
+        if [ $status -eq 3 ]; then
+          return 0
+        fi
+        echo -e "${YELLOW}Warning: Python prompt generation failed, generating with shell fallback${NC}"
+      fi
+      ;;
+  esac
+  
+  # Fallback without Python: one shell function per platform
   case "$platform" in
     cursor)
       generate_cursor_rules "$base_dir"
@@ -972,6 +1126,12 @@ generate_generic_context() {
 generate_tenet_ai_prompts() {
   local platform="${VIBESAFE_PLATFORM:-cursor}"
   
+  # Already done together with the base prompts
+  if [ "$TENET_PROMPTS_GENERATED" = "true" ]; then
+    debug "Tenet AI prompts already generated with the base prompts"
+    return 0
+  fi
+  
   echo "Generating AI prompts from project tenets for platform: $platform..."
   
   # Check if Python 3 is available
@@ -1070,6 +1230,136 @@ add_vibesafe_gitignore() {
   fi
 }
 
+# Function to install system files and scripts from a VibeSafe checkout
+install_from_templates() {
+  local templates_dir="$1"
+  
+  install_system_files "$templates_dir"
+  
+  # Copy user-facing scripts if they exist (system files)
+  if [ -f "$templates_dir/templates/scripts/whats_next.py" ]; then
+    debug "Found What's Next script in templates"
+    install_system_file "$templates_dir/templates/scripts/whats_next.py" "scripts/whats_next.py"
+  fi
+  
+  if [ -f "$templates_dir/templates/scripts/validate_vibesafe_structure.py" ]; then
+    debug "Found validator script in templates"
+    install_system_file "$templates_dir/templates/scripts/validate_vibesafe_structure.py" "scripts/validate_vibesafe_structure.py"
+  fi
+  
+  # Shared helper modules imported by the scripts above
+  for helper in "$templates_dir"/templates/scripts/vibesafe_*.py; do
+    [ -f "$helper" ] && install_system_file "$helper" "scripts/$(basename "$helper")"
+  done
+  
+  # Copy installation script (system file)
+  if [ -f "$templates_dir/install-whats-next.sh" ]; then
+    install_system_file "$templates_dir/install-whats-next.sh" "install-whats-next.sh"
+  fi
+}
+
+# Function to clone VibeSafe (VIBESAFE_REF, or the default branch) into a directory
+clone_vibesafe() {
+  local dest="$1"
+  local url="$VIBESAFE_REPO_URL"
+  
+  # A plain local path would ignore --depth; file:// makes it a shallow clone too
+  if [ -d "$url" ]; then
+    url="file://$(cd "$url" && pwd)"
+  fi
+  
+  if [ -n "$VIBESAFE_REF" ]; then
+    git clone --quiet --depth 1 --branch "$VIBESAFE_REF" "$url" "$dest"
+  else
+    git clone --quiet --depth 1 "$url" "$dest"
+  fi
+}
+
+# Function to print the command that computes SHA-256 checksums
+sha256_command() {
+  if command_exists sha256sum; then
+    echo "sha256sum"
+  elif command_exists shasum; then
+    echo "shasum -a 256"
+  else
+    return 1
+  fi
+}
+
+# Function to check a cached bundle against its content manifest
+verify_template_bundle() {
+  local bundle_dir="$1"
+  local hash_cmd
+  
+  [ -s "$bundle_dir/MANIFEST" ] && [ -d "$bundle_dir/tree" ] || return 1
+  [ "$(cat "$bundle_dir/SOURCE" 2>/dev/null)" = "$VIBESAFE_REPO_URL" ] || return 1
+  hash_cmd=$(sha256_command) || return 1
+  
+  (cd "$bundle_dir/tree" && $hash_cmd -c --status ../MANIFEST) 2>/dev/null
+}
+
+# Function to fetch VibeSafe into the cache as a bundle:
+#   tree/     the repository files (without .git)
+#   MANIFEST  SHA-256 of every file in tree/
+#   VERSION   commit the bundle was made from
+#   SOURCE    repository it was fetched from
+fetch_template_bundle() {
+  local bundle_dir="$1"
+  local staging hash_cmd
+  
+  mkdir -p "$VIBESAFE_CACHE_DIR" || return 1
+  staging=$(mktemp -d "$VIBESAFE_CACHE_DIR/.fetch.XXXXXX") || return 1
+  
+  echo "Fetching VibeSafe templates from $VIBESAFE_REPO_URL..."
+  if ! clone_vibesafe "$staging/bundle/tree"; then
+    rm -rf "$staging"
+    return 1
+  fi
+  
+  git -C "$staging/bundle/tree" rev-parse HEAD > "$staging/bundle/VERSION"
+  if hash_cmd=$(sha256_command); then
+    (cd "$staging/bundle/tree" && git ls-files -z | xargs -0 $hash_cmd) > "$staging/bundle/MANIFEST"
+  else
+    # Without a manifest the bundle never verifies, so every install fetches
+    debug "Neither sha256sum nor shasum found; the bundle cannot be verified"
+  fi
+  printf '%s\n' "$VIBESAFE_REPO_URL" > "$staging/bundle/SOURCE"
+  rm -rf "$staging/bundle/tree/.git"
+  
+  # Swap the new bundle in; an install reading the old one keeps its files
+  if [ -d "$bundle_dir" ]; then
+    mv "$bundle_dir" "$staging/old" 2>/dev/null || true
+  fi
+  mv "$staging/bundle" "$bundle_dir" 2>/dev/null
+  rm -rf "$staging"
+  [ -d "$bundle_dir/tree" ]
+}
+
+# Function to find the VibeSafe templates in the cache, fetching them if needed.
+# Sets TEMPLATE_BUNDLE_DIR to the bundle's tree.
+get_template_bundle() {
+  local bundle_dir="$VIBESAFE_CACHE_DIR/$(printf '%s' "${VIBESAFE_REF:-HEAD}" | tr '/' '_')"
+  
+  if [ "$VIBESAFE_REFRESH" != "true" ] && verify_template_bundle "$bundle_dir"; then
+    echo "Using cached VibeSafe templates ($(cut -c1-12 "$bundle_dir/VERSION"), $bundle_dir)"
+    TEMPLATE_BUNDLE_DIR="$bundle_dir/tree"
+    return 0
+  fi
+  
+  if [ "$VIBESAFE_OFFLINE" = "true" ]; then
+    echo -e "${YELLOW}Warning: No verified VibeSafe templates cached in $bundle_dir (offline mode)${NC}"
+    return 1
+  fi
+  
+  if [ -d "$bundle_dir" ] && [ "$VIBESAFE_REFRESH" != "true" ]; then
+    debug "Cached bundle failed verification, fetching again"
+  fi
+  fetch_template_bundle "$bundle_dir" || return 1
+  debug "Cached VibeSafe $(cat "$bundle_dir/VERSION") in $bundle_dir"
+  TEMPLATE_BUNDLE_DIR="$bundle_dir/tree"
+  return 0
+}
+
 # Main installation function implementing Clean Installation Philosophy
 install_vibesafe() {
   print_banner
@@ -1087,59 +1377,50 @@ install_vibesafe() {
   # Determine source of templates
   if [ -n "$VIBESAFE_TEMPLATES_DIR" ]; then
     debug "Using provided templates directory: $VIBESAFE_TEMPLATES_DIR"
-    install_system_files "$VIBESAFE_TEMPLATES_DIR"
-    
-    # Copy user-facing scripts if they exist (system files)
-    mkdir -p scripts
-    if [ -f "$VIBESAFE_TEMPLATES_DIR/templates/scripts/whats_next.py" ]; then
-      debug "Found What's Next script in templates"
-      cp "$VIBESAFE_TEMPLATES_DIR/templates/scripts/whats_next.py" "scripts/whats_next.py"
-    fi
-    
-    if [ -f "$VIBESAFE_TEMPLATES_DIR/templates/scripts/validate_vibesafe_structure.py" ]; then
-      debug "Found validator script in templates"
-      cp "$VIBESAFE_TEMPLATES_DIR/templates/scripts/validate_vibesafe_structure.py" "scripts/validate_vibesafe_structure.py"
-    fi
-    
-    # Copy installation script (system file)
-    if [ -f "$VIBESAFE_TEMPLATES_DIR/install-whats-next.sh" ]; then
-      cp "$VIBESAFE_TEMPLATES_DIR/install-whats-next.sh" "install-whats-next.sh"
-    fi
+    install_from_templates "$VIBESAFE_TEMPLATES_DIR"
   elif [ "$VIBESAFE_SKIP_CLONE" = "true" ]; then
     debug "Skipping repository clone, using minimal system files"
     install_minimal_system_files
-  else
-    # Clone the repository
+  elif [ "$VIBESAFE_NO_BUNDLE_CACHE" = "true" ]; then
+    # Clone the repository for this install only
     temp_dir=$(mktemp -d)
     debug "Created temporary directory: $temp_dir"
     echo "Cloning VibeSafe repository..."
     
-    if git clone --quiet "$VIBESAFE_REPO_URL" "$temp_dir"; then
+    if clone_vibesafe "$temp_dir"; then
       debug "Successfully cloned repository from $VIBESAFE_REPO_URL"
-      install_system_files "$temp_dir"
-      
-      # Copy user-facing scripts if they exist (system files)
-      mkdir -p scripts
-      if [ -f "$temp_dir/templates/scripts/whats_next.py" ]; then
-        debug "Found What's Next script in templates"
-        cp "$temp_dir/templates/scripts/whats_next.py" "scripts/whats_next.py"
-      fi
-      
-      if [ -f "$temp_dir/templates/scripts/validate_vibesafe_structure.py" ]; then
-        debug "Found validator script in templates"
-        cp "$temp_dir/templates/scripts/validate_vibesafe_structure.py" "scripts/validate_vibesafe_structure.py"
-      fi
-      
-      # Copy installation script (system file)
-      if [ -f "$temp_dir/install-whats-next.sh" ]; then
-        cp "$temp_dir/install-whats-next.sh" "install-whats-next.sh"
-      fi
+      install_from_templates "$temp_dir"
     else
       debug "Failed to clone repository, using minimal system files"
       echo "Warning: Failed to clone repository, using minimal templates instead."
       install_minimal_system_files
     fi
+  elif get_template_bundle; then
+    install_from_templates "$TEMPLATE_BUNDLE_DIR"
+  else
+    debug "No template bundle available, using minimal system files"
+    echo "Warning: VibeSafe templates are not available, using minimal templates instead."
+    install_minimal_system_files
+  fi
+  
+  # DRY RUN: Report what the install would change, and stop
+  if [ "$VIBESAFE_DRY_RUN" = "true" ]; then
+    echo ""
+    echo "Install plan (dry run, nothing was changed):"
+    print_install_plan
+    [ -n "$temp_dir" ] && rm -rf "$temp_dir"
+    return 0
+  fi
+  
+  # Record what was installed, so the next install can tell local edits apart
+  write_install_manifest
+  local modified_files
+  modified_files=$(install_plan_files locally-modified)
+  if [ -n "$modified_files" ]; then
+    echo -e "${YELLOW}Overwrote locally modified system files:${NC}"
+    echo "$modified_files" | sed 's/^/  /'
   fi
+  debug "System files: $(install_plan_files added | grep -c .) added, $(install_plan_files updated | grep -c .) updated, $(install_plan_files unchanged | grep -c .) unchanged"
   
   # ALWAYS PRESERVE: User content
   preserve_project_readme
@@ -13,6 +13,8 @@ setup_file() {
   cd "$VIBESAFE_SHARED_CLONE"
   git clone --quiet https://github.com/lawrennd/vibesafe.git vibesafe-test-clone
   export VIBESAFE_TEST_TEMPLATES="$VIBESAFE_SHARED_CLONE/vibesafe-test-clone"
+  # Keep the template bundle cache out of the user's home directory
+  export VIBESAFE_CACHE_DIR="$VIBESAFE_SHARED_CLONE/cache"
   cd "$current_dir"
 }
 
@@ -241,6 +243,27 @@ teardown() {
   [[ "$output" == *"orphaned"* ]] || [[ "$output" == *".venv"* ]]
 }
 
+@test "VENV: Dependencies are only installed when the venv stamp changes" {
+  export VIBESAFE_TEMPLATES_DIR="$ORIGINAL_DIR"
+  export VIBESAFE_SKIP_VALIDATION=true
+  bash "$INSTALL_SCRIPT"
+  [ -f ".venv-vibesafe/.vibesafe-stamp" ]
+  grep -q "^python " ".venv-vibesafe/.vibesafe-stamp"
+  
+  # Up to date: pip is not run again
+  run bash "$INSTALL_SCRIPT"
+  [ "$status" -eq 0 ]
+  [[ "$output" == *"Dependencies are up to date"* ]]
+  [[ "$output" != *"Installing dependencies"* ]]
+  
+  # A stale stamp installs again and records the new one
+  echo "deps outdated" > ".venv-vibesafe/.vibesafe-stamp"
+  run bash "$INSTALL_SCRIPT"
+  [ "$status" -eq 0 ]
+  [[ "$output" == *"Installing dependencies"* ]]
+  ! grep -q "outdated" ".venv-vibesafe/.vibesafe-stamp"
+}
+
 @test "OVERWRITE: System files are always updated on reinstall" {
   # Run initial installation
   VIBESAFE_SKIP_CLONE=true bash "$INSTALL_SCRIPT"
@@ -283,6 +306,37 @@ teardown() {
   ! grep -q "Old CIP Template" "cip/cip_template.md"
 }
 
+@test "MANIFEST: Reinstall only rewrites system files whose content changed" {
+  export VIBESAFE_SKIP_CLONE=true
+  bash "$INSTALL_SCRIPT"
+  [ -f ".vibesafe/manifest" ]
+  grep -q "  backlog/README.md$" ".vibesafe/manifest"
+  
+  touch -t 202001010000 "backlog/task_template.md"
+  bash "$INSTALL_SCRIPT"
+  
+  # Unchanged file keeps its mtime
+  [ -z "$(find backlog/task_template.md -newermt 2020-01-02)" ]
+}
+
+@test "MANIFEST: Dry run lists the plan without changing files" {
+  export VIBESAFE_SKIP_CLONE=true
+  bash "$INSTALL_SCRIPT"
+  echo "Local note" >> "cip/README.md"
+  rm "tenets/README.md"
+  
+  run env VIBESAFE_DRY_RUN=true bash "$INSTALL_SCRIPT"
+  [ "$status" -eq 0 ]
+  [[ "$output" == *"Install plan (dry run, nothing was changed)"* ]]
+  [[ "$output" == *"added: 1"* ]]
+  [[ "$output" == *"locally-modified: 1"* ]]
+  [[ "$output" == *"unchanged: 5"* ]]
+  
+  # Nothing was written
+  grep -q "Local note" "cip/README.md"
+  [ ! -f "tenets/README.md" ]
+}
+
 @test "Installation works with custom templates directory" {
   # Create directory structure for custom templates
   mkdir -p "$TEST_DIR/custom_templates"
@@ -592,6 +646,50 @@ EOF
   grep -q "^templates/$" .gitignore
 }
 
+@test "CACHE: Second install uses the cached templates, even offline" {
+  export VIBESAFE_CACHE_DIR="$(mktemp -d)"
+  export VIBESAFE_REPO_URL="$VIBESAFE_TEST_TEMPLATES"
+  export VIBESAFE_INSTALL_WHATS_NEXT=false
+  export VIBESAFE_SKIP_VALIDATION=true
+  
+  run bash "$INSTALL_SCRIPT"
+  [ "$status" -eq 0 ]
+  [[ "$output" == *"Fetching VibeSafe templates"* ]]
+  [ -s "$VIBESAFE_CACHE_DIR/HEAD/MANIFEST" ]
+  [ ! -d "$VIBESAFE_CACHE_DIR/HEAD/tree/.git" ]
+  
+  run env VIBESAFE_OFFLINE=true bash "$INSTALL_SCRIPT"
+  [ "$status" -eq 0 ]
+  [[ "$output" == *"Using cached VibeSafe templates"* ]]
+  [[ "$output" != *"Fetching VibeSafe templates"* ]]
+  [ -f "backlog/task_template.md" ]
+  [ -f "scripts/whats_next.py" ]
+  
+  rm -rf "$VIBESAFE_CACHE_DIR"
+}
+
+@test "CACHE: Modified cached templates are fetched again" {
+  export VIBESAFE_CACHE_DIR="$(mktemp -d)"
+  export VIBESAFE_REPO_URL="$VIBESAFE_TEST_TEMPLATES"
+  export VIBESAFE_INSTALL_WHATS_NEXT=false
+  export VIBESAFE_SKIP_VALIDATION=true
+  
+  bash "$INSTALL_SCRIPT"
+  echo "# Tampered" > "$VIBESAFE_CACHE_DIR/HEAD/tree/templates/backlog/task_template.md"
+  
+  # Offline, the bundle fails verification and is not used
+  run env VIBESAFE_OFFLINE=true bash "$INSTALL_SCRIPT"
+  [ "$status" -eq 0 ]
+  [[ "$output" == *"No verified VibeSafe templates cached"* ]]
+  
+  run bash "$INSTALL_SCRIPT"
+  [ "$status" -eq 0 ]
+  [[ "$output" == *"Fetching VibeSafe templates"* ]]
+  ! grep -q "Tampered" "backlog/task_template.md"
+  
+  rm -rf "$VIBESAFE_CACHE_DIR"
+}
+
 # ==============================================================================
 # CIP-0012: AI Assistant Framework Independence Tests
 # ==============================================================================
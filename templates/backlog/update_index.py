@@ -4,10 +4,19 @@ Update the backlog index.md file based on the current task files.
 
 This script scans all task files in the backlog directory structure,
 extracts their metadata, and generates an updated index.md file.
+
+Task metadata comes from the shared frontmatter cache, so only changed task
+files are re-read. index.md is only written when its content changes, so an
+unchanged backlog leaves the file (and its mtime) alone for editors, file
+watchers and git.
+
+whats_next.py imports this script and calls update_index() in-process with
+the task files it has already found, instead of running it with python3.
 """
 
 import os
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
 
@@ -15,6 +24,44 @@ from pathlib import Path
 CATEGORIES = ['documentation', 'infrastructure', 'features', 'bugs']
 STATUSES = ['proposed', 'ready', 'in_progress', 'completed', 'abandoned', 'superseded']
 
+# Persistent frontmatter cache (.vibesafe/cache), activated by update_index()
+_frontmatter_cache = None
+
+# Version of the update_index() API. 2: update_index(task_files,
+# frontmatter_cache, quiet) returns whether it wrote the index, which lets
+# whats_next.py run it in-process on the task files it already found.
+UPDATE_INDEX_API = 2
+
+# Set by update_index(quiet=True) to keep progress messages off stdout
+_quiet = False
+
+# Lines of each index section as last rendered, with the task fields they
+# were rendered from. whats_next.py keeps this module loaded until the script
+# changes, so the daemon and watch mode only sort and re-render the sections
+# whose tasks changed.
+_rendered_sections = {}
+
+def open_frontmatter_cache(project_root):
+    """Open the shared frontmatter cache from the project's scripts/ helpers.
+    
+    Returns None if the helpers are not installed or the cache is disabled.
+    """
+    scripts_dir = str(Path(project_root) / 'scripts')
+    if not os.path.exists(os.path.join(scripts_dir, 'vibesafe_frontmatter.py')):
+        return None
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    try:
+        import vibesafe_frontmatter
+    except ImportError:
+        return None
+    return vibesafe_frontmatter.open_cache(str(project_root))
+
+def log(message):
+    """Print a progress message unless update_index() was asked to be quiet."""
+    if not _quiet:
+        print(message)
+
 def normalize_status(status):
     """Normalize status values to lowercase with underscores."""
     if not status:
@@ -31,6 +78,83 @@ def normalize_status(status):
     
     return normalized
 
+def _parse_task_fields(content, default_id):
+    """Parse task fields from file content (YAML frontmatter, then legacy format)."""
+    metadata = {
+        'id': default_id,
+        'title': None,
+        'status': None,
+        'priority': None,
+        'created': None,
+        'updated': None,
+    }
+    
+    # Try to extract YAML frontmatter first
+    yaml_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
+    if yaml_match:
+        yaml_content = yaml_match.group(1)
+
+        # Extract metadata from YAML
+        id_match = re.search(r'^id:\s*["\']?([^"\'\n]+)["\']?', yaml_content, re.MULTILINE)
+        if id_match:
+            metadata['id'] = id_match.group(1).strip()
+
+        title_match = re.search(r'^title:\s*["\']?([^"\'\n]+)["\']?', yaml_content, re.MULTILINE)
+        if title_match:
+            metadata['title'] = title_match.group(1).strip()
+
+        status_match = re.search(r'^status:\s*["\']?([^"\'\n]+)["\']?', yaml_content, re.MULTILINE)
+        if status_match:
+            raw_status = status_match.group(1).strip()
+            metadata['status'] = normalize_status(raw_status)
+
+        priority_match = re.search(r'^priority:\s*["\']?([^"\'\n]+)["\']?', yaml_content, re.MULTILINE)
+        if priority_match:
+            metadata['priority'] = priority_match.group(1).strip()
+
+        created_match = re.search(r'^created:\s*["\']?([^"\'\n]+)["\']?', yaml_content, re.MULTILINE)
+        if created_match:
+            metadata['created'] = created_match.group(1).strip()
+
+        # Handle both 'updated' and 'last_updated' field names
+        updated_match = re.search(r'^(?:updated|last_updated):\s*["\']?([^"\'\n]+)["\']?', yaml_content, re.MULTILINE)
+        if updated_match:
+            metadata['updated'] = updated_match.group(1).strip()
+
+    # Fall back to traditional format if YAML didn't provide all needed fields
+    if not metadata['title']:
+        title_match = re.search(r'# Task: (.*)', content)
+        if title_match:
+            metadata['title'] = title_match.group(1)
+
+    if not metadata['id']:
+        id_match = re.search(r'\*\*ID\*\*: (.*)', content)
+        if id_match:
+            metadata['id'] = id_match.group(1).strip()
+
+    if not metadata['status']:
+        status_match = re.search(r'\*\*Status\*\*: (.*)', content)
+        if status_match:
+            raw_status = status_match.group(1).strip()
+            metadata['status'] = normalize_status(raw_status)
+
+    if not metadata['priority']:
+        priority_match = re.search(r'\*\*Priority\*\*: (.*)', content)
+        if priority_match:
+            metadata['priority'] = priority_match.group(1).strip()
+
+    if not metadata['created']:
+        created_match = re.search(r'\*\*Created\*\*: (.*)', content)
+        if created_match:
+            metadata['created'] = created_match.group(1).strip()
+
+    if not metadata['updated']:
+        updated_match = re.search(r'\*\*Last Updated\*\*: (.*)', content)
+        if updated_match:
+            metadata['updated'] = updated_match.group(1).strip()
+    
+    return metadata
+
 def extract_task_metadata(filepath):
     """Extract metadata from a task file."""
     # Extract category from filepath
@@ -67,97 +191,63 @@ def extract_task_metadata(filepath):
     }
     
     try:
-        with open(filepath, 'r') as f:
-            content = f.read()
-            
-            # Try to extract YAML frontmatter first
-            yaml_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-            if yaml_match:
-                yaml_content = yaml_match.group(1)
-                
-                # Extract metadata from YAML
-                id_match = re.search(r'^id:\s*["\']?([^"\'\n]+)["\']?', yaml_content, re.MULTILINE)
-                if id_match:
-                    metadata['id'] = id_match.group(1).strip()
-                
-                title_match = re.search(r'^title:\s*["\']?([^"\'\n]+)["\']?', yaml_content, re.MULTILINE)
-                if title_match:
-                    metadata['title'] = title_match.group(1).strip()
-                
-                status_match = re.search(r'^status:\s*["\']?([^"\'\n]+)["\']?', yaml_content, re.MULTILINE)
-                if status_match:
-                    raw_status = status_match.group(1).strip()
-                    metadata['status'] = normalize_status(raw_status)
-                
-                priority_match = re.search(r'^priority:\s*["\']?([^"\'\n]+)["\']?', yaml_content, re.MULTILINE)
-                if priority_match:
-                    metadata['priority'] = priority_match.group(1).strip()
-                
-                created_match = re.search(r'^created:\s*["\']?([^"\'\n]+)["\']?', yaml_content, re.MULTILINE)
-                if created_match:
-                    metadata['created'] = created_match.group(1).strip()
-                
-                # Handle both 'updated' and 'last_updated' field names
-                updated_match = re.search(r'^(?:updated|last_updated):\s*["\']?([^"\'\n]+)["\']?', yaml_content, re.MULTILINE)
-                if updated_match:
-                    metadata['updated'] = updated_match.group(1).strip()
-            
-            # Fall back to traditional format if YAML didn't provide all needed fields
-            if not metadata['title']:
-                title_match = re.search(r'# Task: (.*)', content)
-                if title_match:
-                    metadata['title'] = title_match.group(1)
-            
-            if not metadata['id']:
-                id_match = re.search(r'\*\*ID\*\*: (.*)', content)
-                if id_match:
-                    metadata['id'] = id_match.group(1).strip()
-            
-            if not metadata['status']:
-                status_match = re.search(r'\*\*Status\*\*: (.*)', content)
-                if status_match:
-                    raw_status = status_match.group(1).strip()
-                    metadata['status'] = normalize_status(raw_status)
-            
-            if not metadata['priority']:
-                priority_match = re.search(r'\*\*Priority\*\*: (.*)', content)
-                if priority_match:
-                    metadata['priority'] = priority_match.group(1).strip()
-            
-            if not metadata['created']:
-                created_match = re.search(r'\*\*Created\*\*: (.*)', content)
-                if created_match:
-                    metadata['created'] = created_match.group(1).strip()
-            
-            if not metadata['updated']:
-                updated_match = re.search(r'\*\*Last Updated\*\*: (.*)', content)
-                if updated_match:
-                    metadata['updated'] = updated_match.group(1).strip()
-                
+        if _frontmatter_cache is not None:
+            fields = _frontmatter_cache.lookup(
+                filepath, 'update_index',
+                lambda content: _parse_task_fields(content, id_from_filename))
+        else:
+            with open(filepath, 'r') as f:
+                fields = _parse_task_fields(f.read(), id_from_filename)
+        metadata.update(fields)
         return metadata
     except Exception as e:
-        print(f"Error processing {filepath}: {str(e)}")
+        log(f"Error processing {filepath}: {str(e)}")
         return None
 
+def is_task_file(filename):
+    """Whether a .md file in a category directory is a task file.
+    
+    README and index files are skipped, but all task files are included
+    regardless of naming convention.
+    """
+    return filename != 'README.md' and filename != 'index.md' and not filename.startswith('_')
+
 def find_all_task_files():
     """Find all task files in the backlog directory."""
     backlog_dir = Path(__file__).parent
     task_files = []
     
-    print(f"Searching for task files in {backlog_dir}")
+    log(f"Searching for task files in {backlog_dir}")
     
     for category in CATEGORIES:
         category_dir = backlog_dir / category
         if category_dir.exists():
-            print(f"Checking category directory: {category_dir}")
-            for file in category_dir.glob('*.md'):
-                # Skip README and index files, but include all task files regardless of naming convention
-                if file.name != 'README.md' and file.name != 'index.md' and not file.name.startswith('_'):
-                    print(f"Found task file: {file}")
+            log(f"Checking category directory: {category_dir}")
+            # In name order, so tasks with the same date keep their place in the index
+            for file in sorted(category_dir.glob('*.md')):
+                if is_task_file(file.name):
+                    log(f"Found task file: {file}")
                     task_files.append(file)
     
     return task_files
 
+def _section_lines(section, tasks, sort_field, limit=None):
+    """Return the index lines linking tasks, newest sort_field first.
+    
+    The lines are cached under section and reused while the tasks' paths,
+    titles and sort_field values stay the same.
+    """
+    backlog_dir = Path(__file__).parent
+    inputs = tuple((str(task['filepath']), task['title'], task.get(sort_field) or '') for task in tasks)
+    cached = _rendered_sections.get((str(backlog_dir), section))
+    if cached is not None and cached[0] == inputs:
+        return cached[1]
+    
+    ordered = sorted(tasks, key=lambda task: task.get(sort_field) or '', reverse=True)[:limit]
+    lines = [f"- [{task['title']}]({os.path.relpath(task['filepath'], backlog_dir)})\n" for task in ordered]
+    _rendered_sections[(str(backlog_dir), section)] = (inputs, lines)
+    return lines
+
 def generate_index_content(tasks):
     """Generate the content for the index.md file."""
     content = []
@@ -173,7 +263,7 @@ def generate_index_content(tasks):
     
     for task in tasks:
         if task is None or 'category' not in task or task['category'] is None or 'status' not in task or task['status'] is None:
-            print(f"Skipping invalid task: {task}")
+            log(f"Skipping invalid task: {task}")
             continue
         
         category = task['category']
@@ -182,7 +272,7 @@ def generate_index_content(tasks):
         if category in categorized_tasks and status in categorized_tasks[category]:
             categorized_tasks[category][status].append(task)
         else:
-            print(f"Skipping task with invalid category or status: {category}, {status}")
+            log(f"Skipping task with invalid category or status: {category}, {status}")
     
     # Generate the main section of the index
     for category in CATEGORIES:
@@ -196,12 +286,7 @@ def generate_index_content(tasks):
             tasks_with_status = categorized_tasks[category][status]
             if tasks_with_status:
                 # Sort by created date
-                def sort_key(task):
-                    return task.get('created', '')
-                
-                for task in sorted(tasks_with_status, key=sort_key, reverse=True):
-                    relative_path = os.path.relpath(task['filepath'], Path(__file__).parent)
-                    content.append(f"- [{task['title']}]({relative_path})\n")
+                content.extend(_section_lines(f"{category}/{status}", tasks_with_status, 'created'))
             else:
                 content.append(f"*No tasks currently {status.lower()}.*\n")
             
@@ -217,12 +302,8 @@ def generate_index_content(tasks):
             completed_tasks.extend(categorized_tasks[category]['completed'])
     
     if completed_tasks:
-        def sort_key(task):
-            return task.get('updated', '')
-        
-        for task in sorted(completed_tasks, key=sort_key, reverse=True)[:5]:  # Show only recent 5
-            relative_path = os.path.relpath(task['filepath'], Path(__file__).parent)
-            content.append(f"- [{task['title']}]({relative_path})\n")
+        # Show only recent 5
+        content.extend(_section_lines("completed", completed_tasks, 'updated', limit=5))
     else:
         content.append("*No tasks recently completed.*\n")
     
@@ -234,36 +315,71 @@ def generate_index_content(tasks):
             abandoned_tasks.extend(categorized_tasks[category]['abandoned'])
     
     if abandoned_tasks:
-        def sort_key(task):
-            return task.get('updated', '')
-        
-        for task in sorted(abandoned_tasks, key=sort_key, reverse=True)[:5]:  # Show only recent 5
-            relative_path = os.path.relpath(task['filepath'], Path(__file__).parent)
-            content.append(f"- [{task['title']}]({relative_path})\n")
+        # Show only recent 5
+        content.extend(_section_lines("abandoned", abandoned_tasks, 'updated', limit=5))
     else:
         content.append("*No tasks recently abandoned.*\n")
     
     return "\n".join(content)
 
-def update_index():
-    """Update the index.md file with current backlog items."""
-    backlog_dir = Path(__file__).parent
-    index_file = backlog_dir / "index.md"
-    
-    # Find all task files
-    task_files = find_all_task_files()
-    
-    # Extract metadata from each task file
-    tasks = [extract_task_metadata(file) for file in task_files]
-    
-    # Generate the index content
-    content = generate_index_content(tasks)
+def _has_content(path, data):
+    """Return True if the file at path holds exactly data."""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+def update_index(task_files=None, frontmatter_cache=None, quiet=False):
+    """Update the index.md file with current backlog items.
     
-    # Write the index file
-    with open(index_file, 'w') as f:
-        f.write(content)
+    Args:
+        task_files: Paths of the task files, if the caller has already found
+            them (find_all_task_files() otherwise)
+        frontmatter_cache: Open frontmatter cache to use; the caller saves it.
+            The project's own cache is opened and saved if omitted
+        quiet: Don't print progress messages
     
-    print(f"Updated {index_file} with {len(task_files)} tasks.")
+    Returns:
+        True if index.md was written, False if it was already up to date.
+    """
+    global _frontmatter_cache, _quiet
+    backlog_dir = Path(__file__).parent
+    index_file = backlog_dir / "index.md"
+    _quiet = quiet
+    try:
+        # Find all task files
+        if task_files is None:
+            task_files = find_all_task_files()
+        
+        # Extract metadata from each task file (unchanged files come from the cache)
+        if frontmatter_cache is not None:
+            _frontmatter_cache = frontmatter_cache
+        else:
+            _frontmatter_cache = open_frontmatter_cache(backlog_dir.parent)
+        try:
+            tasks = [extract_task_metadata(file) for file in task_files]
+            if _frontmatter_cache is not None and frontmatter_cache is None:
+                _frontmatter_cache.save()
+        finally:
+            _frontmatter_cache = None
+        
+        # Generate the index content
+        content = generate_index_content(tasks)
+        
+        # Write the index file, unless it already has exactly this content
+        data = content.encode('utf-8')
+        if _has_content(index_file, data):
+            log(f"{index_file} is up to date with {len(task_files)} tasks.")
+            return False
+        with open(index_file, 'wb') as f:
+            f.write(data)
+        
+        log(f"Updated {index_file} with {len(task_files)} tasks.")
+        return True
+    finally:
+        _quiet = False
 
 if __name__ == "__main__":
     update_index() 
\ No newline at end of file
@@ -17,19 +17,46 @@ Implementation: CIP-0011 Phase 0a
 
 import os
 import sys
+
+# Shared VibeSafe helpers are installed alongside this script
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
+
+if __name__ == '__main__':
+    # With VIBESAFE_DAEMON=1 a warm daemon answers, before the imports below are paid for
+    import vibesafe_daemon
+    vibesafe_daemon.forward('validate')
+
+# Modules only some code paths need (json, shutil, tempfile, datetime and
+# python-frontmatter, which is only used to write fixes) are imported where
+# they are used, keeping --help fast; see tests/test_startup_time.py.
 import re
+import copy
 import argparse
-from pathlib import Path
-from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
+
+import vibesafe_frontmatter
+import vibesafe_git
+import vibesafe_timings
+from vibesafe_frontmatter import parse_yaml_header, read_header
+from vibesafe_project import ProjectModel, scan_project
+from vibesafe_timings import count, count_read, phase
+
+# Persistent frontmatter cache (.vibesafe/cache), activated by main()
+_frontmatter_cache = None
+
+# Project model for the current validate() run, used by find_component_files()
+_project = None
 
-try:
-    import frontmatter
-    FRONTMATTER_AVAILABLE = True
-except ImportError:
-    FRONTMATTER_AVAILABLE = False
-    print("Error: python-frontmatter not available. Install with: pip install python-frontmatter")
-    sys.exit(1)
+# Pending frontmatter writes of the current validate() run (see FrontmatterWriteBatch)
+_write_batch = None
+
+# Component index of the current validate() run, used by extract_frontmatter()
+_index = None
+
+# Process pools only pay off once there are enough files to share out
+_PARALLEL_MIN_FILES = 256
 
 
 # ANSI color codes
@@ -92,7 +119,7 @@ def validate_human_attribution(component_type, file_path, field_name, value, res
     non-human/tool attributions.
     """
     if not isinstance(value, str):
-        result.add_error(f"Invalid '{field_name}': expected string, got {type(value).__name__}", file_path)
+        result.add_error(f"Invalid '{field_name}': expected string, got {type(value).__name__}", file_path, rule='human-attribution')
         return
 
     raw = value
@@ -100,16 +127,16 @@ def validate_human_attribution(component_type, file_path, field_name, value, res
     v_lower = v.lower()
 
     if v_lower in _ATTRIBUTION_DISALLOWED_EXACT:
-        result.add_error(f"Invalid '{field_name}': must be a human name (got '{raw}')", file_path)
+        result.add_error(f"Invalid '{field_name}': must be a human name (got '{raw}')", file_path, rule='human-attribution')
         return
 
     if _ATTRIBUTION_BRACKET_PLACEHOLDER_RE.match(v):
-        result.add_error(f"Invalid '{field_name}': placeholder value '{raw}'", file_path)
+        result.add_error(f"Invalid '{field_name}': placeholder value '{raw}'", file_path, rule='human-attribution')
         return
 
     for s in _ATTRIBUTION_DISALLOWED_SUBSTRINGS:
         if s in v_lower:
-            result.add_error(f"Invalid '{field_name}': placeholder value '{raw}'", file_path)
+            result.add_error(f"Invalid '{field_name}': placeholder value '{raw}'", file_path, rule='human-attribution')
             return
 
     # Single-threaded ownership: one primary accountable human per artifact
@@ -117,56 +144,123 @@ def validate_human_attribution(component_type, file_path, field_name, value, res
         result.add_error(
             f"Invalid '{field_name}': must name a single primary accountable human (got '{raw}')",
             file_path,
+            rule='human-attribution',
         )
         return
 
 
 def _get_git_changed_paths(root_dir: str) -> Optional[List[str]]:
-    """Return a list of changed file paths from `git status --porcelain`, or None if not a git repo."""
+    """Return the changed and untracked file paths git reports, or None if not a git repo.
+
+    Paths are relative to root_dir; wholly untracked directories are one entry.
+    """
+    state = vibesafe_git.read_git_state(root_dir)
+    if state is None:
+        return None
+    return state.changed_paths()
+
+
+def _get_git_changes(root_dir: str, since: str = 'HEAD') -> Optional[List[Tuple[str, Optional[str], Optional[str]]]]:
+    """Return files changed since a revision as (status, old_path, new_path) tuples.
+
+    Paths are relative to root_dir. Status is 'A', 'M', 'D' or 'R'; old_path is
+    None for added files and new_path is None for deleted ones. Changes in the
+    index and the working tree both count, and untracked files below
+    vibesafe_git.UNTRACKED_PATHSPECS count as added.
+    Returns None if root_dir is not in a git repository or since is unknown.
+    """
     try:
         import subprocess
 
-        # Are we in a git repo?
-        p = subprocess.run(
-            ['git', '-C', root_dir, 'rev-parse', '--is-inside-work-tree'],
+        count('subprocesses')
+        diff = subprocess.run(
+            ['git', '-C', root_dir, 'diff', '--name-status', '-M', '--relative', '-z', since, '--'],
             capture_output=True,
-            text=True,
             check=False,
         )
-        if p.returncode != 0 or p.stdout.strip() != "true":
+        if diff.returncode != 0:
             return None
 
-        status = subprocess.run(
-            ['git', '-C', root_dir, 'status', '--porcelain'],
+        changes: List[Tuple[str, Optional[str], Optional[str]]] = []
+        fields = diff.stdout.decode('utf-8', 'surrogateescape').split('\0')
+        i = 0
+        while i < len(fields) - 1:
+            status = fields[i][:1]
+            if status in ('R', 'C'):
+                old_path, new_path = fields[i + 1], fields[i + 2]
+                changes.append(('R' if status == 'R' else 'A', old_path if status == 'R' else None, new_path))
+                i += 3
+                continue
+            path = fields[i + 1]
+            if status == 'A':
+                changes.append(('A', None, path))
+            elif status == 'D':
+                changes.append(('D', path, None))
+            else:
+                changes.append(('M', path, path))
+            i += 2
+
+        count('subprocesses')
+        untracked = subprocess.run(
+            ['git', '-C', root_dir, 'ls-files', '--others', '--exclude-standard', '-z', '--',
+             *(f':(literal){path}' for path in vibesafe_git.UNTRACKED_PATHSPECS)],
             capture_output=True,
-            text=True,
             check=False,
         )
-        if status.returncode != 0:
+        if untracked.returncode != 0:
             return None
+        for path in untracked.stdout.decode('utf-8', 'surrogateescape').split('\0'):
+            if path:
+                changes.append(('A', None, path))
+        return changes
+    except Exception:
+        return None
 
-        changed: List[str] = []
-        for line in status.stdout.splitlines():
-            if not line.strip():
+
+def _get_git_old_ids(root_dir: str, since: str, paths: List[str]) -> set:
+    """Return the frontmatter IDs the given files (relative to root_dir) had at a revision."""
+    ids = set()
+    if not paths:
+        return ids
+    try:
+        import subprocess
+
+        count('subprocesses')
+        batch = subprocess.run(
+            ['git', '-C', root_dir, 'cat-file', '--batch'],
+            input=''.join(f"{since}:./{path}\n" for path in paths).encode('utf-8', 'surrogateescape'),
+            capture_output=True,
+            check=False,
+        )
+        out = batch.stdout
+        pos = 0
+        for _path in paths:
+            end = out.index(b'\n', pos)
+            header = out[pos:end].split()
+            pos = end + 1
+            if len(header) != 3:  # "<object> missing"
                 continue
-            # Format: XY <path> (or rename: XY old -> new)
-            path = line[3:].strip()
-            if " -> " in path:
-                path = path.split(" -> ", 1)[1].strip()
-            changed.append(path)
-        return changed
+            size = int(header[2])
+            raw = out[pos:pos + size]
+            pos += size + 1
+            metadata = _parse_frontmatter_metadata(vibesafe_frontmatter.split_header(raw).header)
+            if metadata and 'id' in metadata:
+                ids.add(metadata['id'])
     except Exception:
-        return None
+        pass
+    return ids
 
 
-def check_governance_drift(root_dir: str, result):
+def check_governance_drift(root_dir: str, result, git_state: Optional[vibesafe_git.GitState] = None):
     """
     Warn when implementation/tooling changes occur without updating planning artifacts.
 
     This catches "own goal" process failures like: updating validators/scripts/templates
     without recording intent in CIP/backlog and/or without updating requirements where appropriate.
+
+    git_state is the state of root_dir's work tree if the caller already read it.
     """
-    changed = _get_git_changed_paths(root_dir)
+    changed = git_state.changed_paths() if git_state is not None else _get_git_changed_paths(root_dir)
     if changed is None or len(changed) == 0:
         return
 
@@ -198,6 +292,7 @@ def check_governance_drift(root_dir: str, result):
             "Governance drift: implementation/tooling changed but no CIP/backlog changed. "
             "Consider creating/updating a CIP (HOW) and/or backlog task (DO) to record intent and accountability.",
             os.path.join(root_dir, ".git"),
+            rule='governance-drift',
         )
 
     if has_impl and has_requirements and not has_planning:
@@ -205,6 +300,7 @@ def check_governance_drift(root_dir: str, result):
             "Traceability gap: requirements (WHAT) changed alongside implementation, but no CIP/backlog changed. "
             "This often means we skipped documenting HOW (CIP) or DO (task).",
             os.path.join(root_dir, ".git"),
+            rule='governance-drift',
         )
 
     if has_impl and has_tenets and not (has_requirements or has_planning):
@@ -212,6 +308,7 @@ def check_governance_drift(root_dir: str, result):
             "Tenet→implementation gap: tenets (WHY) and implementation changed, but no requirements/CIPs/backlog were updated. "
             "Consider adding a requirement to encode WHAT the tenet implies, and a CIP/task if behavior changed.",
             os.path.join(root_dir, ".git"),
+            rule='governance-drift',
         )
 
 
@@ -265,25 +362,61 @@ COMPONENT_SPECS = {
 
 
 class ValidationResult:
-    """Track validation results."""
+    """Track validation results.
+    
+    errors, warnings and fixes hold (message, file_path) pairs for the text
+    report. Every entry is also recorded in diagnostics as a dict with
+    severity, rule, file, message and fix keys (see --format json/ndjson), and
+    passed to on_diagnostic as soon as it is added. The file is relative to
+    root_dir (the current directory if not given), so it does not depend on
+    where the validator was started.
+    """
     
-    def __init__(self):
+    def __init__(self, on_diagnostic=None, root_dir=None):
         self.errors = []
         self.warnings = []
         self.info = []
         self.fixes = []  # Track what was fixed
+        self.diagnostics = []
+        self.on_diagnostic = on_diagnostic
+        self.root_dir = root_dir
+    
+    def _record(self, severity, message, file_path, rule, fix):
+        diagnostic = {
+            'severity': severity,
+            'rule': rule,
+            'file': os.path.relpath(file_path, self.root_dir or os.curdir) if file_path else None,
+            'message': message,
+            'fix': fix,
+        }
+        self.diagnostics.append(diagnostic)
+        if self.on_diagnostic is not None:
+            self.on_diagnostic(diagnostic)
     
-    def add_error(self, message, file_path=None):
+    def add_error(self, message, file_path=None, rule=None, fix=None):
         self.errors.append((message, file_path))
+        self._record('error', message, file_path, rule, fix)
     
-    def add_warning(self, message, file_path=None):
+    def add_warning(self, message, file_path=None, rule=None, fix=None):
         self.warnings.append((message, file_path))
+        self._record('warning', message, file_path, rule, fix)
     
     def add_info(self, message):
         self.info.append(message)
     
-    def add_fix(self, message, file_path=None):
+    def add_fix(self, message, file_path=None, rule=None):
         self.fixes.append((message, file_path))
+        self._record('fix', message, file_path, rule, None)
+    
+    def extend(self, other):
+        """Append another result's entries, in order, as if they had been added here."""
+        entries = {'error': iter(other.errors), 'warning': iter(other.warnings), 'fix': iter(other.fixes)}
+        for diagnostic in other.diagnostics:
+            severity = diagnostic['severity']
+            message, file_path = next(entries[severity])
+            getattr(self, f'add_{severity}')(message, file_path, rule=diagnostic['rule'],
+                                             **({} if severity == 'fix' else {'fix': diagnostic['fix']}))
+        self.info.extend(other.info)
     
     def has_errors(self):
         return len(self.errors) > 0
@@ -295,32 +428,216 @@ class ValidationResult:
         return len(self.fixes) > 0
 
 
+def _parse_frontmatter_metadata(header):
+    """Parse a frontmatter header into metadata (None if empty)."""
+    if header is None:
+        return None
+    metadata = parse_yaml_header(header)
+    return metadata if isinstance(metadata, dict) and metadata else None
+
+
 def extract_frontmatter(file_path):
-    """Extract YAML frontmatter from a markdown file using python-frontmatter."""
+    """Extract YAML frontmatter from a markdown file, reading only its header.
+    
+    Edits staged in the current write batch are returned in place of the
+    file's contents, so fixers and validation see the fixed frontmatter.
+    Files in the component index of the current run are not parsed again.
+    """
     try:
-        post = frontmatter.load(file_path)
-        # Return metadata if it exists, None if no frontmatter
-        return post.metadata if post.metadata else None
+        if _write_batch is not None and _write_batch.has(file_path):
+            return _write_batch.staged(file_path)
+        if _index is not None and file_path in _index.metadata:
+            return _index.frontmatter(file_path)
+        if _frontmatter_cache is not None:
+            return _frontmatter_cache.lookup_header(file_path, 'validator', _parse_frontmatter_metadata)
+        return _parse_frontmatter_metadata(read_header(file_path).header)
     except Exception as e:
         return None
 
 
+def _frontmatter_library():
+    """Import python-frontmatter, which is needed to write fixes."""
+    try:
+        import frontmatter
+    except ImportError:
+        print("Error: python-frontmatter not available. Install with: pip install python-frontmatter")
+        sys.exit(1)
+    return frontmatter
+
+
+def _render_frontmatter(file_path, metadata):
+    """Return the file's bytes with its frontmatter replaced by metadata."""
+    frontmatter = _frontmatter_library()
+    count_read(os.path.getsize(file_path))
+    count('yaml_parses')
+    post = frontmatter.load(file_path)
+    post.metadata = metadata
+    return frontmatter.dumps(post).encode('utf-8')
+
+
+def _write_temp(file_path, content):
+    """Write content to a temporary file next to file_path and return its path."""
+    import shutil
+    import tempfile
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_path)),
+                                    prefix='.vibesafe-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        shutil.copymode(file_path, tmp_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return tmp_path
+
+
+class FrontmatterWriteBatch:
+    """Frontmatter edits collected across all fixers of a run.
+    
+    write_frontmatter() stages edits here while a batch is active, so a file
+    touched by several fixes is loaded and written once. commit() writes
+    every temporary file first and only then renames them into place; if any
+    file cannot be rendered, nothing is written.
+    """
+    
+    def __init__(self):
+        self.pending = {}  # absolute path -> metadata to write
+    
+    def stage(self, file_path, metadata):
+        self.pending[os.path.abspath(file_path)] = copy.deepcopy(metadata)
+    
+    def has(self, file_path):
+        return os.path.abspath(file_path) in self.pending
+    
+    def staged(self, file_path):
+        return copy.deepcopy(self.pending[os.path.abspath(file_path)])
+    
+    def commit(self):
+        """Write all staged files. Returns a list of (file_path, error) failures."""
+        prepared = []
+        try:
+            for file_path, metadata in self.pending.items():
+                prepared.append((_write_temp(file_path, _render_frontmatter(file_path, metadata)), file_path))
+        except Exception as e:
+            for tmp_path, _file_path in prepared:
+                os.unlink(tmp_path)
+            return [(file_path, f"{e} (no fixes were written)")]
+        
+        failures = []
+        for tmp_path, file_path in prepared:
+            try:
+                os.replace(tmp_path, file_path)
+            except OSError as e:
+                os.unlink(tmp_path)
+                failures.append((file_path, str(e)))
+        self.pending = {}
+        return failures
+
+
+def _parse_frontmatter_safely(header):
+    """_parse_frontmatter_metadata() that returns None for invalid YAML, as extract_frontmatter() does."""
+    try:
+        return _parse_frontmatter_metadata(header)
+    except Exception:
+        return None
+
+
+# Items handed to a worker at once; small enough that results stream steadily
+_POOL_MAX_CHUNK = 32
+
+
+def _run_in_pool(function, items, jobs, initializer=None, initargs=()):
+    """Return an iterator over function(item) for each item, computed by a pool of jobs processes.
+    
+    Results come in item order, each as soon as it (and those before it) are
+    done, so the caller can report them while the pool is still working. If
+    the pool breaks part way, iterating raises BrokenProcessPool.
+    
+    Returns None, so the caller can run serially, when there are too few items
+    to be worth it or a process pool cannot be started here.
+    """
+    if jobs <= 1 or len(items) < _PARALLEL_MIN_FILES:
+        return None
+    try:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+    except ImportError:
+        return None
+    
+    chunksize = max(1, min(_POOL_MAX_CHUNK, len(items) // (jobs * 4)))
+    pool = None
+    try:
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=initializer, initargs=initargs)
+        results = pool.map(function, items, chunksize=chunksize)
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        if pool is not None:
+            pool.shutdown(wait=False)
+        return None
+    return _pool_results(pool, results)
+
+
+def _pool_results(pool, results):
+    with pool:
+        yield from results
+
+
+def _parse_headers(headers, jobs=1):
+    """Parse frontmatter headers, in a process pool when jobs > 1."""
+    from concurrent.futures.process import BrokenProcessPool
+    
+    parsed = _run_in_pool(_parse_frontmatter_safely, headers, jobs)
+    if parsed is not None:
+        try:
+            parsed = list(parsed)
+        except BrokenProcessPool:
+            parsed = None
+    if parsed is None:
+        parsed = [_parse_frontmatter_safely(header) for header in headers]
+    else:
+        # Parsed by the workers, whose counters are not seen here
+        count('yaml_parses', sum(1 for header in headers if header is not None))
+    return parsed
+
+
+def extract_frontmatters(file_paths, jobs=1):
+    """extract_frontmatter() for many files, parsing headers in jobs processes.
+    
+    Files are read (or found in the cache) here; only the YAML parsing, which
+    dominates on large repositories, is shared out.
+    """
+    if jobs <= 1 or len(file_paths) < _PARALLEL_MIN_FILES:
+        return [extract_frontmatter(file_path) for file_path in file_paths]
+    
+    parse_many = lambda headers: _parse_headers(headers, jobs)
+    if _frontmatter_cache is not None:
+        return _frontmatter_cache.lookup_headers(file_paths, 'validator', parse_many)
+    
+    headers = []
+    for file_path in file_paths:
+        try:
+            headers.append(read_header(file_path).header)
+        except OSError:
+            headers.append(None)
+    return parse_many(headers)
+
+
 def write_frontmatter(file_path, metadata, dry_run=False):
-    """Write updated YAML frontmatter back to file using python-frontmatter."""
+    """Write updated YAML frontmatter back to file using python-frontmatter.
+    
+    Inside a validate() run that applies fixes the edit is staged in the
+    write batch; otherwise the file is rewritten at once via a temporary file.
+    """
     if dry_run:
         return True
     
+    if _write_batch is not None:
+        _write_batch.stage(file_path, metadata)
+        return True
+    
     try:
-        # Load existing post
-        post = frontmatter.load(file_path)
-        
-        # Update metadata
-        post.metadata = metadata
-        
-        # Write back
-        with open(file_path, 'wb') as f:
-            frontmatter.dump(post, f)
-        
+        tmp_path = _write_temp(file_path, _render_frontmatter(file_path, metadata))
+        os.replace(tmp_path, file_path)
         return True
     
     except Exception as e:
@@ -366,6 +683,7 @@ def auto_fix_frontmatter(component_type, file_path, frontmatter, result, dry_run
             updated['last_updated'] = updated['created']
             fixes_made.append(f"Added last_updated: {updated['created']} (from created)")
         else:
+            from datetime import datetime
             today = datetime.now().strftime('%Y-%m-%d')
             updated['last_updated'] = today
             fixes_made.append(f"Added last_updated: {today}")
@@ -403,35 +721,34 @@ def auto_fix_frontmatter(component_type, file_path, frontmatter, result, dry_run
     if fixed:
         if write_frontmatter(file_path, updated, dry_run):
             for fix in fixes_made:
-                result.add_fix(fix, file_path)
+                result.add_fix(fix, file_path, rule='frontmatter-autofix')
             return True
     
     return False
 
 
+def _project_for(root_dir):
+    """The project model of the current validate() run if it covers root_dir, else a fresh scan."""
+    if _project is not None and os.path.abspath(_project.root) == os.path.abspath(root_dir):
+        return _project
+    return scan_project(root_dir, detect_code=False)
+
+
 def find_component_file_by_id(root_dir, component_type, target_id):
     """Find a component file by its ID."""
     spec = COMPONENT_SPECS[component_type]
-    component_dir = os.path.join(root_dir, spec['dir'])
-    
-    if not os.path.exists(component_dir):
-        return None
     
     # Search for file with matching ID
-    for root, dirs, files in os.walk(component_dir):
-        for file in files:
-            if not file.endswith('.md'):
-                continue
-            
-            file_path = os.path.join(root, file)
-            fm = extract_frontmatter(file_path)
-            if fm and fm.get('id') == target_id:
-                return file_path
+    for rel_path in _project_for(root_dir).walk(spec['dir'], '*.md'):
+        file_path = os.path.join(root_dir, rel_path)
+        fm = extract_frontmatter(file_path)
+        if fm and fm.get('id') == target_id:
+            return file_path
     
     return None
 
 
-def fix_reverse_links(root_dir, result, dry_run=False):
+def fix_reverse_links(root_dir, result, dry_run=False, index=None):
     """
     Fix reverse links by moving references to the correct direction.
     
@@ -441,13 +758,17 @@ def fix_reverse_links(root_dir, result, dry_run=False):
     - Backlog links to CIPs (related_cips)
     
     This function detects reverse links and moves them to the correct file.
+    Files are looked up in the component index (built here if not given),
+    so each file's frontmatter is parsed once however many links point at it.
     """
+    if index is None:
+        index = build_component_index(root_dir)
     fixes_applied = 0
     
     # Pattern: requirement → tenet (requirement should link UP to tenet)
     # If tenet has related_requirements, move to requirement's related_tenets
-    for tenet_file in find_component_files(root_dir, 'tenet'):
-        tenet_fm = extract_frontmatter(tenet_file)
+    for tenet_file in index.files['tenet']:
+        tenet_fm = index.frontmatter(tenet_file)
         if not tenet_fm or 'related_requirements' not in tenet_fm:
             continue
         
@@ -455,13 +776,13 @@ def fix_reverse_links(root_dir, result, dry_run=False):
         reverse_links = tenet_fm.get('related_requirements', [])
         
         for req_id in reverse_links:
-            req_file = find_component_file_by_id(root_dir, 'requirement', req_id)
+            req_file = index.path_for('requirement', req_id)
             if not req_file:
-                result.add_warning(f"Cannot fix reverse link: requirement '{req_id}' not found", tenet_file)
+                result.add_warning(f"Cannot fix reverse link: requirement '{req_id}' not found", tenet_file, rule='reverse-link')
                 continue
             
             # Update requirement to link to tenet
-            req_fm = extract_frontmatter(req_file)
+            req_fm = index.frontmatter(req_file)
             if not req_fm:
                 continue
             
@@ -470,20 +791,20 @@ def fix_reverse_links(root_dir, result, dry_run=False):
             
             if tenet_id not in req_fm['related_tenets']:
                 req_fm['related_tenets'].append(tenet_id)
-                write_frontmatter(req_file, req_fm, dry_run)
-                result.add_fix(f"Moved link: Added tenet '{tenet_id}' to related_tenets", req_file)
+                index.write(req_file, req_fm, dry_run)
+                result.add_fix(f"Moved link: Added tenet '{tenet_id}' to related_tenets", req_file, rule='reverse-link')
                 fixes_applied += 1
         
         # Remove reverse link from tenet
         tenet_fm_updated = dict(tenet_fm)
         del tenet_fm_updated['related_requirements']
-        write_frontmatter(tenet_file, tenet_fm_updated, dry_run)
-        result.add_fix(f"Removed reverse link: related_requirements (moved to requirements)", tenet_file)
+        index.write(tenet_file, tenet_fm_updated, dry_run)
+        result.add_fix(f"Removed reverse link: related_requirements (moved to requirements)", tenet_file, rule='reverse-link')
     
     # Pattern: CIP → requirement (CIP should link UP to requirement)
     # If requirement has related_cips, move to CIP's related_requirements
-    for req_file in find_component_files(root_dir, 'requirement'):
-        req_fm = extract_frontmatter(req_file)
+    for req_file in index.files['requirement']:
+        req_fm = index.frontmatter(req_file)
         if not req_fm or 'related_cips' not in req_fm:
             continue
         
@@ -491,13 +812,13 @@ def fix_reverse_links(root_dir, result, dry_run=False):
         reverse_links = req_fm.get('related_cips', [])
         
         for cip_id in reverse_links:
-            cip_file = find_component_file_by_id(root_dir, 'cip', cip_id)
+            cip_file = index.path_for('cip', cip_id)
             if not cip_file:
-                result.add_warning(f"Cannot fix reverse link: CIP '{cip_id}' not found", req_file)
+                result.add_warning(f"Cannot fix reverse link: CIP '{cip_id}' not found", req_file, rule='reverse-link')
                 continue
             
             # Update CIP to link to requirement
-            cip_fm = extract_frontmatter(cip_file)
+            cip_fm = index.frontmatter(cip_file)
             if not cip_fm:
                 continue
             
@@ -506,20 +827,20 @@ def fix_reverse_links(root_dir, result, dry_run=False):
             
             if req_id not in cip_fm['related_requirements']:
                 cip_fm['related_requirements'].append(req_id)
-                write_frontmatter(cip_file, cip_fm, dry_run)
-                result.add_fix(f"Moved link: Added requirement '{req_id}' to related_requirements", cip_file)
+                index.write(cip_file, cip_fm, dry_run)
+                result.add_fix(f"Moved link: Added requirement '{req_id}' to related_requirements", cip_file, rule='reverse-link')
                 fixes_applied += 1
         
         # Remove reverse link from requirement
         req_fm_updated = dict(req_fm)
         del req_fm_updated['related_cips']
-        write_frontmatter(req_file, req_fm_updated, dry_run)
-        result.add_fix(f"Removed reverse link: related_cips (moved to CIPs)", req_file)
+        index.write(req_file, req_fm_updated, dry_run)
+        result.add_fix(f"Removed reverse link: related_cips (moved to CIPs)", req_file, rule='reverse-link')
     
     # Pattern: backlog → CIP (backlog should link UP to CIP)
     # If CIP has related_backlog, move to backlog's related_cips
-    for cip_file in find_component_files(root_dir, 'cip'):
-        cip_fm = extract_frontmatter(cip_file)
+    for cip_file in index.files['cip']:
+        cip_fm = index.frontmatter(cip_file)
         if not cip_fm or 'related_backlog' not in cip_fm:
             continue
         
@@ -527,13 +848,13 @@ def fix_reverse_links(root_dir, result, dry_run=False):
         reverse_links = cip_fm.get('related_backlog', [])
         
         for backlog_id in reverse_links:
-            backlog_file = find_component_file_by_id(root_dir, 'backlog', backlog_id)
+            backlog_file = index.path_for('backlog', backlog_id)
             if not backlog_file:
-                result.add_warning(f"Cannot fix reverse link: backlog '{backlog_id}' not found", cip_file)
+                result.add_warning(f"Cannot fix reverse link: backlog '{backlog_id}' not found", cip_file, rule='reverse-link')
                 continue
             
             # Update backlog to link to CIP
-            backlog_fm = extract_frontmatter(backlog_file)
+            backlog_fm = index.frontmatter(backlog_file)
             if not backlog_fm:
                 continue
             
@@ -542,19 +863,19 @@ def fix_reverse_links(root_dir, result, dry_run=False):
             
             if cip_id not in backlog_fm['related_cips']:
                 backlog_fm['related_cips'].append(cip_id)
-                write_frontmatter(backlog_file, backlog_fm, dry_run)
-                result.add_fix(f"Moved link: Added CIP '{cip_id}' to related_cips", backlog_file)
+                index.write(backlog_file, backlog_fm, dry_run)
+                result.add_fix(f"Moved link: Added CIP '{cip_id}' to related_cips", backlog_file, rule='reverse-link')
                 fixes_applied += 1
         
         # Remove reverse link from CIP
         cip_fm_updated = dict(cip_fm)
         del cip_fm_updated['related_backlog']
-        write_frontmatter(cip_file, cip_fm_updated, dry_run)
-        result.add_fix(f"Removed reverse link: related_backlog (moved to backlog items)", cip_file)
+        index.write(cip_file, cip_fm_updated, dry_run)
+        result.add_fix(f"Removed reverse link: related_backlog (moved to backlog items)", cip_file, rule='reverse-link')
     
     # Pattern: backlog → requirement (Option B - allowed only with explicit justification)
-    for backlog_file in find_component_files(root_dir, 'backlog'):
-        backlog_fm = extract_frontmatter(backlog_file)
+    for backlog_file in index.files['backlog']:
+        backlog_fm = index.frontmatter(backlog_file)
         if not backlog_fm or not backlog_fm.get('related_requirements'):
             continue
 
@@ -565,6 +886,7 @@ def fix_reverse_links(root_dir, result, dry_run=False):
                 "Backlog has related_requirements but does not satisfy the exception conditions "
                 "(requires related_cips: [] and non-empty no_cip_reason).",
                 backlog_file,
+                rule='backlog-exception',
             )
     
     return fixes_applied
@@ -579,20 +901,41 @@ def validate_file_naming(component_type, file_path, result):
     if not pattern.match(filename):
         result.add_error(
             f"File naming violation: '{filename}' doesn't match pattern {spec['pattern']}",
-            file_path
+            file_path,
+            rule='file-naming'
         )
         return False
     
     return True
 
 
+# Suggested fixes reported with diagnostics (see auto_fix_frontmatter and fix_reverse_links)
+_FIX_COMMAND = './scripts/validate_vibesafe_structure.py --fix'
+_FIX_LINKS_COMMAND = './scripts/validate_vibesafe_structure.py --fix-links'
+_AUTO_FIXED_FIELDS = {
+    'requirement': ('last_updated', 'related_tenets'),
+    'cip': ('last_updated',),
+    'backlog': ('last_updated', 'category', 'related_cips'),
+}
+_REVERSE_LINK_FIELDS = {
+    'tenet': ('related_requirements',),
+    'requirement': ('related_cips',),
+    'cip': ('related_backlog',),
+}
+
+
+def _case_insensitive_match(value, allowed):
+    """Return True if value differs from an allowed value only by case."""
+    return isinstance(value, str) and any(value.lower() == a.lower() and value != a for a in allowed)
+
+
 def validate_yaml_frontmatter(component_type, file_path, result, auto_fix=False, dry_run=False):
     """Validate YAML frontmatter structure."""
     spec = COMPONENT_SPECS[component_type]
     frontmatter = extract_frontmatter(file_path)
     
     if frontmatter is None:
-        result.add_error(f"Missing or invalid YAML frontmatter", file_path)
+        result.add_error(f"Missing or invalid YAML frontmatter", file_path, rule='frontmatter')
         return None
     
     # Try auto-fix first if enabled
@@ -605,7 +948,8 @@ def validate_yaml_frontmatter(component_type, file_path, result, auto_fix=False,
     # Check required fields
     for field in spec['required_fields']:
         if field not in frontmatter:
-            result.add_error(f"Missing required field: '{field}'", file_path)
+            result.add_error(f"Missing required field: '{field}'", file_path, rule='required-field',
+                             fix=_FIX_COMMAND if field in _AUTO_FIXED_FIELDS.get(component_type, ()) else None)
     
     # REQ-0010: Human attribution must be explicit for responsibility-bearing artifacts
     if component_type == 'cip':
@@ -622,22 +966,24 @@ def validate_yaml_frontmatter(component_type, file_path, result, auto_fix=False,
     if component_type == 'backlog' and frontmatter.get('related_requirements'):
         related_reqs = frontmatter.get('related_requirements')
         if not isinstance(related_reqs, list):
-            result.add_error("Invalid 'related_requirements': expected list of requirement IDs", file_path)
+            result.add_error("Invalid 'related_requirements': expected list of requirement IDs", file_path, rule='backlog-exception')
         related_cips = frontmatter.get('related_cips')
         if related_cips is None:
-            result.add_error("Invalid exception: backlog has related_requirements but missing required field 'related_cips'", file_path)
+            result.add_error("Invalid exception: backlog has related_requirements but missing required field 'related_cips'", file_path, rule='backlog-exception')
         elif not isinstance(related_cips, list):
-            result.add_error("Invalid 'related_cips': expected list", file_path)
+            result.add_error("Invalid 'related_cips': expected list", file_path, rule='backlog-exception')
         elif len(related_cips) != 0:
             result.add_error(
                 "Invalid exception: backlog has related_requirements but related_cips is non-empty (use a CIP instead of direct requirement linkage)",
                 file_path,
+                rule='backlog-exception',
             )
         no_cip_reason = frontmatter.get('no_cip_reason')
         if not isinstance(no_cip_reason, str) or not no_cip_reason.strip():
             result.add_error(
                 "Invalid exception: backlog has related_requirements but missing/empty 'no_cip_reason' (explicit justification required)",
                 file_path,
+                rule='backlog-exception',
             )
 
     # Validate field values
@@ -646,7 +992,9 @@ def validate_yaml_frontmatter(component_type, file_path, result, auto_fix=False,
             if frontmatter['status'] not in spec['allowed_status']:
                 result.add_error(
                     f"Invalid status: '{frontmatter['status']}'. Allowed: {spec['allowed_status']}",
-                    file_path
+                    file_path,
+                    rule='invalid-status',
+                    fix=_FIX_COMMAND if _case_insensitive_match(frontmatter['status'], spec['allowed_status']) else None
                 )
     
     if 'priority' in frontmatter:
@@ -654,7 +1002,9 @@ def validate_yaml_frontmatter(component_type, file_path, result, auto_fix=False,
             if frontmatter['priority'] not in spec['allowed_priority']:
                 result.add_error(
                     f"Invalid priority: '{frontmatter['priority']}'. Allowed: {spec['allowed_priority']}",
-                    file_path
+                    file_path,
+                    rule='invalid-priority',
+                    fix=_FIX_COMMAND if _case_insensitive_match(frontmatter['priority'], spec['allowed_priority']) else None
                 )
     
     # Validate date formats
@@ -664,7 +1014,8 @@ def validate_yaml_frontmatter(component_type, file_path, result, auto_fix=False,
             if not re.match(r'^\d{4}-\d{2}-\d{2}$', str(date_str)):
                 result.add_error(
                     f"Invalid date format for '{date_field}': '{date_str}'. Expected YYYY-MM-DD",
-                    file_path
+                    file_path,
+                    rule='date-format'
                 )
     
     # Check for fields that violate bottom-up pattern
@@ -672,57 +1023,134 @@ def validate_yaml_frontmatter(component_type, file_path, result, auto_fix=False,
         if field in frontmatter and frontmatter[field]:
             result.add_warning(
                 f"Violates bottom-up pattern: Has '{field}' field. {component_type}s should only link upward",
-                file_path
+                file_path,
+                rule='bottom-up',
+                fix=_FIX_LINKS_COMMAND if field in _REVERSE_LINK_FIELDS.get(component_type, ()) else None
             )
     
     return frontmatter
 
 
+# System/template files to exclude
+_EXCLUDED_FILES = {'readme.md', 'tenet_template.md', 'task_template.md', 'cip_template.md', 'requirement_template.md', 'vibesafe-tenets.md', 'index.md'}
+
+
+def _is_component_file(directory, filename, pattern):
+    # Skip template directories
+    if 'templates' in directory or 'template' in directory.lower():
+        return False
+    if filename.lower() in _EXCLUDED_FILES:
+        return False
+    return filename.endswith('.md') and bool(pattern.match(filename))
+
+
 def find_component_files(root_dir, component_type):
-    """Find all files for a component type."""
-    spec = COMPONENT_SPECS[component_type]
-    component_dir = os.path.join(root_dir, spec['dir'])
+    """Find all files for a component type.
     
-    if not os.path.exists(component_dir):
-        return []
-    
-    files = []
+    Uses the project model of the current validate() run when it covers
+    root_dir, and scans root_dir's component directories otherwise.
+    """
+    spec = COMPONENT_SPECS[component_type]
     pattern = re.compile(spec['pattern'])
     
-    for root, dirs, filenames in os.walk(component_dir):
-        # Skip template files and README
-        if 'templates' in root or 'template' in root.lower():
-            continue
-        
-        # System/template files to exclude
-        excluded_files = {'readme.md', 'tenet_template.md', 'task_template.md', 'cip_template.md', 'requirement_template.md', 'vibesafe-tenets.md', 'index.md'}
-        
-        for filename in filenames:
-            if filename.lower() in excluded_files:
-                continue
-            if filename.endswith('.md') and pattern.match(filename):
-                files.append(os.path.join(root, filename))
-    
+    files = []
+    for rel_path in _project_for(root_dir).walk(spec['dir']):
+        directory, filename = os.path.split(os.path.join(root_dir, rel_path))
+        if _is_component_file(directory, filename, pattern):
+            files.append(os.path.join(directory, filename))
     return files
 
 
-def collect_all_ids(root_dir):
-    """Collect all component IDs for cross-reference validation."""
-    all_ids = {
-        'requirement': set(),
-        'cip': set(),
-        'backlog': set(),
-        'tenet': set(),
-    }
+class ComponentIndex:
+    """Component files of one run, their parsed frontmatter, and an ID→path index.
     
-    for component_type in all_ids.keys():
-        files = find_component_files(root_dir, component_type)
-        for file_path in files:
-            frontmatter = extract_frontmatter(file_path)
-            if frontmatter and 'id' in frontmatter:
-                all_ids[component_type].add(frontmatter['id'])
+    Built once by build_component_index() and shared by fix_reverse_links(),
+    collect_all_ids() and cross-reference validation. Writes made through
+    write() are reflected in the index, so later lookups see the fixed links.
+    """
+    
+    def __init__(self, root_dir):
+        self.root_dir = root_dir
+        self.files = {component_type: [] for component_type in COMPONENT_SPECS}
+        self.metadata = {}  # file path -> parsed frontmatter (None if missing)
+        self.paths = {component_type: {} for component_type in COMPONENT_SPECS}  # id -> file path
+    
+    def add(self, component_type, file_path, metadata):
+        self.files[component_type].append(file_path)
+        self.metadata[file_path] = metadata
+        if metadata and 'id' in metadata:
+            # First file wins when an ID is duplicated, as with a directory walk
+            self.paths[component_type].setdefault(metadata['id'], file_path)
+    
+    def path_for(self, component_type, target_id):
+        """Return the file with the given ID, or None."""
+        try:
+            return self.paths[component_type].get(target_id)
+        except TypeError:  # unhashable ID in a link list
+            return None
+    
+    def frontmatter(self, file_path):
+        """Return a copy of a file's frontmatter that callers may modify."""
+        return copy.deepcopy(self.metadata.get(file_path))
     
-    return all_ids
+    def ids(self):
+        """Return {component_type: set of IDs}."""
+        return {component_type: set(paths) for component_type, paths in self.paths.items()}
+    
+    def write(self, file_path, metadata, dry_run=False):
+        """Write frontmatter to a file and update the index to match."""
+        written = write_frontmatter(file_path, metadata, dry_run)
+        if written and not dry_run:
+            self.metadata[file_path] = copy.deepcopy(metadata)
+        return written
+
+
+def build_component_index(root_dir, jobs=1):
+    """Find and parse every component file once (in jobs processes)."""
+    global _project
+    
+    # Outside validate(), scan the project once for all component types
+    saved = _project
+    _project = _project_for(root_dir)
+    try:
+        found = [
+            (component_type, file_path)
+            for component_type in COMPONENT_SPECS
+            for file_path in find_component_files(root_dir, component_type)
+        ]
+    finally:
+        _project = saved
+    metadata = extract_frontmatters([file_path for _component_type, file_path in found], jobs)
+    
+    index = ComponentIndex(root_dir)
+    for (component_type, file_path), file_metadata in zip(found, metadata):
+        index.add(component_type, file_path, file_metadata)
+    return index
+
+
+def collect_all_ids(root_dir, index=None):
+    """Collect all component IDs for cross-reference validation."""
+    if index is None:
+        index = build_component_index(root_dir)
+    return index.ids()
+
+
+def _linked_ids(component_type, frontmatter):
+    """Return the IDs a component's frontmatter links to (as checked by validate_cross_references)."""
+    fields = list(COMPONENT_SPECS[component_type]['links_to'])
+    if component_type == 'backlog':
+        fields.append('related_requirements')
+    ids = set()
+    for field in fields:
+        refs = frontmatter.get(field)
+        if refs is None:
+            continue
+        for ref_id in refs if isinstance(refs, list) else [refs]:
+            try:
+                ids.add(ref_id)
+            except TypeError:  # unhashable value; reported by validation
+                pass
+    return ids
 
 
 def validate_cross_references(component_type, file_path, frontmatter, all_ids, result):
@@ -751,7 +1179,8 @@ def validate_cross_references(component_type, file_path, frontmatter, all_ids, r
                     if ref_id not in all_ids[target_type]:
                         result.add_warning(
                             f"Broken reference: {link_field} references '{ref_id}' which doesn't exist",
-                            file_path
+                            file_path,
+                            rule='broken-reference'
                         )
 
     # Backlog exception path (Option B): if related_requirements is present, validate requirement IDs.
@@ -764,6 +1193,7 @@ def validate_cross_references(component_type, file_path, frontmatter, all_ids, r
                 result.add_warning(
                     f"Broken reference: related_requirements references '{ref_id}' which doesn't exist",
                     file_path,
+                    rule='broken-reference',
                 )
 
 
@@ -850,7 +1280,7 @@ def print_results(result, strict=False, dry_run=False):
     
     # Summary
     print(colored("─" * 70, Colors.BLUE))
-    if not result.has_errors() and (not strict or not result.has_warnings()):
+    if _passed(result, strict):
         print(colored("🎉 Validation PASSED!", Colors.GREEN + Colors.BOLD))
         print(colored("   VibeSafe structure conforms to requirements (REQ-0001, REQ-0006)", Colors.GREEN))
     else:
@@ -867,6 +1297,45 @@ def print_results(result, strict=False, dry_run=False):
     print()
 
 
+def _passed(result, strict=False):
+    return not result.has_errors() and (not strict or not result.has_warnings())
+
+
+def _summary(result, strict=False, dry_run=False):
+    return {
+        'passed': _passed(result, strict),
+        'strict': strict,
+        'dry_run': dry_run,
+        'errors': len(result.errors),
+        'warnings': len(result.warnings),
+        'fixes': len(result.fixes),
+    }
+
+
+def print_results_json(result, strict=False, dry_run=False):
+    """Print validation results as a single JSON document."""
+    import json
+
+    document = _summary(result, strict, dry_run)
+    document['diagnostics'] = result.diagnostics
+    document['info'] = result.info
+    print(json.dumps(document, indent=2))
+
+
+def print_diagnostic_ndjson(diagnostic):
+    """Print one diagnostic as an NDJSON line, flushed so consumers see it immediately."""
+    import json
+
+    print(json.dumps({'type': 'diagnostic', **diagnostic}), flush=True)
+
+
+def print_summary_ndjson(result, strict=False, dry_run=False):
+    """Print the closing NDJSON summary line."""
+    import json
+
+    print(json.dumps({'type': 'summary', **_summary(result, strict, dry_run)}), flush=True)
+
+
 def check_system_file_drift(root_dir, result):
     """
     Check for drift between runtime files and templates/
@@ -882,7 +1351,9 @@ def check_system_file_drift(root_dir, result):
     def _read_text_normalized(path: str) -> str:
         # Normalize newlines to avoid false drift due to editor/platform settings.
         with open(path, "r", encoding="utf-8") as f:
-            return f.read().replace("\r\n", "\n")
+            text = f.read()
+        count_read(len(text))
+        return text.replace("\r\n", "\n")
 
     def _check_pair(template_rel: str, runtime_rel: str) -> None:
         template_path = os.path.join(root_dir, template_rel)
@@ -890,7 +1361,7 @@ def check_system_file_drift(root_dir, result):
 
         if not os.path.exists(template_path):
             # Template missing is a real problem: templates are the canonical source.
-            result.add_error(f"Missing template system file: {template_rel}", template_path)
+            result.add_error(f"Missing template system file: {template_rel}", template_path, rule='system-file-drift')
             return
 
         if not os.path.exists(runtime_path):
@@ -903,7 +1374,7 @@ def check_system_file_drift(root_dir, result):
             template_text = _read_text_normalized(template_path)
             runtime_text = _read_text_normalized(runtime_path)
         except Exception as e:
-            result.add_warning(f"Could not read system file drift pair ({runtime_rel}): {e}", runtime_path)
+            result.add_warning(f"Could not read system file drift pair ({runtime_rel}): {e}", runtime_path, rule='system-file-drift')
             return
 
         if template_text == runtime_text:
@@ -932,6 +1403,7 @@ def check_system_file_drift(root_dir, result):
                 "This strongly suggests an agent edited the runtime copy instead of the canonical template. "
                 "Port the changes into templates/ (preferred), then reinstall/recopy runtime files as needed.",
                 runtime_path,
+                rule='system-file-drift',
             )
         else:
             result.add_error(
@@ -940,6 +1412,7 @@ def check_system_file_drift(root_dir, result):
                 "If templates/ is canonical (VibeSafe repo), update templates/ then reinstall/recopy runtime files. "
                 "If this is a downstream project, reinstall will refresh runtime from templates.",
                 runtime_path,
+                rule='system-file-drift',
             )
 
     # Only enforce drift checks when templates exist (VibeSafe repo / dogfood).
@@ -951,11 +1424,224 @@ def check_system_file_drift(root_dir, result):
     # (We intentionally do NOT require these runtime copies to exist.)
     _check_pair("templates/scripts/whats_next.py", "scripts/whats_next.py")
     _check_pair("templates/scripts/validate_vibesafe_structure.py", "scripts/validate_vibesafe_structure.py")
+    _check_pair("templates/scripts/vibesafe_frontmatter.py", "scripts/vibesafe_frontmatter.py")
+    _check_pair("templates/scripts/vibesafe_project.py", "scripts/vibesafe_project.py")
+    _check_pair("templates/scripts/vibesafe_watch.py", "scripts/vibesafe_watch.py")
+    _check_pair("templates/scripts/vibesafe_daemon.py", "scripts/vibesafe_daemon.py")
+    _check_pair("templates/scripts/vibesafe_timings.py", "scripts/vibesafe_timings.py")
+    _check_pair("templates/scripts/vibesafe_git.py", "scripts/vibesafe_git.py")
+    _check_pair("templates/scripts/vibesafe_prompts.py", "scripts/vibesafe_prompts.py")
     _check_pair("templates/backlog/update_index.py", "backlog/update_index.py")
     _check_pair("templates/tenets/combine_tenets.py", "tenets/combine_tenets.py")
 
 
-def main():
+def _run_task(task, root_dir, all_ids, result, auto_fix=False, dry_run=False):
+    """Run one step-3 task: ('component', type, path) or ('links', type, path)."""
+    kind, component_type, file_path = task
+    if kind == 'component':
+        validate_component(root_dir, component_type, file_path, all_ids, result, auto_fix, dry_run)
+    else:
+        validate_cross_references(component_type, file_path, extract_frontmatter(file_path), all_ids, result)
+
+
+# Per-process state of validation workers (see _init_worker)
+_worker_args = None
+
+
+def _init_worker(root_dir, index, all_ids, auto_fix, dry_run):
+    global _frontmatter_cache, _project, _write_batch, _index, _worker_args
+    _frontmatter_cache = _project = _write_batch = None
+    _index = index
+    _worker_args = (root_dir, all_ids, auto_fix, dry_run)
+
+
+def _validate_task(task):
+    """Run a step-3 task in a worker process and return its own ValidationResult."""
+    root_dir, all_ids, auto_fix, dry_run = _worker_args
+    result = ValidationResult(root_dir=root_dir)
+    _run_task(task, root_dir, all_ids, result, auto_fix, dry_run)
+    return result
+
+
+def _changed_files_and_ids(root_dir, since, index, result):
+    """Return (changed component files, IDs added/removed/renamed) for --changed-only.
+    
+    Returns (None, None), meaning validate everything, when git cannot tell.
+    """
+    changes = _get_git_changes(root_dir, since)
+    if changes is None:
+        result.add_info(f"Changed-only: cannot compare with '{since}' using git; validating all files")
+        return None, None
+    
+    changed = set()
+    old_paths = []
+    for _status, old_path, new_path in changes:
+        if new_path is not None:
+            changed.add(os.path.join(root_dir, new_path))
+        if old_path is not None and old_path.endswith('.md'):
+            old_paths.append(old_path)
+    
+    # IDs now defined by changed files, and IDs those files defined before
+    affected_ids = set()
+    for file_path in changed:
+        metadata = index.metadata.get(file_path)
+        if metadata and 'id' in metadata:
+            affected_ids.add(metadata['id'])
+    affected_ids |= _get_git_old_ids(root_dir, since, old_paths)
+    return changed, affected_ids
+
+
+def validate(root_dir='.', components=None, auto_fix=False, fix_links=False, dry_run=False,
+             governance_drift=True, project: Optional[ProjectModel] = None,
+             cache: Optional[vibesafe_frontmatter.FrontmatterCache] = None,
+             on_diagnostic=None, changed_only=False, since=None, jobs=1,
+             timings: Optional[vibesafe_timings.Timings] = None,
+             git_state: Optional[vibesafe_git.GitState] = None) -> ValidationResult:
+    """Validate a VibeSafe project in-process and return the ValidationResult.
+    
+    This is what main() runs; whats_next.py calls it directly.
+    
+    Args:
+        root_dir: Root directory of the VibeSafe project
+        components: Component types to validate (default: all)
+        auto_fix: Auto-fix simple frontmatter issues
+        fix_links: Fix reverse links before validating
+        dry_run: Report fixes without writing them
+        governance_drift: Run the git-based governance drift check
+        project: Already-scanned project model for root_dir (scanned here if omitted)
+        cache: Frontmatter cache to read through (the caller saves it)
+        on_diagnostic: Called with each diagnostic dict as it is found
+        changed_only: Only validate files git reports as changed, plus the
+            cross-references of files linking to IDs that were added, removed
+            or renamed (falls back to all files outside a git repository)
+        since: Revision to compare against with changed_only (default: HEAD)
+        jobs: Number of processes to parse and validate files with. Results
+            are merged in file order, so they match a serial run, and
+            on_diagnostic receives each file's diagnostics as they arrive.
+        timings: Records the steps below as phases (--timings)
+        git_state: Work tree state of root_dir already read by the caller,
+            used by the governance drift check instead of running git again
+    """
+    global _frontmatter_cache, _project, _write_batch, _index
+    
+    root_dir = os.path.abspath(root_dir)
+    if components is None:
+        components = ['requirement', 'cip', 'backlog', 'tenet']
+    if project is None:
+        with phase(timings, 'scan_project'):
+            project = scan_project(root_dir, detect_code=False)
+    
+    result = ValidationResult(on_diagnostic, root_dir)
+    saved = _frontmatter_cache, _project, _write_batch, _index
+    if cache is not None:
+        _frontmatter_cache = cache
+    _project = project
+    _write_batch = FrontmatterWriteBatch() if (auto_fix or fix_links) and not dry_run else None
+    try:
+        # Every component file is found and parsed once, up front
+        with phase(timings, 'build_component_index'):
+            index = build_component_index(root_dir, jobs)
+        _index = index
+        
+        # Step 1: Fix reverse links first (if requested)
+        # This must happen before validation to avoid false positives
+        if fix_links:
+            result.add_info("Fixing reverse links...")
+            with phase(timings, 'fix_reverse_links'):
+                fixes_count = fix_reverse_links(root_dir, result, dry_run, index)
+            result.add_info(f"Reverse link fixes applied: {fixes_count}")
+        
+        # Step 2: Collect all IDs for cross-reference validation
+        all_ids = collect_all_ids(root_dir, index)
+        
+        changed = affected_ids = None
+        if changed_only:
+            with phase(timings, 'changed_files'):
+                changed, affected_ids = _changed_files_and_ids(root_dir, since or 'HEAD', index, result)
+        
+        # Step 3: Validate each component type
+        tasks = []
+        validated = rechecked = 0
+        for component_type in components:
+            files = index.files[component_type]
+            result.add_info(f"Found {len(files)} {component_type} file(s)")
+            
+            for file_path in files:
+                if changed is None or file_path in changed:
+                    tasks.append(('component', component_type, file_path))
+                    validated += 1
+                    continue
+                # Unchanged file: only its links can have been broken (or repaired)
+                frontmatter = index.frontmatter(file_path)
+                if frontmatter and _linked_ids(component_type, frontmatter) & affected_ids:
+                    tasks.append(('links', component_type, file_path))
+                    rechecked += 1
+        
+        # Fixes are staged in this process, so only read-only runs are shared out
+        with phase(timings, 'validate_components'):
+            task_results = None
+            if _write_batch is None:
+                task_results = _run_in_pool(_validate_task, tasks, jobs, _init_worker,
+                                            (root_dir, index, all_ids, auto_fix, dry_run))
+            done = 0
+            if task_results is not None:
+                from concurrent.futures.process import BrokenProcessPool
+                
+                # Each file's diagnostics are reported as its result arrives
+                try:
+                    for task_result in task_results:
+                        result.extend(task_result)
+                        done += 1
+                except BrokenProcessPool:
+                    pass  # the rest are validated here
+            for task in tasks[done:]:
+                _run_task(task, root_dir, all_ids, result, auto_fix, dry_run)
+        
+        if changed is not None:
+            result.add_info(
+                f"Changed-only: {validated} changed file(s) validated, "
+                f"cross-references re-checked in {rechecked} other file(s)"
+            )
+        
+        # Write all fixes at once, after they have been reported
+        if _write_batch is not None and _write_batch.pending:
+            result.add_info(f"Writing fixes to {len(_write_batch.pending)} file(s)")
+            with phase(timings, 'write_fixes'):
+                for file_path, error in _write_batch.commit():
+                    result.add_error(f"Could not write fixes: {error}", file_path, rule='write-fixes')
+        
+        # Step 4: Check for system file drift (REQ-0006)
+        with phase(timings, 'check_system_file_drift'):
+            check_system_file_drift(root_dir, result)
+        
+        # Step 5: Optional git-based process warnings
+        if governance_drift:
+            with phase(timings, 'check_governance_drift'):
+                check_governance_drift(root_dir, result, git_state)
+    finally:
+        _frontmatter_cache, _project, _write_batch, _index = saved
+    
+    return result
+
+
+def _jobs_arg(value):
+    """--jobs value: a number of processes, or 'auto' for the CPU count."""
+    if value == 'auto':
+        return os.cpu_count() or 1
+    try:
+        return max(1, int(value))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a number or 'auto', got '{value}'")
+
+
+def main(argv: Optional[List[str]] = None, project: Optional[ProjectModel] = None):
+    """Command-line entry point.
+
+    Args:
+        argv: Arguments to parse instead of sys.argv[1:]
+        project: Already-scanned project model, used when it covers --root
+            (the daemon passes its live model)
+    """
     parser = argparse.ArgumentParser(
         description='Validate VibeSafe structure against requirements (REQ-0001, REQ-0006)',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -965,6 +1651,8 @@ Examples:
   %(prog)s --component req    # Validate only requirements
   %(prog)s --strict           # Treat warnings as errors
   %(prog)s --no-color         # Disable colored output
+  %(prog)s --format ndjson    # Stream diagnostics as JSON lines
+  %(prog)s --changed-only     # Validate only files changed since HEAD
         """
     )
     
@@ -998,6 +1686,13 @@ Examples:
         action='store_true',
         help='Disable colored output'
     )
+    parser.add_argument(
+        '--format',
+        choices=['text', 'json', 'ndjson'],
+        default='text',
+        help='Output format: colored text (default), one JSON document, or one JSON line per diagnostic '
+             'followed by a summary line'
+    )
     parser.add_argument(
         '--no-governance-drift',
         action='store_true',
@@ -1008,10 +1703,44 @@ Examples:
         default='.',
         help='Root directory of VibeSafe project (default: current directory)'
     )
+    parser.add_argument(
+        '--changed-only',
+        action='store_true',
+        help='Only validate files changed according to git (plus cross-references to changed IDs)'
+    )
+    parser.add_argument(
+        '--since',
+        metavar='REV',
+        help='With --changed-only, compare against REV instead of HEAD (implies --changed-only)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=_jobs_arg,
+        default=1,
+        metavar='N',
+        help="Number of processes used to parse and validate files, or 'auto' for one per CPU "
+             "(default: 1, so no process pool is started unless asked for)"
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not use the frontmatter cache (.vibesafe/cache)'
+    )
+    parser.add_argument(
+        '--timings',
+        action='store_true',
+        help='Report wall/CPU time, files and bytes read, YAML parses and subprocesses per phase (on stderr)'
+    )
+    parser.add_argument(
+        '--timings-json',
+        metavar='PATH',
+        help="Write the per-phase timings as JSON to PATH ('-' for stdout)"
+    )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    timings = vibesafe_timings.Timings('validate') if args.timings or args.timings_json else None
     
-    if args.no_color:
+    if args.no_color or args.format != 'text':
         Colors.disable()
     
     # --dry-run implies --fix and --fix-links (if specified)
@@ -1020,9 +1749,11 @@ Examples:
     dry_run = args.dry_run
     
     root_dir = os.path.abspath(args.root)
-    result = ValidationResult()
+    if project is not None and os.path.abspath(project.root) != root_dir:
+        project = None
     
     # Determine which components to validate
+    components_to_validate = None
     if args.component:
         component_map = {
             'req': 'requirement',
@@ -1031,36 +1762,44 @@ Examples:
             'tenet': 'tenet'
         }
         components_to_validate = [component_map[args.component]]
-    else:
-        components_to_validate = ['requirement', 'cip', 'backlog', 'tenet']
-    
-    # Step 1: Fix reverse links first (if requested)
-    # This must happen before validation to avoid false positives
-    if args.fix_links:
-        result.add_info("Fixing reverse links...")
-        fixes_count = fix_reverse_links(root_dir, result, dry_run)
-        result.add_info(f"Reverse link fixes applied: {fixes_count}")
-    
-    # Step 2: Collect all IDs for cross-reference validation
-    all_ids = collect_all_ids(root_dir)
-    
-    # Step 3: Validate each component type
-    for component_type in components_to_validate:
-        files = find_component_files(root_dir, component_type)
-        result.add_info(f"Found {len(files)} {component_type} file(s)")
-        
-        for file_path in files:
-            validate_component(root_dir, component_type, file_path, all_ids, result, auto_fix, dry_run)
     
-    # Step 4: Check for system file drift (REQ-0006)
-    check_system_file_drift(root_dir, result)
-
-    # Step 5: Optional git-based process warnings
-    if not args.no_governance_drift:
-        check_governance_drift(root_dir, result)
+    cache = None
+    if not args.no_cache:
+        with phase(timings, 'open_cache'):
+            cache = vibesafe_frontmatter.open_cache(root_dir)
+    result = validate(
+        root_dir,
+        components=components_to_validate,
+        auto_fix=auto_fix,
+        fix_links=fix_links,
+        dry_run=dry_run,
+        governance_drift=not args.no_governance_drift,
+        project=project,
+        cache=cache,
+        on_diagnostic=print_diagnostic_ndjson if args.format == 'ndjson' else None,
+        changed_only=args.changed_only or args.since is not None,
+        since=args.since,
+        jobs=args.jobs,
+        timings=timings,
+    )
+    if cache is not None:
+        with phase(timings, 'save_cache'):
+            cache.save()
     
     # Print results
-    print_results(result, strict=args.strict, dry_run=dry_run)
+    with phase(timings, 'print_results'):
+        if args.format == 'json':
+            print_results_json(result, strict=args.strict, dry_run=dry_run)
+        elif args.format == 'ndjson':
+            print_summary_ndjson(result, strict=args.strict, dry_run=dry_run)
+        else:
+            print_results(result, strict=args.strict, dry_run=dry_run)
+    
+    if timings is not None:
+        if args.timings:
+            timings.report()
+        if args.timings_json:
+            timings.write_json(args.timings_json)
     
     # Exit code
     if result.has_errors():
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+VibeSafe Daemon
+
+An optional background process that keeps whats_next.py and
+validate_vibesafe_structure.py warm for one project: the interpreter, the
+imported modules, the project model, parsed frontmatter and the frontmatter
+cache all stay in memory between calls. File changes are picked up with the
+same watcher as whats_next.py --watch, so only touched files are re-parsed.
+Git state is still queried on every request, as working-tree changes outside
+the watched directories cannot be observed cheaply.
+
+Enable it with VIBESAFE_DAEMON=1. whats_next.py and the validator then
+forward their command line to the daemon over a Unix socket
+(.vibesafe/cache/daemon.sock) and print its answer. If no daemon is running,
+the tool starts one in the background and answers this call itself. The
+daemon exits after VIBESAFE_DAEMON_IDLE seconds without requests (default
+900), and whenever the installed scripts change. A call whose VIBESAFE_*
+environment (e.g. VIBESAFE_NO_CACHE=1) differs from the one the daemon
+started with is run by the tool itself, as the daemon's resident state was
+set up for its own environment. So is a call the daemon does not accept
+within CONNECT_TIMEOUT seconds or answer within REPLY_TIMEOUT seconds, so a
+wedged daemon never blocks the tools.
+
+Usage:
+    python scripts/vibesafe_daemon.py serve [--idle-timeout SECONDS]
+    python scripts/vibesafe_daemon.py status
+    python scripts/vibesafe_daemon.py stop
+
+Only os and sys are imported at the top, so a tool that is not using the
+daemon pays nothing for it, and forwarding a call costs little more than
+starting the interpreter.
+"""
+
+import os
+import sys
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Relative to the project root, which keeps the path well under the AF_UNIX limit.
+SOCKET_PATH = os.path.join('.vibesafe', 'cache', 'daemon.sock')
+LOCK_PATH = os.path.join('.vibesafe', 'cache', 'daemon.lock')
+
+DEFAULT_IDLE_TIMEOUT = 900
+
+# Seconds a tool waits for the daemon to accept a call and to answer it,
+# before running the tool itself
+CONNECT_TIMEOUT = 2
+REPLY_TIMEOUT = 60
+
+# Variables read by the daemon machinery rather than by the tools
+_DAEMON_VARIABLES = ('VIBESAFE_DAEMON', 'VIBESAFE_DAEMON_IDLE')
+
+# Tools the daemon can run: request name -> module name.
+TOOLS = {
+    'whats_next': 'whats_next',
+    'validate': 'validate_vibesafe_structure',
+}
+
+
+def enabled() -> bool:
+    """Return True if VIBESAFE_DAEMON asks for tools to go through the daemon."""
+    return os.environ.get('VIBESAFE_DAEMON', '').strip().lower() in ('1', 'true', 'yes')
+
+
+def tool_environment() -> dict:
+    """The VIBESAFE_* environment variables the tools read, as set in this process."""
+    return {name: value for name, value in os.environ.items()
+            if name.startswith('VIBESAFE_') and name not in _DAEMON_VARIABLES}
+
+
+def scripts_version() -> str:
+    """Identify the interpreter and installed scripts, so a stale daemon can be told apart."""
+    parts = [sys.executable]
+    for name in sorted(os.listdir(_SCRIPT_DIR)):
+        if name.endswith('.py'):
+            st = os.stat(os.path.join(_SCRIPT_DIR, name))
+            parts.append(f'{name}:{st.st_mtime_ns}:{st.st_size}')
+    return '|'.join(parts)
+
+
+def _send(message, timeout=None, connect_timeout=None):
+    """Send one request to the daemon and return its decoded reply.
+
+    Args:
+        timeout: Seconds to wait for the whole reply, None to wait for ever
+        connect_timeout: Seconds to wait for the daemon to accept the
+            connection (timeout if None)
+
+    Raises:
+        OSError: If no daemon is listening.
+        socket.timeout: If the daemon did not accept or answer in time.
+    """
+    import json
+    import socket
+    import time
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout if connect_timeout is None else connect_timeout)
+        sock.connect(SOCKET_PATH)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+        sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise socket.timeout('no reply from the daemon')
+                sock.settimeout(remaining)
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return json.loads(b''.join(chunks).decode('utf-8'))
+
+
+def start():
+    """Start a daemon for the current directory in the background."""
+    import subprocess
+
+    try:
+        subprocess.Popen(
+            [sys.executable, os.path.join(_SCRIPT_DIR, 'vibesafe_daemon.py'), 'serve'],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def forward(tool: str, argv=None):
+    """Answer this command from the daemon if VIBESAFE_DAEMON is set.
+
+    Exits the process with the tool's exit code when the daemon answered.
+    Returns when the caller should run the tool itself: the daemon is
+    disabled, not running (one is then started for next time), stale,
+    running with a different VIBESAFE_* environment, or too slow to accept
+    or answer the call.
+    """
+    if not enabled():
+        return
+    import socket
+    if not hasattr(socket, 'AF_UNIX'):
+        return
+    argv = sys.argv[1:] if argv is None else argv
+    if '--watch' in argv:
+        return  # A long-running view has nothing to gain from the daemon
+    try:
+        reply = _send({'tool': tool, 'argv': argv, 'version': scripts_version(), 'env': tool_environment()},
+                      REPLY_TIMEOUT, CONNECT_TIMEOUT)
+    except socket.timeout:
+        return  # a daemon is there but busy or stuck; it is not replaced
+    except (OSError, ValueError):
+        start()
+        return
+    if 'error' in reply:
+        if reply.get('restart'):
+            start()
+        return
+    sys.stdout.write(reply.get('stdout', ''))
+    sys.stderr.write(reply.get('stderr', ''))
+    sys.stdout.flush()
+    sys.stderr.flush()
+    sys.exit(reply.get('exit_code', 0))
+
+
+class Daemon:
+    """The server side: one project, one request at a time."""
+
+    def __init__(self, root: str = '.', idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        import time
+
+        if _SCRIPT_DIR not in sys.path:
+            sys.path.insert(0, _SCRIPT_DIR)
+        import vibesafe_frontmatter
+        from vibesafe_project import COMPONENT_DIRS, scan_project
+        from vibesafe_watch import open_watcher
+
+        self.root = os.path.abspath(root)
+        self.idle_timeout = idle_timeout
+        self.version = scripts_version()
+        self.environment = tool_environment()
+        self.started = time.time()
+        self.requests = 0
+        self._scan_project = scan_project
+        self.modules = {name: __import__(module) for name, module in TOOLS.items()}
+
+        self.cache = vibesafe_frontmatter.open_cache(self.root)
+        if self.cache is not None:
+            vibesafe_frontmatter.keep_resident(self.cache)
+        self.project = scan_project('.')
+        self._root_mtime = os.stat('.').st_mtime_ns
+        self.watcher = open_watcher('.', COMPONENT_DIRS)
+        # Parsed frontmatter stays in memory; refresh() drops touched files.
+        self.modules['whats_next']._frontmatter_memo = {}
+
+    def refresh(self):
+        """Apply file changes seen since the last request to the project model."""
+        whats_next = self.modules['whats_next']
+        for rel_path in sorted(self.watcher.wait(timeout=0)):
+            self.project.refresh(rel_path)
+            whats_next.forget_frontmatter(rel_path)
+        # Top-level entries (and with them code detection) are not watched;
+        # the root directory's mtime tells when to look again.
+        root_mtime = os.stat('.').st_mtime_ns
+        if root_mtime != self._root_mtime:
+            self._root_mtime = root_mtime
+            self.project = self._scan_project('.')
+
+    def run_tool(self, tool: str, argv):
+        """Run a tool's main() in-process with its output captured."""
+        import contextlib
+        import io
+
+        module = self.modules[tool]
+        # Colors.disable() (--no-color) must not outlive the request.
+        colors = dict(vars(module.Colors))
+        stdout, stderr = io.StringIO(), io.StringIO()
+        exit_code = 0
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    module.main(argv, project=self.project)
+                except SystemExit as e:
+                    if e.code is None or isinstance(e.code, int):
+                        exit_code = e.code or 0
+                    else:
+                        print(e.code, file=sys.stderr)
+                        exit_code = 1
+                except Exception as e:
+                    # As whats_next.py reports errors when run directly
+                    end = getattr(module.Colors, 'ENDC', getattr(module.Colors, 'END', ''))
+                    print(f"\n{module.Colors.RED}Error:{end} {e}")
+                    exit_code = 1
+        finally:
+            for name, value in colors.items():
+                if not name.startswith('__'):
+                    setattr(module.Colors, name, value)
+        return {'stdout': stdout.getvalue(), 'stderr': stderr.getvalue(), 'exit_code': exit_code}
+
+    def handle(self, request):
+        """Answer one decoded request."""
+        import time
+
+        command = request.get('command')
+        if command == 'status':
+            return {'pid': os.getpid(), 'root': self.root, 'requests': self.requests,
+                    'uptime': time.time() - self.started}
+        if command == 'stop':
+            return {'stopping': True}
+        if request.get('version') != self.version:
+            return {'error': 'daemon is running different scripts', 'restart': True}
+        if request.get('env') != self.environment:
+            # The cache and settings were opened for the daemon's environment
+            return {'error': 'daemon is running with a different environment'}
+        tool = request.get('tool')
+        if tool not in self.modules:
+            return {'error': f'unknown tool: {tool}'}
+        self.refresh()
+        self.requests += 1
+        reply = self.run_tool(tool, list(request.get('argv', [])))
+        if self.cache is not None:
+            self.cache.save()
+        return reply
+
+    def serve(self, sock):
+        """Answer requests until stopped, stale or idle."""
+        import json
+        import socket
+
+        sock.settimeout(self.idle_timeout)
+        while True:
+            try:
+                conn, _ = sock.accept()
+            except socket.timeout:
+                return
+            with conn:
+                conn.settimeout(10)
+                try:
+                    data = b''
+                    while True:
+                        chunk = conn.recv(65536)
+                        if not chunk:
+                            break
+                        data += chunk
+                    request = json.loads(data.decode('utf-8'))
+                    reply = self.handle(request)
+                    conn.sendall(json.dumps(reply).encode('utf-8'))
+                except (OSError, ValueError):
+                    continue
+            if reply.get('stopping') or reply.get('restart'):
+                return
+
+
+def serve(idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> int:
+    """Run the daemon for the current directory; returns once it stops."""
+    import fcntl
+    import socket
+
+    os.makedirs(os.path.dirname(SOCKET_PATH), exist_ok=True)
+    lock = open(LOCK_PATH, 'w')
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.close()
+        return 0  # Another daemon already serves this project
+
+    try:
+        daemon = Daemon('.', idle_timeout)
+        if os.path.exists(SOCKET_PATH):
+            os.unlink(SOCKET_PATH)  # Left behind by a daemon that died
+        old_umask = os.umask(0o177)  # Only the owner may connect
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.bind(SOCKET_PATH)
+        finally:
+            os.umask(old_umask)
+        try:
+            sock.listen(16)
+            daemon.serve(sock)
+        finally:
+            sock.close()
+            os.unlink(SOCKET_PATH)
+            daemon.watcher.close()
+            if daemon.cache is not None:
+                daemon.cache.save()
+    finally:
+        lock.close()
+    return 0
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Warm-cache daemon for VibeSafe tools (see VIBESAFE_DAEMON)')
+    parser.add_argument('command', choices=['serve', 'status', 'stop'])
+    parser.add_argument('--idle-timeout', type=float, metavar='SECONDS',
+                        default=float(os.environ.get('VIBESAFE_DAEMON_IDLE', DEFAULT_IDLE_TIMEOUT)),
+                        help=f'Exit after this long without requests (default: {DEFAULT_IDLE_TIMEOUT})')
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        return serve(args.idle_timeout)
+
+    try:
+        reply = _send({'command': args.command}, timeout=10)
+    except (OSError, ValueError):
+        print('No VibeSafe daemon is running for this directory')
+        return 1
+    if args.command == 'status':
+        print(f"VibeSafe daemon (pid {reply['pid']}) serving {reply['root']}: "
+              f"{reply['requests']} request(s) in {reply['uptime']:.0f}s")
+    else:
+        print('VibeSafe daemon stopped')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
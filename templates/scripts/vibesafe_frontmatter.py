@@ -0,0 +1,627 @@
+#!/usr/bin/env python3
+"""
+VibeSafe Frontmatter Support
+
+Shared helpers for reading YAML frontmatter from VibeSafe component files
+(CIPs, backlog items, requirements, tenets). Used by:
+- scripts/whats_next.py
+- scripts/validate_vibesafe_structure.py
+- backlog/update_index.py
+
+Header-only reading:
+    read_header() reads a file line by line only until the closing `---`
+    delimiter and returns a FrontmatterDocument holding the raw header and the
+    byte offset where the body starts. The body is read later, and only if a
+    caller asks for it.
+
+Fast YAML parsing:
+    parse_yaml_header() parses the flat subset VibeSafe frontmatter uses
+    (`key: scalar`, block lists of scalars, flow lists of scalars) directly,
+    resolving scalars exactly as yaml.SafeLoader does. Anything outside that
+    subset is handed to yaml.CSafeLoader (libyaml) when available, otherwise
+    to the pure-Python yaml.SafeLoader.
+
+Frontmatter cache:
+    Parsed results are persisted under .vibesafe/cache/ so that repeated runs
+    only re-parse files that actually changed. Entries are keyed by path and
+    validated against file size, mtime and a SHA-256 hash. Each tool stores
+    its own view of a file under a namespace. Whole-file namespaces are
+    invalidated when any content changes; header namespaces (lookup_header())
+    only when the frontmatter itself changes, so appending to a CIP's
+    implementation log does not force its header to be re-parsed.
+
+    Set VIBESAFE_NO_CACHE=1 to disable the cache. A long-running process can
+    keep_resident() its cache so later open_cache() calls skip loading it.
+"""
+
+import codecs
+import io
+import os
+import re
+import sys
+import threading
+import time
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
+
+from vibesafe_timings import count, count_read
+
+# PyYAML is imported by _init_parser() when the first header is parsed, and
+# hashlib/json/tempfile only by the cache code that needs them, so scripts
+# importing this module start fast on paths that never read frontmatter.
+yaml = None
+_YAMLLoader = None
+
+CACHE_DIR = os.path.join('.vibesafe', 'cache')
+CACHE_FILE = 'frontmatter.json'
+CACHE_VERSION = 2
+
+# Files modified this close (in ns) to the moment they were recorded may have
+# been rewritten within the same mtime tick, so their hash is re-checked.
+_RACY_WINDOW_NS = 2 * 1_000_000_000
+
+# Frontmatter delimiter line: three or more dashes (as python-frontmatter).
+_DELIMITER = re.compile(rb'-{3,}\s*')
+
+
+class FrontmatterDocument:
+    """A markdown file whose frontmatter header has been read, but not its body.
+
+    Attributes:
+        path: Path of the file.
+        header_bytes: Raw YAML between the delimiters, or None if the file has
+            no frontmatter.
+        body_offset: Byte offset where the body starts (0 without frontmatter).
+    """
+
+    def __init__(self, path: str, header_bytes: Optional[bytes], body_offset: int):
+        self.path = path
+        self.header_bytes = header_bytes
+        self.body_offset = body_offset
+        self._body: Optional[str] = None
+
+    @property
+    def header(self) -> Optional[str]:
+        """The YAML header as text, or None if the file has no frontmatter."""
+        if self.header_bytes is None:
+            return None
+        return self.header_bytes.decode('utf-8')
+
+    @property
+    def body(self) -> str:
+        """The full body, read from disk on first access."""
+        if self._body is None:
+            self._body = self.read_body()
+        return self._body
+
+    def read_body(self, max_chars: Optional[int] = None) -> str:
+        """Read the body (or its first max_chars characters) from disk.
+
+        Newlines are translated as for a file opened in text mode.
+        """
+        with open(self.path, 'rb') as f:
+            f.seek(self.body_offset)
+            if max_chars is None:
+                raw, at_eof = f.read(), True
+            else:
+                # UTF-8 needs at most 4 bytes per character
+                wanted = 4 * max_chars + 1
+                raw = f.read(wanted)
+                at_eof = len(raw) < wanted
+        count_read(len(raw))
+        decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(), translate=True)
+        text = decoder.decode(raw, final=at_eof)
+        return text if max_chars is None else text[:max_chars]
+
+
+def split_header(raw: bytes) -> FrontmatterDocument:
+    """Split in-memory file content the same way read_header() reads a file."""
+    return read_header(io.BytesIO(raw))
+
+
+def read_header(file_path) -> FrontmatterDocument:
+    """Read only the frontmatter header of a markdown file.
+
+    Leading blank lines are skipped; the first line must be a `---` delimiter
+    and reading stops at the next one. Files without a complete header are
+    reported with header_bytes None.
+
+    Args:
+        file_path: Path of the file (or a binary file object).
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    if hasattr(file_path, 'readline'):
+        return _read_header_from(file_path, getattr(file_path, 'name', ''))
+    with open(file_path, 'rb') as f:
+        document = _read_header_from(f, file_path)
+        count_read(f.tell())
+        return document
+
+
+def _read_header_from(f, path) -> FrontmatterDocument:
+    line = f.readline()
+    while line and not line.strip():
+        line = f.readline()
+    if not _DELIMITER.fullmatch(line.strip()):
+        return FrontmatterDocument(path, None, 0)
+
+    header = []
+    for line in iter(f.readline, b''):
+        if _DELIMITER.fullmatch(line):
+            return FrontmatterDocument(path, b''.join(header), f.tell())
+        header.append(line)
+    return FrontmatterDocument(path, None, 0)
+
+
+class _Unsupported(Exception):
+    """Raised by the fast path for YAML outside the supported subset."""
+
+
+# Plain scalars are typed with SafeLoader's own implicit resolvers and
+# constructors, so ints, bools, nulls and dates come out exactly as yaml builds them.
+_IMPLICIT_RESOLVERS = None
+_CONSTRUCTOR = None
+_STR_TAG = 'tag:yaml.org,2002:str'
+
+_LINE = re.compile(r'([A-Za-z_][A-Za-z0-9_-]*):(?: +(.*))?')
+_ITEM = re.compile(r'( *)- +(.*)')
+_SINGLE_QUOTED = re.compile(r"'((?:[^']|'')*)'")
+_DOUBLE_QUOTED = re.compile(r'"([^"\\]*)"')
+_COMMENT = re.compile(r'\s+#.*')
+# Characters that start special plain-scalar syntax or change how a line splits.
+_INDICATORS = set('-?:,[]{}#&*!|>\'"%@`')
+# Tabs, BOMs and line breaks other than \n are left to the real loader, as are
+# characters the YAML reader rejects (yaml.reader.Reader.NON_PRINTABLE).
+# Compiled by _init_parser(): the large character class takes milliseconds.
+_UNSUPPORTED_CHARS = None
+
+
+def _init_parser():
+    """Import PyYAML and set up the loader, scalar resolvers and _UNSUPPORTED_CHARS (once)."""
+    global yaml, _YAMLLoader, _IMPLICIT_RESOLVERS, _CONSTRUCTOR, _UNSUPPORTED_CHARS
+    _UNSUPPORTED_CHARS = re.compile(
+        '[\t\r\x85\u2028\u2029\ufeff]'
+        '|[^\x09\x0A\x0D\x20-\x7E\x85\xA0-\uD7FF\uE000-\uFFFD\U00010000-\U0010ffff]'
+    )
+    import yaml as yaml_module
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    _IMPLICIT_RESOLVERS = yaml_module.SafeLoader.yaml_implicit_resolvers
+    _CONSTRUCTOR = yaml_module.constructor.SafeConstructor()
+    _YAMLLoader = loader
+    yaml = yaml_module
+
+
+def _plain(text: str) -> Any:
+    """Resolve a plain (unquoted) scalar as SafeLoader would."""
+    for tag, regexp in _IMPLICIT_RESOLVERS.get(text[0], ()):
+        if regexp.match(text):
+            constructor = _CONSTRUCTOR.yaml_constructors.get(tag)
+            if constructor is None:
+                # e.g. merge keys (<<) and the value tag (=)
+                raise _Unsupported(text)
+            try:
+                return constructor(_CONSTRUCTOR, yaml.ScalarNode(tag, text))
+            except ValueError:
+                raise _Unsupported(text)
+    return text
+
+
+def _scalar(text: str, flow: bool = False) -> Any:
+    """Parse one scalar (comment already removed), or raise _Unsupported."""
+    if not text:
+        raise _Unsupported(text)
+    match = _SINGLE_QUOTED.fullmatch(text)
+    if match:
+        return match.group(1).replace("''", "'")
+    match = _DOUBLE_QUOTED.fullmatch(text)
+    if match:
+        return match.group(1)
+    if (text[0] in _INDICATORS or text[-1] == ':' or ': ' in text or ' #' in text
+            or (flow and any(c in text for c in ',[]{}'))):
+        raise _Unsupported(text)
+    return _plain(text)
+
+
+def _strip_comment(text: str) -> str:
+    """Remove a trailing `# comment` from a value, respecting quotes."""
+    if text[:1] in ('"', "'"):
+        pattern = _DOUBLE_QUOTED if text[0] == '"' else _SINGLE_QUOTED
+        match = pattern.match(text)
+        if not match:
+            raise _Unsupported(text)
+        rest = text[match.end():]
+        if rest and not _COMMENT.fullmatch(rest):
+            raise _Unsupported(text)
+        return match.group(0)
+    if text.startswith('['):
+        end = text.find(']')
+        rest = text[end + 1:] if end >= 0 else ''
+        if rest and _COMMENT.fullmatch(rest):
+            return text[:end + 1]
+        return text
+    return _COMMENT.sub('', text, count=1) if ' #' in text else text
+
+
+def _value(text: str) -> Any:
+    text = _strip_comment(text)
+    if text.startswith('[') and text.endswith(']'):
+        inner = text[1:-1].strip()
+        if not inner:
+            return []
+        return [_scalar(item.strip(), flow=True) for item in inner.split(',')]
+    return _scalar(text)
+
+
+def _parse_flat(text: str) -> Optional[Dict[str, Any]]:
+    """Parse the flat frontmatter subset, raising _Unsupported otherwise."""
+    if yaml is None:
+        _init_parser()
+    text = text.replace('\r\n', '\n')
+    if _UNSUPPORTED_CHARS.search(text):
+        raise _Unsupported('line structure')
+    result: Dict[str, Any] = {}
+    list_key = None  # key whose block list is being read
+    list_indent = None
+    for line in text.split('\n'):
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        if not line[0].isspace() and not line.startswith('-'):
+            match = _LINE.fullmatch(line.rstrip())
+            if not match or _plain(match.group(1)) != match.group(1):
+                raise _Unsupported(line)
+            key, raw = match.group(1), match.group(2)
+            raw = raw.strip() if raw else ''
+            if not raw or raw.startswith('#'):
+                result[key] = None
+                list_key, list_indent = key, None
+            else:
+                result[key] = _value(raw)
+                list_key = None
+            continue
+        match = _ITEM.fullmatch(line.rstrip())
+        if not match or list_key is None:
+            raise _Unsupported(line)
+        indent = len(match.group(1))
+        if list_indent is None:
+            list_indent = indent
+            result[list_key] = []
+        elif indent != list_indent:
+            raise _Unsupported(line)
+        item = _strip_comment(match.group(2).strip())
+        if item.startswith('['):
+            raise _Unsupported(line)
+        result[list_key].append(_scalar(item))
+    return result or None
+
+
+def parse_yaml_header(text: str) -> Any:
+    """Parse a frontmatter header with the same result as yaml.safe_load().
+
+    The flat subset used by VibeSafe components is parsed directly; anything
+    else falls back to libyaml (CSafeLoader), then to yaml.SafeLoader.
+
+    Raises:
+        yaml.YAMLError: If the header is not valid YAML.
+    """
+    count('yaml_parses')
+    try:
+        return _parse_flat(text)
+    except _Unsupported:
+        return yaml.load(text, Loader=_YAMLLoader)
+
+
+def _encode(value: Any) -> Any:
+    """Convert a parsed YAML value into a JSON-serializable structure.
+
+    Dates and datetimes (which yaml.safe_load produces for unquoted dates) are
+    tagged so they round-trip to the same Python types.
+
+    Raises:
+        TypeError: If the value contains a type that cannot be represented.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    if isinstance(value, dict):
+        if not all(isinstance(k, str) for k in value):
+            raise TypeError("Only string keys can be cached")
+        return {'__dict__': {k: _encode(v) for k, v in value.items()}}
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def _decode(value: Any) -> Any:
+    """Inverse of _encode(). Always returns fresh (mutable) objects."""
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    if isinstance(value, dict):
+        if '__dict__' in value:
+            return {k: _decode(v) for k, v in value['__dict__'].items()}
+        if '__date__' in value:
+            return date.fromisoformat(value['__date__'])
+        if '__datetime__' in value:
+            return datetime.fromisoformat(value['__datetime__'])
+    return value
+
+
+def _header_digest(doc: FrontmatterDocument) -> str:
+    import hashlib
+
+    if doc.header_bytes is None:
+        return 'none'
+    return hashlib.sha256(doc.header_bytes).hexdigest()
+
+
+class FrontmatterCache:
+    """Persistent per-file cache of parsed frontmatter.
+
+    Usage:
+        cache = FrontmatterCache('.')
+        metadata = cache.lookup_header('cip/cip0001.md', 'whats_next', parse_header)
+        fields = cache.lookup('backlog/features/task.md', 'update_index', parse)
+        cache.save()
+
+    `parse` receives the decoded file text (lookup) or the header text, None
+    without frontmatter (lookup_header), and returns the value to cache. If it
+    raises, nothing is cached and the exception propagates.
+
+    Lookups may be made from several threads at once (whats_next --jobs);
+    save() must not run concurrently with them.
+    """
+
+    def __init__(self, root_dir: str = '.', cache_dir: Optional[str] = None):
+        self.root_dir = os.path.abspath(root_dir)
+        self.cache_dir = cache_dir or os.path.join(self.root_dir, CACHE_DIR)
+        self.cache_path = os.path.join(self.cache_dir, CACHE_FILE)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        self._removed = set()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        import json
+
+        try:
+            with open(self.cache_path, 'rb') as f:
+                raw = f.read()
+            count_read(len(raw))
+            data = json.loads(raw.decode('utf-8'))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == CACHE_VERSION:
+            entries = data.get('entries')
+            if isinstance(entries, dict):
+                self.entries = entries
+
+    def _key(self, file_path: str) -> str:
+        return os.path.relpath(os.path.abspath(file_path), self.root_dir)
+
+    def _fresh(self, entry: Optional[Dict[str, Any]], st: os.stat_result) -> bool:
+        """True if the entry was recorded for exactly this (settled) file state."""
+        return (
+            entry is not None
+            and entry['size'] == st.st_size
+            and entry['mtime_ns'] == st.st_mtime_ns
+            and entry['checked_ns'] - st.st_mtime_ns > _RACY_WINDOW_NS
+        )
+
+    def _entry(self, key: str, st: os.stat_result) -> Dict[str, Any]:
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = {'sha256': None, 'values': {}, 'header_sha256': None, 'header_values': {}}
+            self.entries[key] = entry
+        entry['size'] = st.st_size
+        entry['mtime_ns'] = st.st_mtime_ns
+        entry['checked_ns'] = time.time_ns()
+        self.dirty = True
+        return entry
+
+    def _value(self, values: Dict[str, Any], namespace: str, parse: Callable[[Any], Any], arg: Any) -> Any:
+        if namespace in values:
+            self.hits += 1
+            return _decode(values[namespace])
+        self.misses += 1
+        value = parse(arg)
+        self._store(values, namespace, value)
+        return value
+
+    def _store(self, values: Dict[str, Any], namespace: str, value: Any):
+        try:
+            values[namespace] = _encode(value)
+        except TypeError:
+            # Exotic YAML types are simply not cached.
+            pass
+
+    def lookup(self, file_path: str, namespace: str, parse: Callable[[str], Any]) -> Any:
+        """Return the cached value derived from a whole file, re-parsing only if it changed.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        key = self._key(str(file_path))
+        st = os.stat(file_path)
+        entry = self.entries.get(key)
+        if self._fresh(entry, st) and namespace in entry['values']:
+            self.hits += 1
+            return _decode(entry['values'][namespace])
+
+        import hashlib
+
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        count_read(len(raw))
+        digest = hashlib.sha256(raw).hexdigest()
+        header_digest = _header_digest(split_header(raw))
+
+        with self._lock:
+            entry = self._entry(key, st)
+            if entry['sha256'] != digest:
+                entry['sha256'] = digest
+                entry['values'] = {}
+            if entry['header_sha256'] != header_digest:
+                entry['header_sha256'] = header_digest
+                entry['header_values'] = {}
+            values = entry['values']
+        return self._value(values, namespace, parse, raw.decode('utf-8'))
+
+    def _header_entry(self, file_path: str, namespace: str) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Return the header values of a file's entry and its header text.
+
+        The header is only read (and the entry refreshed) when namespace has
+        no value for the file's current state; otherwise the header is None.
+        """
+        key = self._key(str(file_path))
+        st = os.stat(file_path)
+        entry = self.entries.get(key)
+        if self._fresh(entry, st) and namespace in entry['header_values']:
+            return entry['header_values'], None
+
+        doc = read_header(file_path)
+        header_digest = _header_digest(doc)
+
+        with self._lock:
+            # Another thread may have refreshed the entry meanwhile
+            entry = self.entries.get(key)
+            fresh = self._fresh(entry, st)
+            entry = self._entry(key, st)
+            if not fresh:
+                # The body may have changed too; whole-file values can't be trusted.
+                entry['sha256'] = None
+                entry['values'] = {}
+            if entry['header_sha256'] != header_digest:
+                entry['header_sha256'] = header_digest
+                entry['header_values'] = {}
+            return entry['header_values'], doc.header
+
+    def lookup_header(self, file_path: str, namespace: str, parse: Callable[[Optional[str]], Any]) -> Any:
+        """Return the cached value derived from a file's frontmatter header.
+
+        Only the header is read when the file changed; edits to the body keep
+        the cached value valid.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        values, header = self._header_entry(file_path, namespace)
+        return self._value(values, namespace, parse, header)
+
+    def lookup_headers(self, file_paths: List[str], namespace: str,
+                       parse_many: Callable[[List[Optional[str]]], List[Any]], default: Any = None) -> List[Any]:
+        """lookup_header() for many files, parsing all misses with one parse_many() call.
+
+        parse_many receives the header texts of the files without a cached
+        value and returns their values in the same order, so the parsing can
+        be spread over several processes. Files that cannot be read get default.
+        """
+        results = [default] * len(file_paths)
+        misses = []
+        for i, file_path in enumerate(file_paths):
+            try:
+                values, header = self._header_entry(file_path, namespace)
+            except OSError:
+                continue
+            if namespace in values:
+                self.hits += 1
+                results[i] = _decode(values[namespace])
+            else:
+                misses.append((i, values, header))
+
+        if misses:
+            parsed = parse_many([header for _i, _values, header in misses])
+            for (i, values, _header), value in zip(misses, parsed):
+                self.misses += 1
+                self._store(values, namespace, value)
+                results[i] = value
+        return results
+
+    def prune(self):
+        """Drop entries for files that no longer exist."""
+        for key in list(self.entries):
+            if not os.path.exists(os.path.join(self.root_dir, key)):
+                del self.entries[key]
+                self._removed.add(key)
+                self.dirty = True
+
+    def save(self):
+        """Write the cache to disk atomically, merging with concurrent writers.
+
+        Entries written by another tool since we loaded are kept; when both
+        sides know a file with the same content (or header), their namespaces
+        are merged. Failures are ignored: the cache is an optimization, never a
+        requirement.
+        """
+        import json
+        import tempfile
+
+        if not self.dirty:
+            return
+        on_disk = FrontmatterCache.__new__(FrontmatterCache)
+        on_disk.cache_path = self.cache_path
+        on_disk.entries = {}
+        on_disk._load()
+        merged = on_disk.entries
+        for key in self._removed:
+            merged.pop(key, None)
+        for key, entry in self.entries.items():
+            other = merged.get(key)
+            if other is not None:
+                entry = dict(entry)
+                for hash_key, values_key in (('sha256', 'values'), ('header_sha256', 'header_values')):
+                    if entry[hash_key] is not None and other.get(hash_key) == entry[hash_key]:
+                        entry[values_key] = dict(other.get(values_key, {}), **entry[values_key])
+            merged[key] = entry
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.frontmatter-', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'version': CACHE_VERSION, 'entries': merged}, f, separators=(',', ':'))
+                os.replace(tmp_path, self.cache_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+        except OSError:
+            return
+        self.entries = merged
+        self._removed = set()
+        self.dirty = False
+
+
+# Caches held in memory by a long-running process (scripts/vibesafe_daemon.py),
+# keyed by absolute project root. open_cache() hands these out instead of
+# loading the cache file again.
+_resident_caches: Dict[str, FrontmatterCache] = {}
+
+
+def keep_resident(cache: FrontmatterCache):
+    """Make open_cache() return this cache for its project from now on."""
+    _resident_caches[cache.root_dir] = cache
+
+
+def open_cache(root_dir: str = '.') -> Optional[FrontmatterCache]:
+    """Open the frontmatter cache for a project, or None if disabled."""
+    if os.environ.get('VIBESAFE_NO_CACHE', '').strip().lower() in ('1', 'true', 'yes'):
+        return None
+    resident = _resident_caches.get(os.path.abspath(root_dir))
+    if resident is not None:
+        return resident
+    return FrontmatterCache(root_dir)
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+VibeSafe Git State
+
+The repository state shared by whats_next.py and validate_vibesafe_structure.py:
+branch, upstream, ahead/behind counts, changed tracked files (with renames)
+and untracked files, read with one `git status --porcelain=v2 --branch -z`:
+
+    state = read_git_state('.', recent_commits=5)
+    if state is not None:
+        print(state.branch, state.upstream, state.changed_paths())
+
+Paths come NUL-separated, so names with spaces, quotes or non-ASCII
+characters need no unquoting, and renames carry their original path. All
+paths are relative to the directory the state was read for, even when that
+is a subdirectory of the repository.
+
+Untracked files are listed for the whole repository as git status does,
+with untracked directories collapsed to one entry, so a large build
+directory costs one entry rather than a walk. The untracked files below
+the component directories (UNTRACKED_PATHSPECS) can be asked for one by
+one, for component scanning; they are listed by a `git ls-files --others`
+started alongside the status. The commit log, when asked for, is one more
+process running at the same time.
+"""
+
+import os
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+# The other VibeSafe helpers are installed alongside this module
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
+
+from vibesafe_timings import count
+
+# Where untracked files matter to component scanning: components, VibeSafe's
+# own scripts and tests, and the top-level files the governance drift checks know
+UNTRACKED_PATHSPECS = (
+    'cip', 'backlog', 'requirements', 'tenets',
+    'scripts', 'templates', 'tests',
+    'install-minimal.sh', 'install-whats-next.sh', 'whats-next', 'combine_tenets.py',
+)
+
+
+class GitState:
+    """What `git status` and `git log` report for a working tree.
+
+    Attributes:
+        head: Commit id of HEAD, None before the first commit
+        branch: Current branch, '' when HEAD is detached
+        upstream: Upstream branch (e.g. 'origin/main'), None if not set
+        ahead: Commits ahead of upstream, None without upstream
+        behind: Commits behind upstream, None without upstream
+        changes: Changed tracked files as {'status', 'path', 'orig_path'}
+            dicts; status is the short XY code without '.' placeholders
+            (e.g. 'M', 'A', 'RM', 'UU') and orig_path is set for renames
+            and copies
+        untracked: Untracked files anywhere in the repository; wholly
+            untracked directories are one entry ending with '/'
+        component_untracked: Untracked files below the pathspecs given to
+            read_git_state(), one entry per file
+        recent_commits: {'hash', 'message'} dicts, newest first
+    """
+
+    def __init__(self):
+        self.head: Optional[str] = None
+        self.branch = ''
+        self.upstream: Optional[str] = None
+        self.ahead: Optional[int] = None
+        self.behind: Optional[int] = None
+        self.changes: List[Dict[str, Any]] = []
+        self.untracked: List[str] = []
+        self.component_untracked: List[str] = []
+        self.recent_commits: List[Dict[str, str]] = []
+
+    def changed_paths(self) -> List[str]:
+        """Paths of changed and untracked files (the new path of renames)."""
+        return [change['path'] for change in self.changes] + self.untracked
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode('utf-8', 'surrogateescape')
+
+
+def _relative_to(path: str, prefix: str) -> str:
+    """Make a repository-relative path relative to the directory at prefix ('sub/dir/' or '')."""
+    if path.startswith(prefix):
+        return path[len(prefix):]
+    import posixpath
+
+    relative = posixpath.relpath(path, prefix.rstrip('/'))
+    return relative + '/' if path.endswith('/') else relative
+
+
+def parse_status(output: bytes, prefix: str = '') -> GitState:
+    """Parse the output of `git status --porcelain=v2 --branch -z`.
+
+    Args:
+        output: The status output; its paths are relative to the repository root
+        prefix: Path of the directory paths are made relative to, from the
+            repository root and ending with '/' (`git rev-parse --show-prefix`)
+    """
+    state = GitState()
+    fields = output.split(b'\0')
+    i = 0
+    while i < len(fields):
+        field = _decode(fields[i])
+        i += 1
+        if not field:
+            continue
+        kind = field[0]
+        if kind == '#':
+            _, key, value = (field.split(' ', 2) + [''])[:3]
+            if key == 'branch.oid':
+                state.head = None if value == '(initial)' else value
+            elif key == 'branch.head':
+                state.branch = '' if value == '(detached)' else value
+            elif key == 'branch.upstream':
+                state.upstream = value
+            elif key == 'branch.ab':
+                ahead, behind = value.split()
+                state.ahead, state.behind = int(ahead), abs(int(behind))
+        elif kind in '12u':
+            # 1 XY sub mH mI mW hH hI path
+            # 2 XY sub mH mI mW hH hI Xscore path NUL origPath
+            # u XY sub m1 m2 m3 mW h1 h2 h3 path
+            parts = field.split(' ', {'1': 8, '2': 9, 'u': 10}[kind])
+            change = {'status': parts[1].replace('.', ''), 'path': _relative_to(parts[-1], prefix), 'orig_path': None}
+            if kind == '2':
+                change['orig_path'] = _relative_to(_decode(fields[i]), prefix)
+                i += 1
+            state.changes.append(change)
+        elif kind == '?':
+            state.untracked.append(_relative_to(field[2:], prefix))
+    return state
+
+
+def parse_log(output: str) -> List[Dict[str, str]]:
+    """Parse the output of `git log --oneline`."""
+    return [
+        {'hash': line.split(' ')[0], 'message': ' '.join(line.split(' ')[1:])}
+        for line in output.split('\n') if line.strip()
+    ]
+
+
+def read_git_state(root_dir: str = '.', component_pathspecs: Optional[Sequence[str]] = None,
+                   recent_commits: int = 0) -> Optional[GitState]:
+    """Read the state of the working tree at root_dir.
+
+    Args:
+        root_dir: Directory inside the working tree; paths are relative to it
+        component_pathspecs: Paths (relative to root_dir) to list each
+            untracked file under in component_untracked, e.g.
+            UNTRACKED_PATHSPECS; None to skip that listing
+        recent_commits: Number of commits to read from `git log` (0 for none)
+
+    Returns:
+        The state, or None if root_dir is not in a git work tree or git is
+        not installed.
+    """
+    import subprocess
+
+    def start(*args: str) -> subprocess.Popen:
+        count('subprocesses')
+        return subprocess.Popen(['git', '-C', root_dir, *args],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+    try:
+        status = start('status', '--porcelain=v2', '--branch', '-z', '--untracked-files=normal')
+        prefix = start('rev-parse', '--show-prefix')
+        others = None
+        if component_pathspecs:
+            others = start('ls-files', '--others', '--exclude-standard', '-z',
+                           '--', *(f':(literal){path}' for path in component_pathspecs))
+        log = start('log', '--oneline', '-n', str(recent_commits)) if recent_commits else None
+    except OSError:
+        return None
+
+    output = status.communicate()[0]
+    prefix_output = prefix.communicate()[0]
+    listed = others.communicate()[0] if others is not None else b''
+    log_output = log.communicate()[0] if log is not None else b''
+    if status.returncode != 0:
+        return None
+
+    state = parse_status(output, _decode(prefix_output).strip() if prefix.returncode == 0 else '')
+    if others is not None and others.returncode == 0:
+        # ls-files paths are already relative to root_dir
+        state.component_untracked = [_decode(path) for path in listed.split(b'\0') if path]
+    if log is not None and log.returncode == 0:
+        state.recent_commits = parse_log(_decode(log_output).strip())
+    return state
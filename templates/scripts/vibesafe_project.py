@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+VibeSafe Project Model
+
+A single os.scandir() walk over a VibeSafe project that records what the tools
+need to know about its layout:
+- every file under the component directories (cip/, backlog/, requirements/, tenets/)
+- the files at the project root
+- whether the project contains source code
+
+whats_next.py builds one model per run and every section (CIPs, backlog,
+requirements, tenets, gap detection, structure validation) reads from it
+instead of walking the tree again with glob/rglob.
+
+The component directories are VibeSafe's own and small, and some of their
+files are gitignored by the installer, so they are always read from disk.
+Whether the rest of the tree contains code is asked of git
+(`git ls-files -co --exclude-standard`) inside a repository, so ignored
+trees (dist/, build/, data, vendored code) are never walked; elsewhere a
+walk pruned by CODE_EXCLUDE_DIRS is used.
+"""
+
+import fnmatch
+import os
+import sys
+from typing import Dict, List, Optional
+
+# The other VibeSafe helpers are installed alongside this module
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
+
+from vibesafe_timings import count
+
+COMPONENT_DIRS = ('cip', 'backlog', 'requirements', 'tenets')
+
+SOURCE_EXTENSIONS = {'.py', '.js', '.ts', '.jsx', '.tsx', '.go', '.rs', '.java',
+                     '.c', '.cpp', '.h', '.hpp', '.rb', '.php', '.swift', '.kt'}
+
+# Common source directories: any source file below these counts as code.
+SOURCE_DIRS = ('src', 'lib', 'app', 'pkg', 'internal', 'core')
+
+# VibeSafe system directories and other directories that never count as code.
+CODE_EXCLUDE_DIRS = {
+    'scripts',  # VibeSafe system scripts
+    'templates',  # VibeSafe templates
+    '.venv', '.venv-vibesafe',  # Virtual environments
+    'node_modules', '__pycache__', '.git',  # Dependencies and system
+    'venv', 'env',  # Other common venv names
+    'cip', 'backlog', 'tenets', 'requirements',  # VibeSafe components
+    'docs', 'doc', 'documentation',  # Documentation
+    '.cursor', '.vscode', '.idea',  # IDE directories
+}
+
+# Root-level Python files that do not indicate a codebase on their own.
+ROOT_CODE_IGNORE = {'setup.py', 'conftest.py'}
+
+
+def _normalize(rel_path: str) -> str:
+    """Normalize a relative path, using '' for the project root."""
+    rel_path = os.path.normpath(rel_path)
+    return '' if rel_path == os.curdir else rel_path
+
+
+class ProjectModel:
+    """In-memory snapshot of a project's VibeSafe-relevant layout.
+
+    Paths are relative to the project root and joined with os.path.join, so
+    they match what glob.glob() would return when run from the root.
+    """
+
+    def __init__(self, root: str = '.'):
+        self.root = root
+        # Relative directory ('' for the root) -> sorted file names.
+        self.dirs: Dict[str, List[str]] = {}
+        self.has_code = False
+
+    def is_dir(self, rel_dir: str) -> bool:
+        """Return True if the directory was seen during the scan."""
+        return _normalize(rel_dir) in self.dirs
+
+    def exists(self, rel_path: str) -> bool:
+        """Return True if a scanned file or directory exists at rel_path."""
+        rel_path = _normalize(rel_path)
+        if rel_path in self.dirs:
+            return True
+        parent, name = os.path.split(rel_path)
+        return name in self.dirs.get(parent, ())
+
+    def files(self, rel_dir: str, pattern: str = '*') -> List[str]:
+        """List files directly inside rel_dir, like sorted(glob.glob(f'{rel_dir}/{pattern}')).
+
+        As with glob, names starting with '.' only match patterns that do.
+        """
+        rel_dir = _normalize(rel_dir)
+        match_hidden = pattern.startswith('.')
+        return [
+            os.path.join(rel_dir, name)
+            for name in self.dirs.get(rel_dir, ())
+            if fnmatch.fnmatch(name, pattern) and (match_hidden or not name.startswith('.'))
+        ]
+
+    def walk(self, rel_dir: str, pattern: str = '*') -> List[str]:
+        """List files under rel_dir recursively, like Path(rel_dir).rglob(pattern).
+
+        Results are sorted by path. Hidden files are included, as with pathlib.
+        """
+        rel_dir = _normalize(rel_dir)
+        prefix = rel_dir + os.sep if rel_dir else ''
+        results = []
+        for directory, names in self.dirs.items():
+            if directory != rel_dir and not directory.startswith(prefix):
+                continue
+            results.extend(os.path.join(directory, name) for name in names if fnmatch.fnmatch(name, pattern))
+        return sorted(results)
+
+    def refresh(self, rel_path: str) -> None:
+        """Bring the model up to date for one path that changed on disk.
+
+        A directory is re-scanned in full; a file is added to or removed from
+        its parent's listing. Used by whats_next.py --watch.
+        """
+        rel_path = _normalize(rel_path)
+        full_path = os.path.join(self.root, rel_path)
+        prefix = rel_path + os.sep
+        if os.path.isdir(full_path) or rel_path in self.dirs:
+            for directory in [d for d in self.dirs if d == rel_path or d.startswith(prefix)]:
+                del self.dirs[directory]
+            if os.path.isdir(full_path):
+                _record_tree(self, rel_path)
+        parent, name = os.path.split(rel_path)
+        if parent not in self.dirs:
+            return
+        names = set(self.dirs[parent])
+        if os.path.isfile(full_path) and not os.path.isdir(full_path):
+            names.add(name)
+        else:
+            names.discard(name)
+        self.dirs[parent] = sorted(names)
+
+
+def _scandir(path: str) -> List[os.DirEntry]:
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def _record_tree(model: ProjectModel, rel_dir: str) -> None:
+    """Record every file below rel_dir (a component directory)."""
+    pending = [rel_dir]
+    while pending:
+        current = pending.pop()
+        names = []
+        for entry in _scandir(os.path.join(model.root, current)):
+            if entry.is_dir(follow_symlinks=False):
+                pending.append(os.path.join(current, entry.name))
+            else:
+                names.append(entry.name)
+        model.dirs[current] = sorted(names)
+
+
+def _contains_code(path: str, prune: bool) -> bool:
+    """Return True as soon as a source file is found below path.
+
+    With prune=True, directories named in CODE_EXCLUDE_DIRS are skipped.
+    """
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        for entry in _scandir(current):
+            if prune and entry.name in CODE_EXCLUDE_DIRS:
+                continue
+            if os.path.splitext(entry.name)[1] in SOURCE_EXTENSIONS:
+                return True
+            if entry.is_dir(follow_symlinks=False):
+                pending.append(entry.path)
+    return False
+
+
+def _counts_as_code(rel_path: str) -> bool:
+    """Whether a source file below the root counts as code, as the walk below decides."""
+    parts = rel_path.split('/')
+    top = parts[0]
+    if len(parts) == 1 or top in COMPONENT_DIRS:
+        return False
+    if top in SOURCE_DIRS:
+        return True
+    if top in CODE_EXCLUDE_DIRS or top.startswith('.'):
+        return False
+    return not any(part in CODE_EXCLUDE_DIRS for part in parts[1:-1])
+
+
+def _git_has_code(root: str) -> Optional[bool]:
+    """Ask git whether the project has code outside its root directory.
+
+    Lists tracked and untracked, not ignored, source files and stops at the
+    first that counts. Returns None if root is not in a git work tree.
+    """
+    import subprocess
+
+    pathspecs = [f'*{extension}' for extension in sorted(SOURCE_EXTENSIONS)]
+    count('subprocesses')
+    try:
+        process = subprocess.Popen(
+            ['git', '-C', root, 'ls-files', '--cached', '--others', '--exclude-standard', '-z', '--', *pathspecs],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return None
+    found = False
+    pending = b''
+    try:
+        for chunk in iter(lambda: process.stdout.read1(65536), b''):
+            *paths, pending = (pending + chunk).split(b'\0')
+            if any(_counts_as_code(path.decode('utf-8', 'surrogateescape')) for path in paths):
+                found = True
+                process.kill()
+                break
+    finally:
+        process.stdout.close()
+        process.wait()
+    if found:
+        return True
+    return False if process.returncode == 0 else None
+
+
+def scan_project(root: str = '.', detect_code: bool = True) -> ProjectModel:
+    """Walk the project once and build its ProjectModel.
+
+    Component directories are recorded in full. Other top-level directories are
+    only searched for source code, through git when root is in a repository,
+    stopping at the first source file found. With detect_code=False that
+    search is skipped (the validator has no use for it).
+    """
+    model = ProjectModel(root)
+
+    root_files = []
+    code_dirs = []
+    for entry in _scandir(root):
+        if not entry.is_dir():
+            root_files.append(entry.name)
+            if entry.name.endswith('.py') and entry.name not in ROOT_CODE_IGNORE:
+                model.has_code = True
+        elif entry.name in COMPONENT_DIRS:
+            _record_tree(model, entry.name)
+        elif entry.name in SOURCE_DIRS:
+            code_dirs.append((entry.path, False))
+        elif entry.name not in CODE_EXCLUDE_DIRS and not entry.name.startswith('.'):
+            code_dirs.append((entry.path, True))
+    model.dirs[''] = sorted(root_files)
+
+    if detect_code and not model.has_code and code_dirs:
+        has_code = _git_has_code(root)
+        if has_code is not None:
+            model.has_code = has_code
+            return model
+        # Not a repository: well-known source directories first, then everything else.
+        for path, prune in sorted(code_dirs, key=lambda d: (d[1], d[0])):
+            if _contains_code(path, prune):
+                model.has_code = True
+                break
+
+    return model
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+VibeSafe Prompt Generation
+
+Generates the AI assistant context files of every platform from VibeSafe's
+base prompts (templates/prompts/always-apply and context-specific) and the
+project's tenets, in one pass:
+
+    cursor    .cursor/rules/<prompt>.mdc, and project_tenet_<id>.mdc per tenet
+    copilot   .github/copilot-instructions.md
+    claude    CLAUDE.md
+    codex     AGENTS.md
+
+Each prompt and tenet is read once, however many platforms use it. A file is
+only written when its content changes, and .vibesafe/prompts.json lists every
+output with its hash and sources. Outputs of a generated platform that are no
+longer produced (their prompt was removed upstream) are deleted, unless they
+were edited since they were generated.
+
+install-minimal.sh runs it from the project root:
+
+    python3 vibesafe_prompts.py --prompts-dir <vibesafe>/templates/prompts \\
+        --platform all --tenets-dir tenets
+
+Tenet rules are produced by the project's tenets/combine_tenets.py, which
+keeps rules edited by hand as they are. If that fails, the base outputs are
+still generated and recorded, and the exit code is 3.
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+PLATFORMS = ('cursor', 'copilot', 'claude', 'codex')
+
+PROMPT_KINDS = ('always-apply', 'context-specific')
+
+MANIFEST_FILE = os.path.join('.vibesafe', 'prompts.json')
+MANIFEST_VERSION = 1
+
+CURSOR_RULES_DIR = os.path.join('.cursor', 'rules')
+
+# Cursor rule descriptions, and for context-specific prompts the files they apply to
+CURSOR_DESCRIPTIONS = {
+    'vibesafe_general': "VibeSafe General Development Guidelines - Best practices for working with VibeSafe projects",
+    'vibesafe_update': "VibeSafe Update Guide",
+    'whats_next': "VibeSafe What's Next Script - Project status summarizer for understanding project state and identifying pending tasks",
+    'backlog': "VibeSafe Backlog System - Task tracking and project management guidelines",
+    'cip': "Code Improvement Plans (CIPs) - Structured process for planning and implementing significant code changes",
+    'requirements': "VibeSafe Requirements - Defining WHAT needs to be built (outcomes), not HOW to build it (implementation)",
+    'tenets': "VibeSafe Tenets - Guiding principles that inform project decision-making",
+}
+
+# Combined context file of each platform, and the introduction it starts with
+COMBINED_OUTPUTS = {
+    'copilot': (os.path.join('.github', 'copilot-instructions.md'), [
+        "# VibeSafe Project Guidelines for GitHub Copilot",
+        "",
+        "This file provides context to GitHub Copilot about the VibeSafe project structure,",
+        "development practices, and component-specific guidance.",
+    ]),
+    'claude': ('CLAUDE.md', [
+        "# VibeSafe Project Memory for Claude Code",
+        "",
+        "This file provides project context and guidelines to Claude Code (Anthropic's coding assistant).",
+        "Claude will use this information to understand the VibeSafe project structure, development",
+        "practices, and component-specific guidance.",
+    ]),
+    'codex': ('AGENTS.md', [
+        "# VibeSafe Project Documentation for Codex",
+        "",
+        "This file provides project context and guidelines to OpenAI Codex (and compatible AI coding assistants).",
+        "The information below helps understand the VibeSafe project structure, development practices,",
+        "and component-specific guidance.",
+    ]),
+}
+
+
+class Prompt:
+    """A base prompt, read once.
+
+    Attributes:
+        kind: 'always-apply' or 'context-specific'
+        name: File name without .md (e.g. 'cip')
+        path: Path of the prompt file
+        content: Raw bytes of the file
+    """
+
+    def __init__(self, kind: str, name: str, path: str, content: bytes):
+        self.kind = kind
+        self.name = name
+        self.path = path
+        self.content = content
+
+    @property
+    def source(self) -> str:
+        """Where the prompt lives in a VibeSafe checkout, as recorded in the manifest."""
+        return f"templates/prompts/{self.kind}/{self.name}.md"
+
+
+def read_prompts(prompts_dir: str) -> List[Prompt]:
+    """Read the base prompts, always-apply first, each kind in name order."""
+    prompts = []
+    for kind in PROMPT_KINDS:
+        kind_dir = os.path.join(prompts_dir, kind)
+        try:
+            names = sorted(name for name in os.listdir(kind_dir) if name.endswith('.md'))
+        except OSError:
+            continue
+        for name in names:
+            path = os.path.join(kind_dir, name)
+            if not os.path.isfile(path):
+                continue
+            with open(path, 'rb') as f:
+                prompts.append(Prompt(kind, name[:-len('.md')], path, f.read()))
+    return prompts
+
+
+def cursor_rule(prompt: Prompt) -> bytes:
+    """A prompt as a Cursor .mdc rule with YAML frontmatter."""
+    description = CURSOR_DESCRIPTIONS.get(prompt.name, f"VibeSafe {prompt.name} guidance")
+    if prompt.kind == 'always-apply':
+        globs = '"**/*"'
+    else:
+        globs = f"{prompt.name}/**/*.md"
+    header = f"---\ndescription: {description}\nglobs: {globs}\nalwaysApply: true\n---\n"
+    return header.encode('utf-8') + prompt.content
+
+
+def combined_context(platform: str, prompts: Sequence[Prompt]) -> bytes:
+    """All prompts in one file, after the platform's introduction, separated by rules."""
+    _path, intro = COMBINED_OUTPUTS[platform]
+    parts = ['\n'.join(intro + ['', '---', '', '']).encode('utf-8')]
+    for prompt in prompts:
+        parts.append(prompt.content)
+        parts.append(b"\n---\n\n")
+    return b''.join(parts)
+
+
+def plan_outputs(prompts: Sequence[Prompt], platforms: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+    """Return {path: {'platform', 'content', 'sources'}} for the base prompt outputs."""
+    outputs = {}
+    for platform in platforms:
+        if platform == 'cursor':
+            for prompt in prompts:
+                outputs[os.path.join(CURSOR_RULES_DIR, f"{prompt.name}.mdc")] = {
+                    'platform': platform, 'content': cursor_rule(prompt), 'sources': [prompt.source],
+                }
+        else:
+            outputs[COMBINED_OUTPUTS[platform][0]] = {
+                'platform': platform,
+                'content': combined_context(platform, prompts),
+                'sources': [prompt.source for prompt in prompts],
+            }
+    return outputs
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_sha256(path: str) -> Optional[str]:
+    try:
+        with open(path, 'rb') as f:
+            return _sha256(f.read())
+    except OSError:
+        return None
+
+
+def load_manifest(path: str) -> Dict[str, Any]:
+    """Read the outputs manifest, or an empty one if it is missing or unreadable."""
+    import json
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = None
+    if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION:
+        manifest = {'version': MANIFEST_VERSION, 'outputs': {}}
+    return manifest
+
+
+def save_manifest(path: str, manifest: Dict[str, Any]):
+    """Write the outputs manifest atomically."""
+    import json
+    import tempfile
+
+    manifest_dir = os.path.dirname(path) or '.'
+    os.makedirs(manifest_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=manifest_dir, prefix='.prompts-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+            f.write('\n')
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _load_combine_tenets(path: str):
+    """Import the project's combine_tenets.py, or return None if it predates TenetBuild."""
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location('_vibesafe_combine_tenets', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module if hasattr(module, 'TenetBuild') else None
+
+
+def generate(prompts_dir: str, platforms: Sequence[str], tenets_dir: Optional[str] = None,
+             root: str = '.') -> Dict[str, List[str]]:
+    """Generate the context files of platforms in root.
+
+    Args:
+        prompts_dir: templates/prompts directory of a VibeSafe checkout
+        platforms: Platforms to generate (from PLATFORMS)
+        tenets_dir: The project's tenets directory; tenet rules are
+            generated for cursor if given and it has combine_tenets.py
+        root: Project root the outputs and manifest are written to
+
+    Returns:
+        {'written', 'unchanged', 'removed'}: output paths, relative to root,
+        and 'tenet_error': why the tenet rules could not be generated (e.g.
+        a broken combine_tenets.py), or None. The base outputs are written
+        and recorded either way, and earlier tenet rules are kept.
+    """
+    manifest_path = os.path.join(root, MANIFEST_FILE)
+    previous = load_manifest(manifest_path)['outputs']
+    manifest = {'version': MANIFEST_VERSION, 'outputs': {}}
+    result = {'written': [], 'unchanged': [], 'removed': [], 'tenet_error': None}
+
+    prompts = read_prompts(prompts_dir)
+    for rel_path, output in plan_outputs(prompts, platforms).items():
+        path = os.path.join(root, rel_path)
+        content = output['content']
+        digest = _sha256(content)
+        if _file_sha256(path) == digest:
+            result['unchanged'].append(rel_path)
+        else:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(content)
+            result['written'].append(rel_path)
+        manifest['outputs'][rel_path] = {
+            'platform': output['platform'], 'sha256': digest, 'sources': output['sources'],
+        }
+
+    combine_tenets_path = os.path.join(tenets_dir, 'combine_tenets.py') if tenets_dir else None
+    if 'cursor' in platforms and combine_tenets_path and os.path.isfile(combine_tenets_path):
+        try:
+            combine_tenets = _load_combine_tenets(combine_tenets_path)
+            rules = []
+            if combine_tenets is not None:
+                build = combine_tenets.TenetBuild.open(root)
+                rules = combine_tenets.generate_cursor_rules_from_tenets(
+                    tenets_dir, os.path.join(root, CURSOR_RULES_DIR), build)
+                build.save()
+        except Exception as e:
+            result['tenet_error'] = f"{type(e).__name__}: {e}"
+            # Keep the tenet rules generated before, rather than removing them below
+            for rel_path, output in previous.items():
+                if not any(source.startswith('templates/prompts/') for source in output.get('sources', [])):
+                    manifest['outputs'].setdefault(rel_path, output)
+        else:
+            for rule_path, source in rules:
+                digest = _file_sha256(rule_path)
+                if digest is not None:
+                    manifest['outputs'][os.path.relpath(rule_path, root)] = {
+                        'platform': 'cursor', 'sha256': digest, 'sources': [os.path.relpath(source, root)],
+                    }
+
+    # Outputs of the platforms generated now that are no longer produced
+    for rel_path, output in previous.items():
+        if rel_path in manifest['outputs'] or output.get('platform') not in platforms:
+            continue
+        path = os.path.join(root, rel_path)
+        digest = _file_sha256(path)
+        if digest is None:
+            continue
+        if digest == output.get('sha256'):
+            os.remove(path)
+            result['removed'].append(rel_path)
+        else:
+            manifest['outputs'][rel_path] = output  # edited since; left alone and remembered
+
+    save_manifest(manifest_path, manifest)
+    return result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Generate AI assistant context files from VibeSafe prompts and tenets')
+    parser.add_argument('--prompts-dir', required=True,
+                        help='templates/prompts directory of a VibeSafe checkout')
+    parser.add_argument('--platform', default='all', choices=PLATFORMS + ('all',),
+                        help='Platform to generate context files for (default: all)')
+    parser.add_argument('--tenets-dir', default=None,
+                        help="Project tenets directory, to add a Cursor rule per tenet")
+    parser.add_argument('--root', default='.',
+                        help='Project root to write the files to (default: current directory)')
+    args = parser.parse_args(argv)
+
+    platforms = PLATFORMS if args.platform == 'all' else (args.platform,)
+    result = generate(args.prompts_dir, platforms, args.tenets_dir, args.root)
+    for rel_path in result['removed']:
+        print(f"Removed {rel_path} (its prompt no longer exists)")
+    print(f"✅ Generated AI context for {', '.join(platforms)}: "
+          f"{len(result['written'])} written, {len(result['unchanged'])} unchanged")
+    if result['tenet_error']:
+        print(f"Warning: tenet rules were not generated: {result['tenet_error']}", file=sys.stderr)
+        return 3
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+VibeSafe Timings
+
+Per-phase instrumentation behind the --timings and --timings-json options of
+whats_next.py and validate_vibesafe_structure.py.
+
+The VibeSafe helpers count what they do in `counters` as they go: files and
+bytes read, YAML headers parsed and subprocesses spawned. A Timings object
+splits a run into named phases and records, for each, wall time, CPU time
+(including that of finished child processes) and how much each counter grew:
+
+    timings = Timings()
+    with timings.phase('scan_cips'):
+        scan_cips(project)
+    timings.report()                      # table on stderr
+    timings.write_json('timings.json')    # for trend tracking in CI
+
+Counting is always on and costs an integer addition per event. Counts and
+CPU time go to the phase open in the thread doing the work, so phases that
+run concurrently in threads (whats_next --jobs) are measured separately;
+attach() lets a helper thread count its work in the phase that started it.
+Work done in pool worker processes (validate --jobs) is counted by the parent
+where it can be (YAML parses), and otherwise only shows up as CPU time.
+"""
+
+import os
+import sys
+import time
+from threading import get_ident
+
+COUNTERS = ('files_read', 'bytes_read', 'yaml_parses', 'subprocesses')
+
+counters = dict.fromkeys(COUNTERS, 0)
+
+# Phases open in each thread (by thread id), innermost last
+_open = {}
+
+
+def count(name: str, n: int = 1):
+    """Add n to a counter."""
+    counters[name] += n
+    if not _open:  # no phase is being timed
+        return
+    phases = _open.get(get_ident())
+    if phases:
+        phases[-1].counts[name] += n
+
+
+def count_read(nbytes: int):
+    """Record that a file was read, and how many bytes of it."""
+    count('files_read')
+    count('bytes_read', nbytes)
+
+
+def _children_time() -> float:
+    children = os.times()
+    return children.children_user + children.children_system
+
+
+def _cpu_time() -> float:
+    return time.process_time() + _children_time()
+
+
+def _snapshot():
+    return time.perf_counter(), _cpu_time(), dict(counters)
+
+
+def _delta(name, start, end):
+    (wall0, cpu0, counts0), (wall1, cpu1, counts1) = start, end
+    row = {'phase': name, 'wall_ms': round((wall1 - wall0) * 1000, 3),
+           'cpu_ms': round((cpu1 - cpu0) * 1000, 3)}
+    for counter in COUNTERS:
+        row[counter] = counts1[counter] - counts0[counter]
+    return row
+
+
+class _Phase:
+    """Context manager recording one phase of a Timings run.
+
+    CPU time is that of the current thread, plus that of child processes
+    finished meanwhile (by any thread).
+    """
+
+    def __init__(self, timings, name):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        _open.setdefault(get_ident(), []).append(self)
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time() + _children_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        wall, cpu = time.perf_counter(), time.thread_time() + _children_time()
+        phases = _open[get_ident()]
+        phases.remove(self)
+        if phases:
+            for counter, n in self.counts.items():
+                phases[-1].counts[counter] += n
+        else:
+            del _open[get_ident()]
+        row = {'phase': self.name, 'wall_ms': round((wall - self.wall) * 1000, 3),
+               'cpu_ms': round((cpu - self.cpu) * 1000, 3)}
+        row.update(self.counts)
+        self.timings._records.append((self.wall, wall, row))
+        return False
+
+
+class _NullPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+def phase(timings, name: str):
+    """timings.phase(name), or a context manager that does nothing if timings is None."""
+    return _NULL_PHASE if timings is None else timings.phase(name)
+
+
+def current_phase():
+    """The innermost phase open in this thread, or None."""
+    phases = _open.get(get_ident())
+    return phases[-1] if phases else None
+
+
+class _Attached:
+    def __init__(self, phase):
+        self.phase = phase
+
+    def __enter__(self):
+        _open.setdefault(get_ident(), []).append(self.phase)
+        return self
+
+    def __exit__(self, *exc_info):
+        phases = _open[get_ident()]
+        phases.remove(self.phase)
+        if not phases:
+            del _open[get_ident()]
+        return False
+
+
+def attach(phase):
+    """Count what this thread does in phase (from current_phase() in another thread).
+
+    Does nothing if phase is None.
+    """
+    return _NULL_PHASE if phase is None else _Attached(phase)
+
+
+class Timings:
+    """Phases of one run, from construction until report() or as_dict()."""
+
+    def __init__(self, tool: str = ''):
+        self.tool = tool
+        self._records = []
+        self._start = _snapshot()
+
+    @property
+    def phases(self):
+        """Rows of the phases recorded so far, in the order they started."""
+        return [row for _start, _end, row in sorted(self._records, key=lambda record: record[0])]
+
+    def phase(self, name: str) -> _Phase:
+        """Return a context manager that records the enclosed block as a phase."""
+        return _Phase(self, name)
+
+    def as_dict(self):
+        """Return {'tool', 'phases', 'total'}, with the run so far as the total.
+
+        Time spent outside any phase (argument parsing, imports of the
+        phases' own modules) is reported as an 'other' phase. Phases that
+        overlapped in time only count once towards it.
+        """
+        total = _delta('total', self._start, _snapshot())
+        phases = self.phases
+        covered, covered_until = 0.0, None
+        for start, end, _row in sorted(self._records, key=lambda record: record[0]):
+            if covered_until is not None:
+                start = max(start, covered_until)
+            if end > start:
+                covered += end - start
+                covered_until = end
+        other = {'phase': 'other', 'wall_ms': round(max(total['wall_ms'] - covered * 1000, 0.0), 3),
+                 'cpu_ms': round(max(total['cpu_ms'] - sum(p['cpu_ms'] for p in phases), 0.0), 3)}
+        for key in COUNTERS:
+            other[key] = total[key] - sum(p[key] for p in phases)
+        if other['wall_ms'] >= 0.5 or any(other[c] for c in COUNTERS):
+            phases.append(other)
+        return {'tool': self.tool, 'phases': phases, 'total': total}
+
+    def report(self, file=None):
+        """Print a table of the phases (to stderr by default)."""
+        file = sys.stderr if file is None else file
+        data = self.as_dict()
+        rows = data['phases'] + [data['total']]
+        width = max(len(row['phase']) for row in rows)
+        print(f"\nTimings{' (' + self.tool + ')' if self.tool else ''}:", file=file)
+        print(f"  {'phase':<{width}}  {'wall ms':>9}  {'cpu ms':>9}  {'files':>7}  {'KiB read':>9}"
+              f"  {'yaml':>6}  {'procs':>5}", file=file)
+        for row in rows:
+            if row is data['total']:
+                print(f"  {'-' * width}", file=file)
+            print(f"  {row['phase']:<{width}}  {row['wall_ms']:9.1f}  {row['cpu_ms']:9.1f}  {row['files_read']:7d}"
+                  f"  {row['bytes_read'] / 1024:9.1f}  {row['yaml_parses']:6d}  {row['subprocesses']:5d}", file=file)
+
+    def write_json(self, path: str):
+        """Write as_dict() to path as JSON ('-' for stdout)."""
+        import json
+
+        text = json.dumps(self.as_dict(), indent=2) + '\n'
+        if path == '-':
+            sys.stdout.write(text)
+            return
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+VibeSafe File Watcher
+
+Reports which paths under the VibeSafe component directories (cip/, backlog/,
+requirements/, tenets/) were created, modified or deleted, so whats_next.py
+--watch can refresh only what changed.
+
+On Linux the watcher uses inotify (through ctypes, no extra dependency) and
+sleeps in select() until the kernel reports an event. Elsewhere, or if
+inotify cannot be set up, it falls back to polling os.stat() every interval.
+"""
+
+import os
+import select
+import struct
+import sys
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+# Events arriving within this many seconds of each other are reported together,
+# so an editor's write/rename/chmod sequence causes one refresh.
+DEBOUNCE_SECONDS = 0.05
+
+
+def _component_paths(root: str, dirs: Iterable[str]):
+    """Yield (relative path, stat result) for each component directory and everything below it."""
+    pending = list(dirs)
+    while pending:
+        rel_dir = pending.pop()
+        try:
+            st = os.stat(os.path.join(root, rel_dir))
+            with os.scandir(os.path.join(root, rel_dir)) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        yield rel_dir, st
+        for entry in entries:
+            rel_path = os.path.join(rel_dir, entry.name)
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(rel_path)
+                else:
+                    yield rel_path, entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+
+
+class PollingWatcher:
+    """Detect changes by comparing os.stat() snapshots every interval seconds."""
+
+    def __init__(self, root: str, dirs: Iterable[str], interval: float = 1.0):
+        self.root = root
+        self.dirs = tuple(dirs)
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        return {
+            rel_path: (st.st_mtime_ns, st.st_size)
+            for rel_path, st in _component_paths(self.root, self.dirs)
+        }
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """Block until something changes and return the changed relative paths.
+
+        Returns an empty set if nothing changed within timeout seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+            current = self._scan()
+            changed = {
+                rel_path
+                for rel_path in self.snapshot.keys() | current.keys()
+                if self.snapshot.get(rel_path) != current.get(rel_path)
+            }
+            self.snapshot = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Detect changes with Linux inotify; idle until the kernel reports one."""
+
+    _IN_MODIFY = 0x00000002
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_FROM = 0x00000040
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_DELETE = 0x00000200
+    _IN_DELETE_SELF = 0x00000400
+    _IN_MOVE_SELF = 0x00000800
+    _IN_Q_OVERFLOW = 0x00004000
+    _IN_IGNORED = 0x00008000
+    _IN_ONLYDIR = 0x01000000
+    _IN_ISDIR = 0x40000000
+    _IN_NONBLOCK = 0o4000
+    _IN_CLOEXEC = 0o2000000
+
+    _TREE_MASK = (_IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE
+                  | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR)
+    # The project root is only watched for component directories coming and going.
+    _ROOT_MASK = _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_ONLYDIR
+
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self, root: str, dirs: Iterable[str]):
+        import ctypes
+        import ctypes.util
+
+        if not sys.platform.startswith('linux'):
+            raise OSError('inotify is only available on Linux')
+        self.root = root
+        self.dirs = tuple(dirs)
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        self._get_errno = ctypes.get_errno
+        self.fd = self._libc.inotify_init1(self._IN_NONBLOCK | self._IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(self._get_errno(), 'inotify_init1 failed')
+        self.watches: Dict[int, str] = {}  # watch descriptor -> relative directory ('' for root)
+        try:
+            self._add_watch('', self._ROOT_MASK)
+            for rel_dir in self.dirs:
+                self._watch_tree(rel_dir)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, rel_dir: str, mask: int) -> None:
+        path = os.path.join(self.root, rel_dir) if rel_dir else self.root
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            error = self._get_errno()
+            if error in (2, 20):  # ENOENT, ENOTDIR: gone already or not a directory
+                return
+            raise OSError(error, f'inotify_add_watch failed for {path}')
+        self.watches[wd] = rel_dir
+
+    def _watch_tree(self, rel_dir: str) -> None:
+        for rel_path, _st in _component_paths(self.root, [rel_dir]):
+            if os.path.isdir(os.path.join(self.root, rel_path)):
+                self._add_watch(rel_path, self._TREE_MASK)
+
+    def _read_events(self) -> Set[str]:
+        changed: Set[str] = set()
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset + self._EVENT.size <= len(data):
+            wd, mask, _cookie, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+
+            if mask & self._IN_Q_OVERFLOW:
+                # Events were lost: report every tree so callers rescan them.
+                changed.update(self.dirs)
+                continue
+            if mask & self._IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            rel_dir = self.watches.get(wd)
+            if rel_dir is None:
+                continue
+            if rel_dir == '':
+                if name not in self.dirs:
+                    continue
+                rel_path = name
+            else:
+                rel_path = os.path.join(rel_dir, name) if name else rel_dir
+            if mask & self._IN_ISDIR and mask & (self._IN_CREATE | self._IN_MOVED_TO):
+                # Files may land in a new directory before its watch exists;
+                # the directory itself is reported so its tree is rescanned.
+                self._watch_tree(rel_path)
+            changed.add(rel_path)
+        return changed
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """Block until something changes and return the changed relative paths.
+
+        Returns an empty set if nothing changed within timeout seconds.
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        changed = self._read_events()
+        while select.select([self.fd], [], [], DEBOUNCE_SECONDS)[0]:
+            changed |= self._read_events()
+        return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def open_watcher(root: str, dirs: Iterable[str], interval: float = 1.0):
+    """Return an InotifyWatcher if possible, otherwise a PollingWatcher."""
+    dirs = tuple(dirs)
+    try:
+        return InotifyWatcher(root, dirs)
+    except (OSError, AttributeError):
+        # AttributeError: libc without inotify functions.
+        return PollingWatcher(root, dirs, interval)
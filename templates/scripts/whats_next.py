@@ -17,7 +17,7 @@ The script accepts status values in multiple formats for backlog items:
 All formats are normalized internally to lowercase with underscores.
 
 Usage:
-    python whats_next.py [--no-git] [--no-color] [--cip-only] [--backlog-only] [--requirements-only] [--compression-check]
+    python whats_next.py [--no-git] [--no-color] [--cip-only] [--backlog-only] [--requirements-only] [--compression-check] [--watch]
 
 Options:
     --no-git              Skip Git status information
@@ -26,6 +26,8 @@ Options:
     --backlog-only        Show only backlog status
     --requirements-only   Show only requirements status
     --compression-check   Show compression candidates (closed CIPs needing documentation)
+    --watch               Keep running and refresh the report when project files change
+    --jobs N              Run independent phases in N threads (default: 4)
 
 Returns:
     None. Outputs formatted status information to stdout.
@@ -33,15 +35,42 @@ Returns:
 
 import os
 import sys
-import subprocess
+
+# Shared VibeSafe helpers are installed alongside this script
+# (scripts/ in a project, templates/scripts/ in the VibeSafe repo).
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
+
+if __name__ == "__main__":
+    # With VIBESAFE_DAEMON=1 a warm daemon answers, before the imports below are paid for
+    import vibesafe_daemon
+    vibesafe_daemon.forward('whats_next')
+
+# Modules only some code paths need (subprocess, glob, datetime, yaml,
+# pathlib) are imported where they are used, keeping --help and
+# --show-doc-spec fast; see tests/test_startup_time.py.
 import re
-import glob
 import argparse
-from datetime import datetime
-import yaml
-from pathlib import Path
+from threading import get_ident
 from typing import Dict, List, Any, Optional, Tuple
 
+import vibesafe_frontmatter
+import vibesafe_git
+import vibesafe_timings
+from vibesafe_frontmatter import parse_yaml_header, read_header
+from vibesafe_project import ProjectModel, scan_project
+from vibesafe_timings import count, count_read, phase
+
+# Persistent frontmatter cache (.vibesafe/cache), activated by main()
+_frontmatter_cache = None
+
+# Per-phase timings of this run (--timings), activated by main()
+_timings = None
+
+# Parsed frontmatter kept in memory by --watch, keyed by normalized path
+_frontmatter_memo = None
+
 # ANSI color codes for terminal output
 class Colors:
     """ANSI color codes for terminal output.
@@ -88,76 +117,198 @@ def print_section(title: str):
     print(f"{Colors.HEADER}{Colors.BOLD}{title.center(80)}{Colors.ENDC}")
     print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 80}{Colors.ENDC}\n")
 
-def run_command(command: List[str]) -> Tuple[str, int]:
+def run_command(command: List[str], cwd: Optional[str] = None) -> Tuple[str, int]:
     """Run a shell command and return its output and exit code.
     
     Args:
         command: List of command and arguments to run.
+        cwd: Directory to run it in (default: the current directory).
         
     Returns:
         Tuple containing:
             - Command output as string
             - Exit code as integer
     """
+    import subprocess
+    
+    count('subprocesses')
     try:
         result = subprocess.run(
             command, 
             capture_output=True, 
             text=True, 
-            check=False
+            check=False,
+            cwd=cwd
         )
         return result.stdout.strip(), result.returncode
     except Exception as e:
         return f"Error executing command: {e}", 1
 
-def get_git_status() -> Dict[str, Any]:
+class _TaskOutput:
+    """Stand-in for sys.stdout/sys.stderr that holds back what tasks print.
+
+    Writes from a thread running a task (see start()) are buffered per task;
+    everything else goes straight to the wrapped stream.
+    """
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffers = {}
+        self._threads = {}
+    
+    def start(self, name: str):
+        """Buffer what the current thread writes from now on as name's output."""
+        self._threads[get_ident()] = self.buffers.setdefault(name, [])
+    
+    def stop(self):
+        self._threads.pop(get_ident(), None)
+    
+    def write(self, text: str) -> int:
+        buffer = self._threads.get(get_ident())
+        if buffer is None:
+            return self.stream.write(text)
+        buffer.append(text)
+        return len(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def run_concurrently(tasks: List[Tuple[str, Any, Tuple[str, ...]]], jobs: int = 1,
+                     timed: bool = True, output: Optional[Dict[str, Tuple[str, str]]] = None) -> Dict[str, Any]:
+    """Run named tasks in up to jobs threads, each once its dependencies are done.
+    
+    Tasks mostly wait on subprocesses and disk, so threads overlap them well.
+    Anything they print is held back and written in task order, so the output
+    is the same as that of running the tasks one after another.
+    
+    Args:
+        tasks: (name, function, dependencies) tuples, where dependencies name
+            tasks earlier in the list
+        jobs: Number of threads; with 1 the tasks run in order in this thread
+        timed: Record each task as a --timings phase; otherwise what the
+            tasks do is counted in the caller's phase
+        output: If given, what each task prints is stored here under its
+            name, as (stdout, stderr) text, instead of being written
+    
+    Returns:
+        Dictionary mapping task names to what their functions returned.
+    
+    Raises:
+        Exception: The exception of the first task (in list order) that
+            failed, once the other running tasks have finished. Tasks that
+            depend on a failed task are not run.
+    """
+    timings = _timings if timed else None
+    if (jobs <= 1 or len(tasks) <= 1) and output is None:
+        results = {}
+        for name, function, _dependencies in tasks:
+            with phase(timings, name):
+                results[name] = function()
+        return results
+    
+    import threading
+    
+    parent = vibesafe_timings.current_phase()
+    pending = list(tasks)
+    outcomes = {}  # name -> (succeeded, result or exception); (False, None) if skipped
+    condition = threading.Condition()
+    stdout, stderr = _TaskOutput(sys.stdout), _TaskOutput(sys.stderr)
+    
+    def next_task():
+        with condition:
+            while pending:
+                for task in pending:
+                    if all(dependency in outcomes for dependency in task[2]):
+                        pending.remove(task)
+                        return task
+                condition.wait()
+            return None
+    
+    def worker():
+        with vibesafe_timings.attach(parent):
+            while True:
+                task = next_task()
+                if task is None:
+                    return
+                name, function, dependencies = task
+                if not all(outcomes[dependency][0] for dependency in dependencies):
+                    outcome = (False, None)
+                else:
+                    stdout.start(name)
+                    stderr.start(name)
+                    try:
+                        with phase(timings, name):
+                            outcome = (True, function())
+                    except BaseException as e:
+                        outcome = (False, e)
+                    finally:
+                        stdout.stop()
+                        stderr.stop()
+                with condition:
+                    outcomes[name] = outcome
+                    condition.notify_all()
+    
+    sys.stdout, sys.stderr = stdout, stderr
+    try:
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(min(jobs, len(tasks)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.stdout, sys.stderr = stdout.stream, stderr.stream
+    
+    results = {}
+    for name, _function, _dependencies in tasks:
+        printed = ''.join(stdout.buffers.get(name, ())), ''.join(stderr.buffers.get(name, ()))
+        if output is None:
+            stdout.stream.write(printed[0])
+            stderr.stream.write(printed[1])
+        else:
+            output[name] = printed
+        succeeded, result = outcomes[name]
+        if not succeeded and result is not None:
+            raise result
+        results[name] = result
+    return results
+
+def get_git_status(state: Optional[vibesafe_git.GitState] = None) -> Dict[str, Any]:
     """Get Git repository status information.
     
     Collects information about:
-    - Current branch
+    - Current branch and its upstream
     - Recent commits (last 5)
     - Modified files
-    - Untracked files
+    - Untracked files (wholly untracked directories as one entry)
+    
+    Args:
+        state: Work tree state already read with vibesafe_git.read_git_state()
+            (including recent commits); read here if omitted
     
     Returns:
         Dictionary containing Git status information.
     """
-    git_info = {}
-    
-    # Get current branch
-    branch_output, _ = run_command(['git', 'branch', '--show-current'])
-    git_info['current_branch'] = branch_output
-    
-    # Get recent commits
-    commits_output, _ = run_command(['git', 'log', '--oneline', '-n', '5'])
-    git_info['recent_commits'] = [
-        {
-            'hash': line.split(' ')[0],
-            'message': ' '.join(line.split(' ')[1:])
-        }
-        for line in commits_output.split('\n') if line.strip()
-    ]
-    
-    # Get modified/untracked files
-    status_output, _ = run_command(['git', 'status', '--porcelain'])
-    git_info['modified_files'] = []
-    git_info['untracked_files'] = []
-    
-    for line in status_output.split('\n'):
-        if not line.strip():
-            continue
-        status = line[:2]
-        file_path = line[3:].strip()
-        
-        if status.startswith('??'):
-            git_info['untracked_files'].append(file_path)
-        else:
-            git_info['modified_files'].append({
-                'status': status.strip(),
-                'path': file_path
-            })
+    if state is None:
+        state = vibesafe_git.read_git_state('.', recent_commits=5)
+    if state is None:
+        # Not a git repository (or git is not installed)
+        state = vibesafe_git.GitState()
     
-    return git_info
+    return {
+        'current_branch': state.branch,
+        'upstream': state.upstream,
+        'ahead': state.ahead,
+        'behind': state.behind,
+        'recent_commits': state.recent_commits,
+        'modified_files': [
+            {'status': change['status'], 'path': change['path']}
+            for change in state.changes
+        ],
+        'untracked_files': state.untracked,
+    }
 
 
 def detect_governance_drift(git_info: Dict[str, Any]) -> List[str]:
@@ -229,29 +380,76 @@ def detect_governance_drift(git_info: Dict[str, Any]) -> List[str]:
 
     return suggestions
 
+def parse_frontmatter(header: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Parse a YAML frontmatter header as returned by read_header().
+    
+    Args:
+        header: Text between the `---` delimiters, or None if there was none.
+        
+    Returns:
+        Parsed frontmatter if present, None otherwise.
+    """
+    if header is None:
+        return None
+    return parse_yaml_header(header)
+
 def extract_frontmatter(file_path: str) -> Optional[Dict[str, Any]]:
     """Extract YAML frontmatter from a markdown file if it exists.
     
+    Only the header is read; the body is never loaded. Reads through the
+    persistent frontmatter cache when it is active, so unchanged files are
+    not re-parsed. In --watch mode the result is also kept in memory until
+    forget_frontmatter() is called for the file.
+    
     Args:
         file_path: Path to the markdown file.
         
     Returns:
         Dictionary containing frontmatter data if found, None otherwise.
     """
+    if _frontmatter_memo is not None:
+        key = os.path.normpath(file_path)
+        if key not in _frontmatter_memo:
+            _frontmatter_memo[key] = _read_frontmatter(file_path)
+        return _frontmatter_memo[key]
+    return _read_frontmatter(file_path)
+
+def _read_frontmatter(file_path: str) -> Optional[Dict[str, Any]]:
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Check if the file has YAML frontmatter (between --- markers)
-        frontmatter_match = re.search(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-        if frontmatter_match:
-            yaml_content = frontmatter_match.group(1)
-            return yaml.safe_load(yaml_content)
+        if _frontmatter_cache is not None:
+            return _frontmatter_cache.lookup_header(file_path, 'whats_next', parse_frontmatter)
+        return parse_frontmatter(read_header(file_path).header)
     except Exception as e:
         print(f"Error reading frontmatter from {file_path}: {e}")
     
     return None
 
+def forget_frontmatter(path: str):
+    """Drop in-memory frontmatter for a changed file, or every file below a directory."""
+    if _frontmatter_memo is None:
+        return
+    key = os.path.normpath(path)
+    prefix = key + os.sep
+    for cached in [k for k in _frontmatter_memo if k == key or k.startswith(prefix)]:
+        del _frontmatter_memo[cached]
+
+def open_frontmatter_cache(root_dir: str = '.'):
+    """Activate the persistent frontmatter cache for this run.
+    
+    Returns:
+        The active cache, or None if unavailable or disabled.
+    """
+    global _frontmatter_cache
+    _frontmatter_cache = vibesafe_frontmatter.open_cache(root_dir)
+    return _frontmatter_cache
+
+def save_frontmatter_cache():
+    """Persist and deactivate the frontmatter cache, if one is active."""
+    global _frontmatter_cache
+    if _frontmatter_cache is not None:
+        _frontmatter_cache.save()
+        _frontmatter_cache = None
+
 def has_expected_frontmatter(file_path: str, expected_keys: List[str]) -> bool:
     """Check if a file has all the expected frontmatter keys.
     
@@ -286,6 +484,8 @@ def load_documentation_spec(vibesafe_dir: str = ".vibesafe") -> Optional[Dict[st
     Returns:
         Dictionary containing documentation specification, or None if not found/invalid.
     """
+    import yaml
+    
     locations = [
         os.path.join(vibesafe_dir, "documentation.yml"),
         os.path.join(vibesafe_dir, "docs.yml"),
@@ -296,9 +496,12 @@ def load_documentation_spec(vibesafe_dir: str = ".vibesafe") -> Optional[Dict[st
         if os.path.exists(spec_file):
             try:
                 with open(spec_file, 'r', encoding='utf-8') as f:
-                    spec = yaml.safe_load(f)
-                    if spec and 'documentation' in spec:
-                        return spec
+                    text = f.read()
+                count_read(len(text))
+                count('yaml_parses')
+                spec = yaml.safe_load(text)
+                if spec and 'documentation' in spec:
+                    return spec
             except yaml.YAMLError as e:
                 print(f"⚠️  Could not parse {spec_file}")
                 print(f"Error: {e}")
@@ -359,12 +562,11 @@ def detect_cip_type(cip_path: str, cip_info: Dict[str, Any]) -> str:
     
     # 4. Check content (first 500 chars after frontmatter)
     try:
-        with open(cip_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        # Skip frontmatter
-        content_match = re.search(r'^---\s*\n.*?\n---\s*\n(.{0,500})', content, re.DOTALL)
-        if content_match:
-            sample = content_match.group(1).lower()
+        doc = read_header(cip_path)
+        if doc.header is not None:
+            # Skip blank lines after the frontmatter
+            body = doc.read_body(max_chars=1000)
+            sample = re.sub(r'^\s*\n', '', body)[:500].lower()
             for cip_type, keywords in type_keywords.items():
                 if sum(sample.count(keyword) for keyword in keywords) >= 2:
                     return cip_type
@@ -400,7 +602,7 @@ def get_compression_target(cip_type: str, doc_spec: Optional[Dict[str, Any]]) ->
     
     return target
 
-def scan_cips() -> Dict[str, Any]:
+def scan_cips(project: Optional[ProjectModel] = None) -> Dict[str, Any]:
     """Scan all CIP files and collect their status.
     
     Collects information about:
@@ -409,9 +611,15 @@ def scan_cips() -> Dict[str, Any]:
     - CIPs by status (proposed, accepted, implemented, closed)
     - CIP details including title and dates
     
+    Args:
+        project: Project model from scan_project() (scanned on demand if omitted)
+    
     Returns:
         Dictionary containing CIP status information.
     """
+    if project is None:
+        project = scan_project()
+    
     cips_info = {
         'total': 0,
         'with_frontmatter': 0,
@@ -427,7 +635,7 @@ def scan_cips() -> Dict[str, Any]:
     # Expected frontmatter keys for CIPs
     expected_keys = ['id', 'title', 'status', 'created', 'last_updated']
     
-    for cip_file in sorted(glob.glob('cip/cip*.md')):
+    for cip_file in project.files('cip', 'cip*.md'):
         if cip_file == 'cip/cip_template.md':
             continue
             
@@ -461,12 +669,14 @@ def scan_cips() -> Dict[str, Any]:
                     'title': frontmatter.get('title', 'Untitled'),
                     'last_updated': frontmatter.get('last_updated', ''),
                     'compressed': frontmatter.get('compressed', False),
-                    'priority': frontmatter.get('priority', 'Medium').lower() if 'priority' in frontmatter else 'medium'
+                    'priority': frontmatter.get('priority', 'Medium').lower() if 'priority' in frontmatter else 'medium',
+                    'path': cip_file
                 })
         else:
             # Extract information from CIP using regex if no frontmatter
             with open(cip_file, 'r', encoding='utf-8') as f:
                 content = f.read()
+            count_read(len(content))
             
             title_match = re.search(r'# CIP-[0-9A-F]+:\s*(.*)', content)
             title = title_match.group(1) if title_match else "Untitled"
@@ -506,13 +716,17 @@ def scan_cips() -> Dict[str, Any]:
                     'no_frontmatter': True,
                     'last_updated': '',
                     'compressed': False,
-                    'priority': 'medium'
+                    'priority': 'medium',
+                    'path': cip_file
                 })
     
     return cips_info
 
-def scan_backlog() -> Dict[str, Any]:
+def scan_backlog(project: Optional[ProjectModel] = None) -> Dict[str, Any]:
     """Scan all backlog items and collect their status."""
+    if project is None:
+        project = scan_project()
+    
     backlog_info = {
         'total': 0,
         'with_frontmatter': 0,
@@ -544,10 +758,10 @@ def scan_backlog() -> Dict[str, Any]:
     ]
     
     for directory in backlog_dirs:
-        if not os.path.exists(directory):
+        if not project.is_dir(directory):
             continue
             
-        for backlog_file in sorted(glob.glob(f'{directory}/*.md')):
+        for backlog_file in project.files(directory, '*.md'):
             if 'task_template.md' in backlog_file:
                 continue
                 
@@ -577,6 +791,7 @@ def scan_backlog() -> Dict[str, Any]:
                 # Extract information from backlog item using regex if no frontmatter
                 with open(backlog_file, 'r', encoding='utf-8') as f:
                     content = f.read()
+                count_read(len(content))
                 
                 title_match = re.search(r'# Task:\s*(.*)', content)
                 title = title_match.group(1) if title_match else "Untitled"
@@ -606,11 +821,15 @@ def scan_backlog() -> Dict[str, Any]:
     
     return backlog_info
 
-def scan_requirements() -> Dict[str, Any]:
+def scan_requirements(project: Optional[ProjectModel] = None) -> Dict[str, Any]:
     """Scan the requirements directory and collect information."""
+    if project is None:
+        project = scan_project()
+    
     requirements_info = {
-        'has_framework': os.path.isdir('requirements'),
-        'has_template': os.path.exists('requirements/requirement_template.md'),
+        'has_framework': project.is_dir('requirements'),
+        'has_template': project.exists('requirements/requirement_template.md'),
+        'requirement_count': len(project.files('requirements', 'req*.md')),
         'patterns': [],
         'prompts': {
             'discovery': [],
@@ -643,6 +862,8 @@ def calculate_days_since_closure(last_updated: str) -> Optional[int]:
     Returns:
         Number of days since closure, or None if date is invalid
     """
+    from datetime import datetime
+    
     if not last_updated:
         return None
     
@@ -688,7 +909,8 @@ def get_closed_cips_needing_compression(cips_info: Dict[str, Any]) -> List[Dict[
             'title': cip.get('title', 'Untitled'),
             'days_since_closure': days_since_closure,
             'priority': cip.get('priority', 'medium'),
-            'no_frontmatter': cip.get('no_frontmatter', False)
+            'no_frontmatter': cip.get('no_frontmatter', False),
+            'path': cip.get('path')
         })
     
     # Sort by priority (high first) then by age (oldest first)
@@ -741,6 +963,8 @@ def generate_compression_suggestions(cips_info: Dict[str, Any]) -> List[str]:
     Returns:
         List of formatted suggestion strings
     """
+    import glob
+    
     suggestions = []
     
     candidates = get_closed_cips_needing_compression(cips_info)
@@ -756,9 +980,9 @@ def generate_compression_suggestions(cips_info: Dict[str, Any]) -> List[str]:
     
     # Enrich candidates with type and target information
     for cip in candidates:
-        # Find CIP file by ID
+        # scan_cips() records where each CIP is; look it up by ID otherwise
         cip_id = cip['id']
-        cip_files = glob.glob(f"cip/*{cip_id}*.md")
+        cip_files = [cip['path']] if cip.get('path') else glob.glob(f"cip/*{glob.escape(cip_id)}*.md")
         if cip_files:
             cip_path = cip_files[0]
             cip['cip_type'] = detect_cip_type(cip_path, cip)
@@ -891,6 +1115,7 @@ def generate_documentation_spec_prompts(cips_info: Dict[str, Any]) -> List[str]:
         # Quick heuristic: Check if docs directory has more .md files than expected
         # (This is not exhaustive, just a helpful hint)
         if os.path.exists(source_dir):
+            from pathlib import Path
             md_files = list(Path(source_dir).glob('*.md'))
             targets = doc_spec.get('documentation', {}).get('targets', {})
             
@@ -904,64 +1129,22 @@ def generate_documentation_spec_prompts(cips_info: Dict[str, Any]) -> List[str]:
     
     return prompts
 
-def detect_codebase() -> bool:
+def detect_codebase(project: Optional[ProjectModel] = None) -> bool:
     """Detect if there's a codebase (source code files) in the project.
     
     Excludes VibeSafe system files and common non-code directories.
     """
-    source_extensions = {'.py', '.js', '.ts', '.jsx', '.tsx', '.go', '.rs', '.java', 
-                        '.c', '.cpp', '.h', '.hpp', '.rb', '.php', '.swift', '.kt'}
-    
-    # VibeSafe system directories and other directories to exclude
-    exclude_dirs = {
-        'scripts',  # VibeSafe system scripts
-        'templates',  # VibeSafe templates
-        '.venv', '.venv-vibesafe',  # Virtual environments
-        'node_modules', '__pycache__', '.git',  # Dependencies and system
-        'venv', 'env',  # Other common venv names
-        'cip', 'backlog', 'tenets', 'requirements',  # VibeSafe components
-        'docs', 'doc', 'documentation',  # Documentation
-        '.cursor', '.vscode', '.idea',  # IDE directories
-    }
-    
-    # Check common source directories first
-    source_dirs = ['src', 'lib', 'app', 'pkg', 'internal', 'core']
-    
-    for dir_name in source_dirs:
-        dir_path = Path(dir_name)
-        if dir_path.exists() and dir_path.is_dir():
-            for file in dir_path.rglob('*'):
-                if file.suffix in source_extensions:
-                    return True
-    
-    # Also check for Python packages in root or one level deep (e.g., myproject/myproject/)
-    # This catches cases where the package is organized as: myproject/myproject/__init__.py
-    root = Path('.')
-    
-    # Check root-level Python files (but not VibeSafe scripts)
-    for file in root.glob('*.py'):
-        if file.is_file() and file.name not in {'setup.py', 'conftest.py'}:
-            return True
-    
-    # Check directories in root that might be Python packages or other source directories
-    for item in root.iterdir():
-        if item.is_dir() and item.name not in exclude_dirs and not item.name.startswith('.'):
-            # Check if this directory has source files
-            for file in item.rglob('*'):
-                # Skip excluded subdirectories
-                if any(excluded in file.parts for excluded in exclude_dirs):
-                    continue
-                if file.suffix in source_extensions:
-                    return True
-    
-    return False
+    if project is None:
+        project = scan_project()
+    return project.has_code
 
 
-def detect_component(component_dir: str) -> bool:
+def detect_component(component_dir: str, project: Optional[ProjectModel] = None) -> bool:
     """Detect if a VibeSafe component exists with user content (not just templates)."""
-    dir_path = Path(component_dir)
+    if project is None:
+        project = scan_project()
     
-    if not dir_path.exists():
+    if not project.is_dir(component_dir):
         return False
     
     # Template and system files to ignore
@@ -973,21 +1156,24 @@ def detect_component(component_dir: str) -> bool:
     }
     
     # Check for user content files
-    for file in dir_path.rglob('*.md'):
-        if file.name not in system_files and 'vibesafe' not in str(file.parent):
+    for file in project.walk(component_dir, '*.md'):
+        parent, name = os.path.split(file)
+        if name not in system_files and 'vibesafe' not in parent:
             return True
     
     return False
 
 
-def detect_gaps() -> Dict[str, bool]:
+def detect_gaps(project: Optional[ProjectModel] = None) -> Dict[str, bool]:
     """Detect missing VibeSafe components."""
+    if project is None:
+        project = scan_project()
     return {
-        'has_codebase': detect_codebase(),
-        'has_tenets': detect_component('tenets'),
-        'has_requirements': detect_component('requirements'),
-        'has_cips': detect_component('cip'),
-        'has_backlog': detect_component('backlog')
+        'has_codebase': detect_codebase(project),
+        'has_tenets': detect_component('tenets', project),
+        'has_requirements': detect_component('requirements', project),
+        'has_cips': detect_component('cip', project),
+        'has_backlog': detect_component('backlog', project)
     }
 
 
@@ -1117,11 +1303,13 @@ Recommended order:
     return prompts
 
 
-def check_tenet_status(review_period_days: int = 180) -> Dict[str, Any]:
+def check_tenet_status(review_period_days: int = 180,
+                       project: Optional[ProjectModel] = None) -> Dict[str, Any]:
     """Check the status of project tenets.
     
     Args:
         review_period_days: Number of days after which tenets should be reviewed (default: 180 = 6 months)
+        project: Project model from scan_project() (scanned on demand if omitted)
     
     Returns:
         Dictionary containing tenet status information:
@@ -1133,10 +1321,15 @@ def check_tenet_status(review_period_days: int = 180) -> Dict[str, Any]:
         - needs_review: Boolean indicating if review is recommended
         - files: List of tenet file paths
     """
+    from datetime import datetime
+    from pathlib import Path
+    
+    if project is None:
+        project = scan_project()
     tenets_dir = Path("tenets")
     
     # Check if tenets directory exists
-    if not tenets_dir.exists():
+    if not project.is_dir("tenets"):
         return {
             "status": "missing",
             "message": "No tenets directory found",
@@ -1149,7 +1342,7 @@ def check_tenet_status(review_period_days: int = 180) -> Dict[str, Any]:
     system_files = ["README.md", "tenet_template.md", "combine_tenets.py", 
                     "vibesafe-tenets.md", "vibesafe-tenets.yaml"]
     
-    for file in tenets_dir.rglob("*.md"):
+    for file in map(Path, project.walk("tenets", "*.md")):
         # Skip system files and files in vibesafe subdirectory
         if file.name not in system_files and "vibesafe" not in str(file.parent):
             project_tenets.append(file)
@@ -1168,7 +1361,7 @@ def check_tenet_status(review_period_days: int = 180) -> Dict[str, Any]:
     
     for tenet in project_tenets:
         try:
-            mtime = tenet.stat().st_mtime
+            mtime = (Path(project.root) / tenet).stat().st_mtime
             if oldest_modification is None or mtime < oldest_modification:
                 oldest_modification = mtime
             if newest_modification is None or mtime > newest_modification:
@@ -1195,8 +1388,18 @@ def check_tenet_status(review_period_days: int = 180) -> Dict[str, Any]:
     }
 
 
-def run_validation() -> Dict[str, Any]:
-    """Run VibeSafe structure validation and return summary.
+def run_validation(project: Optional[ProjectModel] = None,
+                   git_state: Optional[vibesafe_git.GitState] = None) -> Dict[str, Any]:
+    """Run VibeSafe structure validation in-process and return summary.
+    
+    The validator is imported as a library and reuses the project model and
+    frontmatter cache of this run, so component files are neither walked nor
+    parsed a second time.
+    
+    Args:
+        project: Project model to validate (scanned if omitted)
+        git_state: Work tree state from get_git_status(), reused by the
+            governance drift check (git is run again if omitted)
     
     Returns:
         dict: Validation results with keys:
@@ -1206,42 +1409,33 @@ def run_validation() -> Dict[str, Any]:
             - exit_code: Validator exit code
             - error: Error message if validation failed to run
     """
-    # Get the script directory
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    validator_path = os.path.join(script_dir, 'validate_vibesafe_structure.py')
-    
-    # Check if validator exists
-    if not os.path.exists(validator_path):
+    # The validator is installed alongside this script
+    if not os.path.exists(os.path.join(_SCRIPT_DIR, 'validate_vibesafe_structure.py')):
         return {'error': 'Validator script not found'}
     
     try:
-        # Run validator with no-color flag
-        result = subprocess.run(
-            [sys.executable, validator_path, '--no-color'],
-            capture_output=True,
-            text=True,
-            timeout=10
+        import validate_vibesafe_structure
+    except (ImportError, SystemExit) as e:
+        # The validator exits on import when python-frontmatter is missing
+        return {'error': f'Validator unavailable: {e}'}
+    
+    try:
+        if project is None:
+            project = scan_project()
+        result = validate_vibesafe_structure.validate(
+            project.root, project=project, cache=_frontmatter_cache, git_state=git_state
         )
-        
-        output = result.stdout + result.stderr
-        
-        # Parse output for error and warning counts
-        error_match = re.search(r'ERRORS \((\d+)\)', output)
-        warning_match = re.search(r'WARNINGS \((\d+)\)', output)
-        
-        error_count = int(error_match.group(1)) if error_match else 0
-        warning_count = int(warning_match.group(1)) if warning_match else 0
-        
-        return {
-            'error_count': error_count,
-            'warning_count': warning_count,
-            'has_issues': error_count > 0 or warning_count > 0,
-            'exit_code': result.returncode
-        }
-    except subprocess.TimeoutExpired:
-        return {'error': 'Validation timed out'}
     except Exception as e:
         return {'error': str(e)}
+    
+    error_count = len(result.errors)
+    warning_count = len(result.warnings)
+    return {
+        'error_count': error_count,
+        'warning_count': warning_count,
+        'has_issues': error_count > 0 or warning_count > 0,
+        'exit_code': 1 if error_count else 0
+    }
 
 
 def generate_next_steps(git_info: Dict[str, Any], cips_info: Dict[str, Any], 
@@ -1297,14 +1491,18 @@ def generate_next_steps(git_info: Dict[str, Any], cips_info: Dict[str, Any],
             next_steps.append("Review and update project tenets to reflect current practices")
     
     # Add suggestion to create requirements framework if missing
-    if not requirements_info['has_framework']:
+    # (requirements_info is empty when --cip-only/--backlog-only skipped it)
+    if requirements_info and not requirements_info['has_framework']:
         next_steps.append(
             "Create requirements directory: mkdir -p requirements"
         )
     # Check if there are actual requirement files (not just templates/README)
     # Use scan to count actual requirement files
-    elif requirements_info['has_framework']:
-        req_count = len([f for f in Path('requirements').glob('req*.md')])
+    elif requirements_info.get('has_framework'):
+        req_count = requirements_info.get('requirement_count')
+        if req_count is None:
+            from pathlib import Path
+            req_count = len([f for f in Path('requirements').glob('req*.md')])
         if req_count == 0:
             next_steps.append(
                 "Create first requirement (WHAT): Define what needs to be built before planning how (CIP)"
@@ -1330,7 +1528,7 @@ def generate_next_steps(git_info: Dict[str, Any], cips_info: Dict[str, Any],
     next_steps.extend(doc_spec_prompts)
     
     # Requirements process recommendations
-    if requirements_info['has_framework']:
+    if requirements_info.get('has_framework'):
         # Check for in-progress backlog items that are explicitly linked to requirements
         # Only suggest if they have related_requirements field populated
         requirements_related_items = []
@@ -1374,7 +1572,7 @@ def generate_next_steps(git_info: Dict[str, Any], cips_info: Dict[str, Any],
             cip = implemented_cips[0]
             next_steps.append(f"Verify implementation of {cip['id']} is complete; consider closing if done")
             next_steps.append("Check for requirements drift - ensure code aligns with specified requirements")
-    else:
+    elif requirements_info:
         # If requirements framework doesn't exist, suggest setting it up
         next_steps.append("Set up requirements framework to improve requirements gathering")
     
@@ -1408,14 +1606,75 @@ def generate_next_steps(git_info: Dict[str, Any], cips_info: Dict[str, Any],
     if not next_steps:
         next_steps.append("Review and update project roadmap")
         next_steps.append("Consider creating new CIPs for upcoming features")
-        if requirements_info['has_framework']:
+        if requirements_info.get('has_framework'):
             # Suggest general requirements activities (patterns are now optional VibeSafe guidance)
             next_steps.append("Review existing requirements - are they WHAT (outcomes) not HOW (implementation)?")
     
     return next_steps
 
-def run_update_scripts() -> List[str]:
-    """Run all update scripts to ensure registries are up to date."""
+# Registry updaters that run in-process, by script path. Each is called as
+# updater(project, path) with the project model instead of starting a new
+# interpreter that would find and read the same files again, and returns
+# False if it cannot handle that copy of the script. Scripts without an
+# updater (custom user scripts) are run with python3.
+_UPDATERS: Dict[str, Any] = {}
+
+# Modules imported by load_script(), by absolute path, with their mtime
+_script_modules: Dict[str, Tuple[int, Any]] = {}
+
+def register_updater(script: str):
+    """Decorator registering a function as the in-process updater of script."""
+    def decorator(function):
+        _UPDATERS[script] = function
+        return function
+    return decorator
+
+def load_script(path: str):
+    """Import the script at path as a module, reusing it until the file changes."""
+    import importlib.util
+    
+    path = os.path.abspath(path)
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _script_modules.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    name = '_vibesafe_' + os.path.relpath(path).replace(os.sep, '_')[:-len('.py')]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _script_modules[path] = (mtime_ns, module)
+    return module
+
+@register_updater('backlog/update_index.py')
+def update_backlog_index(project: ProjectModel, path: str) -> bool:
+    """Regenerate backlog/index.md from the task files in the project model."""
+    from pathlib import Path
+    
+    module = load_script(path)
+    if getattr(module, 'UPDATE_INDEX_API', 1) < 2:
+        return False  # an older copy of the script; run it on its own
+    task_files = [
+        Path(project.root, rel_path)
+        for category in module.CATEGORIES
+        for rel_path in project.files(f'backlog/{category}', '*.md')
+        if module.is_task_file(os.path.basename(rel_path))
+    ]
+    module.update_index(task_files, frontmatter_cache=_frontmatter_cache, quiet=True)
+    project.refresh('backlog/index.md')
+    return True
+
+def run_update_scripts(jobs: int = 1, project: Optional[ProjectModel] = None) -> List[str]:
+    """Run all update scripts to ensure registries are up to date.
+    
+    Scripts with a registered updater run in this process against the
+    project model; any other script is run with python3 from the project
+    root. Script paths are relative to the project root.
+    
+    Args:
+        jobs: Number of scripts to run at once (each updates its own directory)
+        project: Project model from scan_project(), refreshed with what the
+            updaters write (scanned here if omitted)
+    """
     update_scripts = [
         'backlog/update_index.py',
         'cip/update_index.py',
@@ -1423,22 +1682,352 @@ def run_update_scripts() -> List[str]:
         'requirements/update_index.py'
     ]
     
-    results = []
-    for script in update_scripts:
-        if os.path.exists(script):
-            try:
-                output, exit_code = run_command(['python3', script])
-                if exit_code == 0:
-                    results.append(f"✓ Updated {script}")
-                else:
-                    results.append(f"✗ Failed to update {script}: {output}")
-            except Exception as e:
-                results.append(f"✗ Error running {script}: {str(e)}")
+    root = project.root if project is not None else os.path.abspath('.')
     
-    return results
+    def update(script):
+        try:
+            updater = _UPDATERS.get(script)
+            if updater is not None and updater(project, os.path.join(root, script)):
+                return f"✓ Updated {script}"
+            output, exit_code = run_command(['python3', script], cwd=root)
+            if exit_code == 0:
+                return f"✓ Updated {script}"
+            return f"✗ Failed to update {script}: {output}"
+        except Exception as e:
+            return f"✗ Error running {script}: {str(e)}"
+    
+    scripts = [script for script in update_scripts if os.path.exists(os.path.join(root, script))]
+    if project is None and any(script in _UPDATERS for script in scripts):
+        project = scan_project(root)
+    results = run_concurrently(
+        [(script, lambda script=script: update(script), ()) for script in scripts], jobs, timed=False
+    )
+    return [results[script] for script in scripts]
+
+# Component directory each watched section is built from. A section is only
+# rebuilt in --watch mode when something under its directory changed.
+_SECTION_DIRS = {
+    'cips': 'cip',
+    'backlog': 'backlog',
+    'requirements': 'requirements',
+    'tenets': 'tenets',
+}
+
+def collect_status(args: argparse.Namespace, project: ProjectModel,
+                   previous: Optional[Dict[str, Any]] = None,
+                   changed_dirs: Optional[set] = None) -> Dict[str, Any]:
+    """Gather everything the status report shows, without printing it.
+    
+    Args:
+        args: Parsed command-line arguments
+        project: Project model from scan_project()
+        previous: Status from an earlier call; its CIP, backlog, requirements
+            and tenet sections are reused unless their directory changed
+        changed_dirs: Component directories (cip, backlog, ...) with changes
+            since previous; everything is rebuilt if omitted
+    
+    The sections do not depend on each other and are gathered concurrently
+    in args.jobs threads; run_update_scripts() must have finished before.
+    What gathering a section prints (e.g. files that could not be read) is
+    held back, and print_status() writes it where a sequential run did.
+    
+    Returns:
+        Dictionary with git_info, cips_info, backlog_info, requirements_info,
+        tenet_info, validation_info, gaps_info and next_steps, and output:
+        the (stdout, stderr) text printed while gathering each section.
+    """
+    def reuse(section: str) -> bool:
+        return (previous is not None and changed_dirs is not None
+                and _SECTION_DIRS[section] not in changed_dirs)
+    
+    # Sections are gathered by independent tasks, run in args.jobs threads
+    status = {'git_info': {}, 'cips_info': {}, 'backlog_info': {}, 'requirements_info': {},
+              'tenet_info': {}, 'validation_info': {}, 'gaps_info': {}, 'output': {}}
+    tasks = []
+    sections = {}  # task name -> status key
+    
+    def gather(section: str, name: str, function, dependencies: Tuple[str, ...] = ()):
+        tasks.append((name, function, dependencies))
+        sections[name] = section
+    
+    def keep(section: str):
+        status[section] = previous[section]
+        if section in previous['output']:
+            status['output'][section] = previous['output'][section]
+    
+    # Get Git info if requested; validation reuses the state
+    git_states = []
+    
+    def git_status():
+        git_states.append(vibesafe_git.read_git_state('.', recent_commits=5))
+        return get_git_status(git_states[0] or vibesafe_git.GitState())
+    
+    if not args.no_git and not args.quiet:
+        gather('git_info', 'get_git_status', git_status)
+    
+    # Get CIP info if not backlog-only
+    if not args.backlog_only and not args.requirements_only:
+        if reuse('cips'):
+            keep('cips_info')
+        else:
+            gather('cips_info', 'scan_cips', lambda: scan_cips(project))
+    
+    # Get backlog info if not cip-only
+    if not args.cip_only and not args.requirements_only:
+        if reuse('backlog'):
+            keep('backlog_info')
+        else:
+            gather('backlog_info', 'scan_backlog', lambda: scan_backlog(project))
+    
+    # Get requirements info if not cip-only or backlog-only, or if requirements-only
+    if not args.cip_only and not args.backlog_only or args.requirements_only:
+        if reuse('requirements'):
+            keep('requirements_info')
+        else:
+            gather('requirements_info', 'scan_requirements', lambda: scan_requirements(project))
+    
+    # Check tenet status
+    if reuse('tenets'):
+        keep('tenet_info')
+    else:
+        gather('tenet_info', 'check_tenet_status', lambda: check_tenet_status(project=project))
+    
+    # Run validation if not skipped (cross-references span every component)
+    if not args.skip_validation:
+        if previous is not None and changed_dirs is not None and not changed_dirs:
+            keep('validation_info')
+        else:
+            gather('validation_info', 'run_validation',
+                   lambda: run_validation(project, git_states[0] if git_states else None),
+                   ('get_git_status',) if 'get_git_status' in sections else ())
+    
+    # Detect gaps (codebase and component detection) and generate AI prompts
+    def gaps_info():
+        gaps = detect_gaps(project)
+        return {
+            'gaps': gaps,
+            'prompts': generate_ai_prompts(gaps)
+        }
+    gather('gaps_info', 'detect_gaps', gaps_info)
+    
+    output = {}
+    for name, result in run_concurrently(tasks, args.jobs, output=output).items():
+        status[sections[name]] = result
+    for name, printed in output.items():
+        status['output'][sections[name]] = printed
+    
+    # Generate next steps
+    git_info = status['git_info']
+    cips_info = status['cips_info']
+    backlog_info = status['backlog_info']
+    requirements_info = status['requirements_info']
+    tenet_info = status['tenet_info']
+    validation_info = status['validation_info']
+    gaps_info = status['gaps_info']
+    with phase(_timings, 'generate_next_steps'):
+        if args.cip_only:
+            next_steps = generate_next_steps(git_info, cips_info, {}, {}, tenet_info, validation_info, gaps_info)
+        elif args.backlog_only:
+            next_steps = generate_next_steps(git_info, {}, backlog_info, {}, tenet_info, validation_info, gaps_info)
+        elif args.requirements_only:
+            next_steps = generate_next_steps(git_info, {'by_status': {'proposed': []}}, {'by_status': {'proposed': []}, 'by_priority': {'high': []}}, requirements_info, tenet_info, validation_info, gaps_info)
+        else:
+            next_steps = generate_next_steps(git_info, cips_info, backlog_info, requirements_info, tenet_info, validation_info, gaps_info)
+    status['next_steps'] = next_steps
+    
+    return status
+
+def print_status(args: argparse.Namespace, status: Dict[str, Any]):
+    """Print the status report gathered by collect_status()."""
+    def replay(*sections: str):
+        """Write what gathering sections printed, where a sequential run printed it."""
+        for section in sections:
+            printed_stdout, printed_stderr = status['output'].get(section, ('', ''))
+            sys.stdout.write(printed_stdout)
+            sys.stderr.write(printed_stderr)
+    
+    replay('git_info')
+    git_info = status['git_info']
+    if git_info:
+        if git_info.get('current_branch'):
+            print(f"{Colors.BOLD}Current Branch:{Colors.ENDC} {git_info['current_branch']}")
+            print("")
+        
+        if git_info.get('recent_commits'):
+            print(f"{Colors.BOLD}Recent Commits:{Colors.ENDC}")
+            for commit in git_info['recent_commits']:
+                print(f"  {Colors.YELLOW}{commit['hash']}{Colors.ENDC} {commit['message']}")
+            print("")
+    
+    replay('cips_info')
+    cips_info = status['cips_info']
+    if cips_info and not args.quiet:
+        print(f"{Colors.BOLD}CIPs:{Colors.ENDC}")
+        print(f"  Total: {cips_info['total']}")
+        
+        if cips_info['by_status']['proposed']:
+            print(f"  {Colors.YELLOW}Proposed:{Colors.ENDC} {len(cips_info['by_status']['proposed'])}")
+            for cip in cips_info['by_status']['proposed']:
+                title = cip.get('title', 'Untitled')
+                if cip.get('no_frontmatter'):
+                    title += f" {Colors.RED}(No frontmatter){Colors.ENDC}"
+                print(f"    - {cip['id']}: {title}")
+        
+        if cips_info['by_status']['accepted']:
+            print(f"  {Colors.BLUE}Accepted:{Colors.ENDC} {len(cips_info['by_status']['accepted'])}")
+            for cip in cips_info['by_status']['accepted']:
+                print(f"    - {cip['id']}: {cip.get('title', 'Untitled')}")
+        
+        if cips_info['by_status']['implemented']:
+            print(f"  {Colors.GREEN}Implemented:{Colors.ENDC} {len(cips_info['by_status']['implemented'])}")
+        
+        if cips_info['by_status']['closed']:
+            print(f"  Closed: {len(cips_info['by_status']['closed'])}")
+        
+        if cips_info['without_frontmatter']:
+            print(f"  {Colors.RED}Missing Frontmatter:{Colors.ENDC} {len(cips_info['without_frontmatter'])}")
+            for cip in cips_info['without_frontmatter']:
+                print(f"    - {cip['id']}: {cip.get('title', 'Untitled')}")
+        
+        print("")
+    
+    replay('backlog_info')
+    backlog_info = status['backlog_info']
+    if backlog_info and not args.quiet:
+        print(f"{Colors.BOLD}Backlog:{Colors.ENDC}")
+        print(f"  Total: {backlog_info['total']}")
+        
+        if backlog_info['by_status']['in_progress']:
+            print(f"  {Colors.BLUE}In Progress:{Colors.ENDC} {len(backlog_info['by_status']['in_progress'])}")
+            for task in backlog_info['by_status']['in_progress']:
+                print(f"    - {task['title']} ({task['id']})")
+        
+        if backlog_info['by_status']['ready']:
+            print(f"  {Colors.GREEN}Ready:{Colors.ENDC} {len(backlog_info['by_status']['ready'])}")
+            for task in backlog_info['by_status']['ready']:
+                print(f"    - {task['title']} ({task['id']})")
+        
+        if backlog_info['by_status']['proposed']:
+            print(f"  {Colors.YELLOW}Proposed:{Colors.ENDC} {len(backlog_info['by_status']['proposed'])}")
+            for task in backlog_info['by_status']['proposed']:
+                print(f"    - {task['title']} ({task['id']})")
+        
+        if backlog_info['by_priority']['high']:
+            print(f"  {Colors.RED}High Priority:{Colors.ENDC} {len(backlog_info['by_priority']['high'])}")
+            for task in backlog_info['by_priority']['high']:
+                print(f"    - {task['title']} ({task['id']})")
+        
+        print("")
+    
+    replay('requirements_info')
+    requirements_info = status['requirements_info']
+    if requirements_info and not args.quiet:
+        print(f"{Colors.BOLD}Requirements Framework:{Colors.ENDC}")
+        if requirements_info['has_framework']:
+            print(f"  Framework installed: {Colors.GREEN}Yes{Colors.ENDC}")
+            
+            if requirements_info['patterns']:
+                print(f"  Patterns: {len(requirements_info['patterns'])}")
+                for pattern in requirements_info['patterns']:
+                    print(f"    - {pattern}")
+            else:
+                print(f"  Patterns: {Colors.YELLOW}None defined{Colors.ENDC}")
+            
+            prompt_count = sum(len(prompts) for prompts in requirements_info['prompts'].values())
+            if prompt_count > 0:
+                print(f"  Prompts: {prompt_count}")
+                for prompt_type, prompts in requirements_info['prompts'].items():
+                    if prompts:
+                        print(f"    - {prompt_type.capitalize()}: {len(prompts)}")
+            else:
+                print(f"  Prompts: {Colors.YELLOW}None defined{Colors.ENDC}")
+            
+            if requirements_info['integrations']:
+                print(f"  Integrations: {len(requirements_info['integrations'])}")
+                for integration in requirements_info['integrations']:
+                    print(f"    - {integration}")
+            else:
+                print(f"  Integrations: {Colors.YELLOW}None defined{Colors.ENDC}")
+        else:
+            print(f"  Framework installed: {Colors.RED}No{Colors.ENDC}")
+        
+        print("")
+    
+    replay('tenet_info', 'validation_info', 'gaps_info')
+    next_steps = status['next_steps']
+    if next_steps:
+        print_section("Suggested Next Steps")
+        for i, step in enumerate(next_steps, 1):
+            print(f"{i}. {step}")
+    
+    # Output files needing frontmatter
+    if not args.quiet and not args.requirements_only and (cips_info.get('without_frontmatter') or backlog_info.get('without_frontmatter')):
+        print_section("Files Needing YAML Frontmatter")
+        
+        if cips_info.get('without_frontmatter'):
+            print(f"{Colors.BOLD}CIPs Needing Frontmatter:{Colors.ENDC}")
+            for cip in cips_info['without_frontmatter']:
+                print(f"  {Colors.YELLOW}{cip['path']}{Colors.ENDC}")
+        
+        if backlog_info.get('without_frontmatter'):
+            print(f"{Colors.BOLD}Backlog Items Needing Frontmatter:{Colors.ENDC}")
+            for item in backlog_info['without_frontmatter']:
+                print(f"  {Colors.YELLOW}{item['path']}{Colors.ENDC}")
+    
+    if not args.requirements_only and not args.quiet:
+        print("\n")
+
+def watch_status(args: argparse.Namespace, project: ProjectModel, status: Dict[str, Any]):
+    """Keep the status report live until interrupted (--watch).
+    
+    The project model and the parsed frontmatter stay in memory. Each change
+    under cip/, backlog/, requirements/ or tenets/ updates the model, re-parses
+    only the touched files and rebuilds only the sections whose directory
+    changed. Between changes the process sleeps on inotify (Linux) or polls
+    file timestamps every --watch-interval seconds.
+    """
+    global _frontmatter_memo
+    from datetime import datetime
+    from vibesafe_project import COMPONENT_DIRS
+    from vibesafe_watch import InotifyWatcher, open_watcher
+    
+    _frontmatter_memo = {}
+    watcher = open_watcher(project.root, COMPONENT_DIRS, args.watch_interval)
+    mode = 'inotify' if isinstance(watcher, InotifyWatcher) else f'polling every {args.watch_interval:g}s'
+    print(f"{Colors.BLUE}Watching for changes ({mode}); press Ctrl+C to stop.{Colors.ENDC}")
+    sys.stdout.flush()
+    try:
+        while True:
+            changed = watcher.wait()
+            if not changed:
+                continue
+            for rel_path in sorted(changed):
+                project.refresh(rel_path)
+                forget_frontmatter(os.path.join(project.root, rel_path))
+            changed_dirs = {rel_path.split(os.sep, 1)[0] for rel_path in changed}
+            status = collect_status(args, project, status, changed_dirs)
+            if _frontmatter_cache is not None:
+                _frontmatter_cache.save()
+            print("\033[2J\033[H", end='')
+            print_status(args, status)
+            print(f"{Colors.BLUE}Updated {datetime.now().strftime('%H:%M:%S')}: "
+                  f"{len(changed)} changed path(s) in {', '.join(sorted(changed_dirs))}. "
+                  f"Watching ({mode}); press Ctrl+C to stop.{Colors.ENDC}")
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        print()
+    finally:
+        watcher.close()
+        _frontmatter_memo = None
 
-def main():
-    """Main entry point for the script."""
+def main(argv: Optional[List[str]] = None, project: Optional[ProjectModel] = None):
+    """Main entry point for the script.
+    
+    Args:
+        argv: Arguments to parse instead of sys.argv[1:]
+        project: Already-scanned project model to report on (the daemon
+            passes its live model); scanned here if omitted
+    """
     parser = argparse.ArgumentParser(description="What's Next for VibeSafe projects")
     parser.add_argument('--no-git', action='store_true', help='Skip Git information')
     parser.add_argument('--no-color', action='store_true', help='Disable colorized output')
@@ -1450,12 +2039,36 @@ def main():
     parser.add_argument('--show-doc-spec', action='store_true', help='Display documentation specification (.vibesafe/documentation.yml)')
     parser.add_argument('--no-update', action='store_true', help='Skip running update scripts')
     parser.add_argument('--skip-validation', action='store_true', help='Skip VibeSafe structure validation')
-    args = parser.parse_args()
+    parser.add_argument('--no-cache', action='store_true', help='Do not use the frontmatter cache (.vibesafe/cache)')
+    parser.add_argument('--watch', action='store_true', help='Keep running and refresh the report when project files change')
+    parser.add_argument('--watch-interval', type=float, default=1.0, metavar='SECONDS',
+                        help='Polling interval for --watch when inotify is unavailable (default: 1.0)')
+    parser.add_argument('--jobs', '-j', type=int, default=4, metavar='N',
+                        help='Number of threads to run independent phases (git, scans, validation) in; 1 runs them in sequence (default: 4)')
+    parser.add_argument('--timings', action='store_true',
+                        help='Report wall/CPU time, files and bytes read, YAML parses and subprocesses per phase (on stderr)')
+    parser.add_argument('--timings-json', metavar='PATH',
+                        help="Write the per-phase timings as JSON to PATH ('-' for stdout)")
+    args = parser.parse_args(argv)
     
     if args.no_color:
         Colors.disable()
     
-    # Handle --compression-check flag (focused view)
+    global _timings
+    if args.timings or args.timings_json:
+        _timings = vibesafe_timings.Timings('whats_next')
+    try:
+        run(args, project)
+    finally:
+        timings, _timings = _timings, None
+        if timings is not None:
+            if args.timings:
+                timings.report()
+            if args.timings_json:
+                timings.write_json(args.timings_json)
+
+def run(args: argparse.Namespace, project: Optional[ProjectModel] = None):
+    """Produce the output main() was asked for by args."""
     # Handle --show-doc-spec flag
     if args.show_doc_spec:
         print_section("Documentation Specification")
@@ -1529,8 +2142,18 @@ def main():
         print()
         return
     
+    if not args.no_cache:
+        with phase(_timings, 'open_cache'):
+            open_frontmatter_cache()
+    
     if args.compression_check:
-        cips_info = scan_cips()
+        if project is None:
+            with phase(_timings, 'scan_project'):
+                project = scan_project()
+        with phase(_timings, 'scan_cips'):
+            cips_info = scan_cips(project)
+        with phase(_timings, 'save_cache'):
+            save_frontmatter_cache()
         candidates = get_closed_cips_needing_compression(cips_info)
         
         print_section("Compression Candidates")
@@ -1567,179 +2190,29 @@ def main():
         
         return
 
+    # Walk the project once; the updaters and every section below read from this model
+    if project is None:
+        with phase(_timings, 'scan_project'):
+            project = scan_project()
+    
     # Run update scripts first if not disabled
     if not args.no_update and not args.quiet:
         print_section("Updating Registries")
-        update_results = run_update_scripts()
+        with phase(_timings, 'run_update_scripts'):
+            update_results = run_update_scripts(args.jobs, project)
         for result in update_results:
             print(result)
         print()  # Add a blank line for spacing
     
-    # Get Git info if requested
-    git_info = {}
-    if not args.no_git and not args.quiet:
-        git_info = get_git_status()
-        
-        if git_info.get('current_branch'):
-            print(f"{Colors.BOLD}Current Branch:{Colors.ENDC} {git_info['current_branch']}")
-            print("")
-        
-        if git_info.get('recent_commits'):
-            print(f"{Colors.BOLD}Recent Commits:{Colors.ENDC}")
-            for commit in git_info['recent_commits']:
-                print(f"  {Colors.YELLOW}{commit['hash']}{Colors.ENDC} {commit['message']}")
-            print("")
-    
-    # Get CIP info if not backlog-only
-    cips_info = {}
-    if not args.backlog_only and not args.requirements_only:
-        cips_info = scan_cips()
-        
-        if not args.quiet:
-            print(f"{Colors.BOLD}CIPs:{Colors.ENDC}")
-            print(f"  Total: {cips_info['total']}")
-            
-            if cips_info['by_status']['proposed']:
-                print(f"  {Colors.YELLOW}Proposed:{Colors.ENDC} {len(cips_info['by_status']['proposed'])}")
-                for cip in cips_info['by_status']['proposed']:
-                    title = cip.get('title', 'Untitled')
-                    if cip.get('no_frontmatter'):
-                        title += f" {Colors.RED}(No frontmatter){Colors.ENDC}"
-                    print(f"    - {cip['id']}: {title}")
-            
-            if cips_info['by_status']['accepted']:
-                print(f"  {Colors.BLUE}Accepted:{Colors.ENDC} {len(cips_info['by_status']['accepted'])}")
-                for cip in cips_info['by_status']['accepted']:
-                    print(f"    - {cip['id']}: {cip.get('title', 'Untitled')}")
-            
-            if cips_info['by_status']['implemented']:
-                print(f"  {Colors.GREEN}Implemented:{Colors.ENDC} {len(cips_info['by_status']['implemented'])}")
-            
-            if cips_info['by_status']['closed']:
-                print(f"  Closed: {len(cips_info['by_status']['closed'])}")
-            
-            if cips_info['without_frontmatter']:
-                print(f"  {Colors.RED}Missing Frontmatter:{Colors.ENDC} {len(cips_info['without_frontmatter'])}")
-                for cip in cips_info['without_frontmatter']:
-                    print(f"    - {cip['id']}: {cip.get('title', 'Untitled')}")
-            
-            print("")
+    status = collect_status(args, project)
+    with phase(_timings, 'print_status'):
+        print_status(args, status)
     
-    # Get backlog info if not cip-only
-    backlog_info = {}
-    if not args.cip_only and not args.requirements_only:
-        backlog_info = scan_backlog()
-        
-        if not args.quiet:
-            print(f"{Colors.BOLD}Backlog:{Colors.ENDC}")
-            print(f"  Total: {backlog_info['total']}")
-            
-            if backlog_info['by_status']['in_progress']:
-                print(f"  {Colors.BLUE}In Progress:{Colors.ENDC} {len(backlog_info['by_status']['in_progress'])}")
-                for task in backlog_info['by_status']['in_progress']:
-                    print(f"    - {task['title']} ({task['id']})")
-            
-            if backlog_info['by_status']['ready']:
-                print(f"  {Colors.GREEN}Ready:{Colors.ENDC} {len(backlog_info['by_status']['ready'])}")
-                for task in backlog_info['by_status']['ready']:
-                    print(f"    - {task['title']} ({task['id']})")
-            
-            if backlog_info['by_status']['proposed']:
-                print(f"  {Colors.YELLOW}Proposed:{Colors.ENDC} {len(backlog_info['by_status']['proposed'])}")
-                for task in backlog_info['by_status']['proposed']:
-                    print(f"    - {task['title']} ({task['id']})")
-            
-            if backlog_info['by_priority']['high']:
-                print(f"  {Colors.RED}High Priority:{Colors.ENDC} {len(backlog_info['by_priority']['high'])}")
-                for task in backlog_info['by_priority']['high']:
-                    print(f"    - {task['title']} ({task['id']})")
-            
-            print("")
+    if args.watch:
+        watch_status(args, project, status)
     
-    # Get requirements info if not cip-only or backlog-only, or if requirements-only
-    requirements_info = {}
-    if not args.cip_only and not args.backlog_only or args.requirements_only:
-        requirements_info = scan_requirements()
-        
-        if not args.quiet:
-            print(f"{Colors.BOLD}Requirements Framework:{Colors.ENDC}")
-            if requirements_info['has_framework']:
-                print(f"  Framework installed: {Colors.GREEN}Yes{Colors.ENDC}")
-                
-                if requirements_info['patterns']:
-                    print(f"  Patterns: {len(requirements_info['patterns'])}")
-                    for pattern in requirements_info['patterns']:
-                        print(f"    - {pattern}")
-                else:
-                    print(f"  Patterns: {Colors.YELLOW}None defined{Colors.ENDC}")
-                
-                prompt_count = sum(len(prompts) for prompts in requirements_info['prompts'].values())
-                if prompt_count > 0:
-                    print(f"  Prompts: {prompt_count}")
-                    for prompt_type, prompts in requirements_info['prompts'].items():
-                        if prompts:
-                            print(f"    - {prompt_type.capitalize()}: {len(prompts)}")
-                else:
-                    print(f"  Prompts: {Colors.YELLOW}None defined{Colors.ENDC}")
-                
-                if requirements_info['integrations']:
-                    print(f"  Integrations: {len(requirements_info['integrations'])}")
-                    for integration in requirements_info['integrations']:
-                        print(f"    - {integration}")
-                else:
-                    print(f"  Integrations: {Colors.YELLOW}None defined{Colors.ENDC}")
-            else:
-                print(f"  Framework installed: {Colors.RED}No{Colors.ENDC}")
-            
-            print("")
-    
-    # Check tenet status
-    tenet_info = check_tenet_status()
-    
-    # Run validation if not skipped
-    validation_info = {}
-    if not args.skip_validation:
-        validation_info = run_validation()
-    
-    # Detect gaps and generate AI prompts
-    gaps = detect_gaps()
-    ai_prompts = generate_ai_prompts(gaps)
-    gaps_info = {
-        'gaps': gaps,
-        'prompts': ai_prompts
-    }
-    
-    # Generate next steps
-    if args.cip_only:
-        next_steps = generate_next_steps(git_info, cips_info, {}, {}, tenet_info, validation_info, gaps_info)
-    elif args.backlog_only:
-        next_steps = generate_next_steps(git_info, {}, backlog_info, {}, tenet_info, validation_info, gaps_info)
-    elif args.requirements_only:
-        next_steps = generate_next_steps(git_info, {'by_status': {'proposed': []}}, {'by_status': {'proposed': []}, 'by_priority': {'high': []}}, requirements_info, tenet_info, validation_info, gaps_info)
-    else:
-        next_steps = generate_next_steps(git_info, cips_info, backlog_info, requirements_info, tenet_info, validation_info, gaps_info)
-    
-    if next_steps:
-        print_section("Suggested Next Steps")
-        for i, step in enumerate(next_steps, 1):
-            print(f"{i}. {step}")
-    
-    # Output files needing frontmatter
-    if not args.quiet and not args.requirements_only and (cips_info.get('without_frontmatter') or backlog_info.get('without_frontmatter')):
-        print_section("Files Needing YAML Frontmatter")
-        
-        if cips_info.get('without_frontmatter'):
-            print(f"{Colors.BOLD}CIPs Needing Frontmatter:{Colors.ENDC}")
-            for cip in cips_info['without_frontmatter']:
-                print(f"  {Colors.YELLOW}{cip['path']}{Colors.ENDC}")
-        
-        if backlog_info.get('without_frontmatter'):
-            print(f"{Colors.BOLD}Backlog Items Needing Frontmatter:{Colors.ENDC}")
-            for item in backlog_info['without_frontmatter']:
-                print(f"  {Colors.YELLOW}{item['path']}{Colors.ENDC}")
-    
-    if not args.requirements_only and not args.quiet:
-        print("\n")
+    with phase(_timings, 'save_cache'):
+        save_frontmatter_cache()
 
 if __name__ == "__main__":
     try:
@@ -2,11 +2,18 @@
 """
 Script to combine individual tenet files into a single document.
 Also creates a YAML representation for machine processing.
+
+Tenets are read and parsed once per run (TenetBuild), and only when their
+content hash changed since the last run. Outputs are only rewritten when the
+tenets they are generated from changed, so the "Generated on" date moves
+only when the content does.
 """
 
+import glob
+import hashlib
+import json
 import os
 import re
-import glob
 from collections import OrderedDict
 from datetime import datetime
 
@@ -22,7 +29,11 @@ def extract_tenet_metadata(file_path):
     """Extract metadata from a tenet markdown file."""
     with open(file_path, 'r') as file:
         content = file.read()
-    
+    return parse_tenet_metadata(content)
+
+
+def parse_tenet_metadata(content):
+    """Extract id, title, description, quote and version from tenet content."""
     tenet_id = re.search(r'## Tenet: (\S+)', content)
     title = re.search(r'\*\*Title\*\*: (.+?)[\r\n]', content)
     description = re.search(r'\*\*Description\*\*: (.+?)[\r\n]', content, re.DOTALL)
@@ -44,35 +55,38 @@ def extract_tenet_metadata(file_path):
     return metadata
 
 
-def combine_tenets(directory, output_md, output_yaml):
-    """Combine individual tenet files into a single markdown and YAML file."""
+def combine_tenets(directory, output_md, output_yaml, build=None):
+    """Combine individual tenet files into a single markdown and YAML file.
+    
+    Each output is only rewritten when the tenets it combines changed.
+    """
+    own_build = build is None
+    if own_build:
+        build = TenetBuild.open()
     files = glob.glob(os.path.join(directory, '*.md'))
     files.sort()  # Sort files alphabetically
+    tenets = [build.tenet(file_path) for file_path in files]
     
-    tenets = []
-    for file_path in files:
-        with open(file_path, 'r') as file:
-            content = file.read()
-        tenets.append(content)
-        
-        # Extract metadata for YAML
-        metadata = extract_tenet_metadata(file_path)
-        if metadata:
-            tenets_yaml.append(metadata)
-    
-    # Write combined Markdown
-    with open(output_md, 'w') as file:
-        file.write(f"# {os.path.basename(directory).capitalize()} Tenets\n\n")
-        file.write(f"*Generated on {datetime.now().strftime('%Y-%m-%d')}*\n\n")
-        file.write("This document combines all individual tenet files from the project.\n\n")
-        file.write("\n\n".join(tenets))
+    def render_markdown():
+        return (f"# {os.path.basename(directory).capitalize()} Tenets\n\n"
+                f"*Generated on {datetime.now().strftime('%Y-%m-%d')}*\n\n"
+                "This document combines all individual tenet files from the project.\n\n"
+                + "\n\n".join(tenet['content'] for tenet in tenets))
+    
+    build.output(output_md, f'combined-md {directory}', tenets, render_markdown)
     
     # Write YAML representation (if yaml is available)
     if YAML_AVAILABLE:
-        with open(output_yaml, 'w') as file:
-            yaml.dump({'tenets': tenets_yaml}, file, default_flow_style=False)
+        def render_yaml():
+            tenets_yaml = [dict(tenet['metadata']) for tenet in tenets if tenet['metadata']]
+            return yaml.safe_dump({'tenets': tenets_yaml}, default_flow_style=False, sort_keys=False)
+        
+        build.output(output_yaml, f'combined-yaml {directory}', tenets, render_yaml)
     else:
         print("Warning: PyYAML not available, skipping YAML output")
+    
+    if own_build:
+        build.save()
 
 
 def extract_tenet_metadata_for_cursor_rules(content):
@@ -140,42 +154,184 @@ alwaysApply: true
     return rule_content
 
 
-def generate_cursor_rules_from_tenets(tenets_directory, output_directory):
-    """Generate cursor rules from project tenets."""
+def generate_cursor_rules_from_tenets(tenets_directory, output_directory, build=None):
+    """Generate cursor rules from project tenets.
+    
+    A rule is written when it is missing, and rewritten when its tenet
+    changed unless the rule was edited since it was generated.
+    
+    Returns:
+        (rule file, tenet file) Path pairs, one per tenet found.
+    """
     from pathlib import Path
     
+    own_build = build is None
+    if own_build:
+        build = TenetBuild.open()
     tenets_dir = Path(tenets_directory)
     output_dir = Path(output_directory)
     
     # Create output directory if it doesn't exist
     output_dir.mkdir(parents=True, exist_ok=True)
     
+    rules = []
+    
     # Find all tenet files recursively
-    for tenet_file in tenets_dir.rglob("*.md"):
+    for tenet_file in sorted(tenets_dir.rglob("*.md")):
         if tenet_file.name == "README.md":
             continue
-            
+        
         # Extract tenet ID from filename or content
         tenet_id = tenet_file.stem
+        tenet = build.tenet(tenet_file)
         
-        # Read tenet content
-        with open(tenet_file, 'r') as f:
-            content = f.read()
+        # Write cursor rule file, preserving rules edited by hand
+        rule_file = output_dir / f"project_tenet_{tenet_id}.mdc"
+        if build.output(rule_file, 'cursor-rule', [tenet],
+                        lambda: generate_cursor_rule_content(tenet['rule_metadata']), preserve_edits=True):
+            print(f"Generated cursor rule: {rule_file}")
+        rules.append((rule_file, tenet_file))
+    
+    if own_build:
+        build.save()
+    return rules
+
+
+class TenetBuild:
+    """Tenet files read and parsed once, and the outputs generated from them.
+    
+    The content hash of every tenet and, for every output, the hashes of the
+    tenets it was generated from are kept in .vibesafe/cache/tenets.json, so
+    later runs only parse tenets that changed and only rewrite outputs whose
+    tenets changed (or that are missing). Set VIBESAFE_NO_CACHE=1 to start
+    from scratch every run.
+    
+    Usage:
+        build = TenetBuild.open()
+        combine_tenets('vibesafe', 'vibesafe-tenets.md', 'vibesafe-tenets.yaml', build)
+        generate_cursor_rules_from_tenets('.', '../.cursor/rules', build)
+        build.save()
+    """
+    
+    # Bump when the generated formats change, so every output is rewritten
+    VERSION = 1
+    
+    def __init__(self, state_path=None):
+        self.state_path = state_path
+        self.state = {'version': self.VERSION, 'tenets': {}, 'outputs': {}}
+        self.dirty = False
+        self._tenets = {}
+        if state_path is None:
+            return
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(state, dict) and state.get('version') == self.VERSION:
+            self.state = state
+    
+    @classmethod
+    def open(cls, project_root=None):
+        """Open the build state of the project this script is installed in."""
+        if os.environ.get('VIBESAFE_NO_CACHE', '').strip().lower() in ('1', 'true', 'yes'):
+            return cls()
+        if project_root is None:
+            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return cls(os.path.join(project_root, '.vibesafe', 'cache', 'tenets.json'))
+    
+    def _key(self, path):
+        return os.path.abspath(path)
+    
+    def tenet(self, file_path):
+        """Read a tenet file and return its content, hash and parsed metadata.
         
-        # Extract metadata
-        metadata = extract_tenet_metadata_for_cursor_rules(content)
+        Returns a dict with 'content', 'sha256', 'metadata' (as
+        extract_tenet_metadata()) and 'rule_metadata' (as
+        extract_tenet_metadata_for_cursor_rules()).
+        """
+        key = self._key(file_path)
+        tenet = self._tenets.get(key)
+        if tenet is not None:
+            return tenet
         
-        # Generate cursor rule content
-        rule_content = generate_cursor_rule_content(metadata)
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        digest = hashlib.sha256(raw).hexdigest()
+        parsed = self.state['tenets'].get(key)
+        if parsed is None or parsed.get('sha256') != digest:
+            parsed = {
+                'sha256': digest,
+                'metadata': parse_tenet_metadata(content),
+                'rule_metadata': extract_tenet_metadata_for_cursor_rules(content),
+            }
+            self.state['tenets'][key] = parsed
+            self.dirty = True
+        tenet = dict(parsed, content=content)
+        self._tenets[key] = tenet
+        return tenet
+    
+    def output(self, path, kind, tenets, render, preserve_edits=False):
+        """Write render() to path unless the tenets are the ones path was generated from.
         
-        # Write cursor rule file
-        rule_file = output_dir / f"project_tenet_{tenet_id}.mdc"
+        Args:
+            path: Output file
+            kind: What the output is (part of its inputs, with VERSION)
+            tenets: Tenets (from tenet()) the output is generated from
+            render: Function returning the output's content
+            preserve_edits: Leave the file alone if it exists and was not
+                written by this build, or was changed since
         
-        # Only write if file doesn't exist (preserve existing rules)
-        if not rule_file.exists():
-            with open(rule_file, 'w') as f:
-                f.write(rule_content)
-            print(f"Generated cursor rule: {rule_file}")
+        Returns:
+            True if the file was written.
+        """
+        key = self._key(path)
+        inputs = hashlib.sha256('\0'.join(
+            [kind, str(self.VERSION)] + [tenet['sha256'] for tenet in tenets]
+        ).encode('utf-8')).hexdigest()
+        record = self.state['outputs'].get(key)
+        exists = os.path.exists(path)
+        if exists and record is not None and record['inputs'] == inputs:
+            return False
+        
+        existing = None
+        if exists:
+            with open(path, 'rb') as f:
+                existing = f.read()
+            if preserve_edits and (record is None or record['sha256'] != hashlib.sha256(existing).hexdigest()):
+                return False
+        
+        data = render().encode('utf-8')
+        self.state['outputs'][key] = {'inputs': inputs, 'sha256': hashlib.sha256(data).hexdigest()}
+        self.dirty = True
+        if data == existing:
+            return False
+        with open(path, 'wb') as f:
+            f.write(data)
+        return True
+    
+    def save(self):
+        """Write the build state atomically; failures are ignored."""
+        if self.state_path is None or not self.dirty:
+            return
+        import tempfile
+        
+        state_dir = os.path.dirname(self.state_path)
+        try:
+            os.makedirs(state_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=state_dir, prefix='.tenets-', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(self.state, f, separators=(',', ':'))
+                os.replace(tmp_path, self.state_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+        except OSError:
+            return
+        self.dirty = False
 
 
 if __name__ == "__main__":
@@ -219,9 +375,6 @@ if __name__ == "__main__":
         generate_cursor_rules_from_tenets(args.tenets_dir, args.output_dir)
     else:
         # Original behavior - combine VibeSafe tenets
-        tenets_yaml = []
-        
-        # Combine VibeSafe tenets
         combine_tenets(
             'vibesafe',
             'vibesafe-tenets.md',
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the synthetic project generator and benchmark harness (benchmarks/).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add repo root to path so we can import test_support
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from test_support import load_module_from_path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parents[1] / "benchmarks"
+load_module_from_path("benchmarks.synthetic_repo", BENCHMARKS_DIR / "synthetic_repo.py")
+load_module_from_path("benchmarks.run_benchmarks", BENCHMARKS_DIR / "run_benchmarks.py")
+
+from benchmarks import run_benchmarks as rb  # pyright: ignore[reportMissingImports]
+from benchmarks import synthetic_repo as sr  # pyright: ignore[reportMissingImports]
+
+
+class TestSyntheticRepo(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_counts_for_size_add_up(self):
+        for total in sr.SIZES.values():
+            counts = sr.counts_for_size(total)
+            self.assertEqual(sum(counts.values()), total)
+            self.assertLessEqual(counts["cips"], sr.MAX_HEX_IDS)
+
+    def test_generated_tree_is_deterministic(self):
+        first = os.path.join(self.test_dir, "a")
+        second = os.path.join(self.test_dir, "b")
+        for dest in (first, second):
+            sr.generate(dest, cips=20, backlog=30, requirements=10, tenets=5, seed=3, scripts=False)
+
+        def contents(root):
+            return {
+                os.path.relpath(os.path.join(d, f), root): Path(d, f).read_text(encoding="utf-8")
+                for d, _, files in os.walk(root) for f in files
+            }
+
+        self.assertEqual(contents(first), contents(second))
+
+    def test_scanners_see_generated_components(self):
+        stats = sr.generate(self.test_dir, cips=40, backlog=60, requirements=20, tenets=8,
+                            legacy_fraction=0.25, reverse_link_fraction=0.5)
+        self.assertGreater(stats["legacy_cips"], 0)
+        self.assertGreater(stats["legacy_backlog"], 0)
+        self.assertGreater(stats["reverse_links"], 0)
+
+        results = rb.run_cases(self.test_dir, ["scan_cips", "collect_all_ids", "update_index"], repeat=1)
+        self.assertEqual(set(results), {"scan_cips", "collect_all_ids", "update_index"})
+
+        whats_next = sys.modules["whats_next"]
+        validator = sys.modules["validate_vibesafe_structure"]
+        original_dir = os.getcwd()
+        os.chdir(self.test_dir)
+        try:
+            cips_info = whats_next.scan_cips()
+            ids = validator.collect_all_ids(".")
+        finally:
+            os.chdir(original_dir)
+        self.assertEqual(cips_info["total"], 40)
+        self.assertEqual(len(cips_info["without_frontmatter"]), stats["legacy_cips"])
+        self.assertEqual(len(ids["cip"]), 40 - stats["legacy_cips"])
+        self.assertEqual(len(ids["requirement"]), 20)
+        self.assertEqual(len(ids["tenet"]), 8)
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, "backlog", "index.md")))
+
+
+class TestCompare(unittest.TestCase):
+    def test_flags_only_slowdowns_beyond_threshold_and_noise(self):
+        baseline = {"1k": {"scan_cips": 0.100, "scan_backlog": 0.100, "scan_project": 0.001}}
+        results = {"1k": {"scan_cips": 0.200, "scan_backlog": 0.110, "scan_project": 0.004, "new_case": 1.0}}
+        regressions = rb.compare(results, baseline, threshold=0.25, min_delta=0.01)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("scan_cips", regressions[0])
+
+    def test_save_baseline_merges_sizes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "baseline.json")
+            rb.save_baseline(path, {"1k": {"scan_cips": 0.01}}, threshold=0.25)
+            rb.save_baseline(path, {"10k": {"scan_cips": 0.1}}, threshold=0.3)
+            data = rb.load_baseline(path)
+        self.assertEqual(set(data["results"]), {"1k", "10k"})
+        self.assertEqual(data["threshold"], 0.3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for the tenet build (templates/tenets/combine_tenets.py).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+# Add repo root to path so we can import test_support
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from test_support import load_module_from_path
+
+load_module_from_path(
+    "tenets.combine_tenets",
+    Path(__file__).resolve().parents[1] / "templates" / "tenets" / "combine_tenets.py",
+)
+
+import tenets.combine_tenets as ct  # pyright: ignore[reportMissingImports]
+
+TENET = """## Tenet: {id}
+
+**Title**: {title}
+
+**Description**: A tenet for testing.
+
+**Quote**: *"{title} matters."*
+
+**Examples**:
+- An example
+
+**Version**: 1
+"""
+
+
+class TestTenetBuild(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.state_path = os.path.join(self.test_dir, ".vibesafe", "cache", "tenets.json")
+        self.tenets_dir = os.path.join(self.test_dir, "tenets", "vibesafe")
+        os.makedirs(self.tenets_dir)
+        self._write_tenet("alpha", "Alpha")
+        self._write_tenet("beta", "Beta")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _write_tenet(self, tenet_id, title):
+        with open(os.path.join(self.tenets_dir, f"{tenet_id}.md"), "w") as f:
+            f.write(TENET.format(id=tenet_id, title=title))
+
+    def _combine(self):
+        build = ct.TenetBuild(self.state_path)
+        ct.combine_tenets(self.tenets_dir, self.output_md, self.output_yaml, build)
+        build.save()
+
+    @property
+    def output_md(self):
+        return os.path.join(self.test_dir, "tenets", "vibesafe-tenets.md")
+
+    @property
+    def output_yaml(self):
+        return os.path.join(self.test_dir, "tenets", "vibesafe-tenets.yaml")
+
+    def test_combined_outputs_are_only_rewritten_when_tenets_change(self):
+        self._combine()
+        with open(self.output_yaml) as f:
+            data = yaml.safe_load(f)
+        self.assertEqual([t["id"] for t in data["tenets"]], ["alpha", "beta"])
+        self.assertEqual(data["tenets"][0]["quote"], "Alpha matters.")
+        with open(self.output_md) as f:
+            self.assertIn("## Tenet: beta", f.read())
+
+        for path in (self.output_md, self.output_yaml):
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        with mock.patch.object(ct, "parse_tenet_metadata", side_effect=AssertionError("parsed")):
+            self._combine()
+        self.assertEqual(os.stat(self.output_md).st_mtime_ns, 1_000_000_000)
+        self.assertEqual(os.stat(self.output_yaml).st_mtime_ns, 1_000_000_000)
+
+        self._write_tenet("beta", "Beta Renamed")
+        self._combine()
+        self.assertNotEqual(os.stat(self.output_md).st_mtime_ns, 1_000_000_000)
+        with open(self.output_yaml) as f:
+            self.assertEqual(yaml.safe_load(f)["tenets"][1]["title"], "Beta Renamed")
+
+    def test_prompts_follow_tenets_but_keep_hand_edits(self):
+        rules_dir = os.path.join(self.test_dir, ".cursor", "rules")
+        build = ct.TenetBuild(self.state_path)
+        ct.generate_cursor_rules_from_tenets(self.tenets_dir, rules_dir, build)
+        build.save()
+        alpha_rule = os.path.join(rules_dir, "project_tenet_alpha.mdc")
+        beta_rule = os.path.join(rules_dir, "project_tenet_beta.mdc")
+        with open(alpha_rule) as f:
+            self.assertIn("# Project Tenet: Alpha", f.read())
+
+        with open(beta_rule, "a") as f:
+            f.write("Edited by hand\n")
+        self._write_tenet("alpha", "Alpha Renamed")
+        self._write_tenet("beta", "Beta Renamed")
+        build = ct.TenetBuild(self.state_path)
+        ct.generate_cursor_rules_from_tenets(self.tenets_dir, rules_dir, build)
+
+        with open(alpha_rule) as f:
+            self.assertIn("# Project Tenet: Alpha Renamed", f.read())
+        with open(beta_rule) as f:
+            text = f.read()
+        self.assertIn("# Project Tenet: Beta\n", text)
+        self.assertTrue(text.endswith("Edited by hand\n"))
+
+    def test_each_tenet_is_parsed_once_per_build(self):
+        build = ct.TenetBuild()
+        with mock.patch.object(ct, "parse_tenet_metadata", wraps=ct.parse_tenet_metadata) as parse:
+            ct.combine_tenets(self.tenets_dir, self.output_md, self.output_yaml, build)
+            ct.generate_cursor_rules_from_tenets(self.tenets_dir, os.path.join(self.test_dir, "rules"), build)
+        self.assertEqual(parse.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
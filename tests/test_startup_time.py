@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Startup-time regression tests for the CLI scripts.
+
+whats_next.py and validate_vibesafe_structure.py defer imports to the code
+paths that need them. These tests run the scripts under `python -X importtime`
+and check that cheap paths (--help, --show-doc-spec, --compression-check) do
+not import modules they have no use for.
+
+Wall-clock time depends on the machine, so the import time budget is only
+checked when asked for:
+
+    VIBESAFE_IMPORT_BUDGET_MS=60 python -m pytest tests/test_startup_time.py
+"""
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "templates" / "scripts"
+WHATS_NEXT = str(SCRIPTS_DIR / "whats_next.py")
+VALIDATOR = str(SCRIPTS_DIR / "validate_vibesafe_structure.py")
+
+# Milliseconds the scripts may spend importing modules beyond what the
+# interpreter imports on its own, best of RUNS, if VIBESAFE_IMPORT_BUDGET_MS
+# is set. 60 is about three times what a developer laptop measures; eager
+# imports of yaml, python-frontmatter, subprocess and friends cost about as
+# much again.
+IMPORT_BUDGET_MS = float(os.environ["VIBESAFE_IMPORT_BUDGET_MS"]) if os.environ.get("VIBESAFE_IMPORT_BUDGET_MS") else None
+RUNS = 3
+
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+\d+ \| *(\S+)")
+
+
+def _imports(args, cwd):
+    """Run python -X importtime with args and return {module: self time in µs}."""
+    env = dict(os.environ)
+    env.pop("VIBESAFE_DAEMON", None)
+    # Bytecode must be cached, or compiling the scripts dominates the numbers.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime"] + args,
+        cwd=cwd, env=env, capture_output=True, text=True, timeout=60,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            modules[match.group(2)] = int(match.group(1))
+    return modules
+
+
+class TestStartupImports(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.project = cls.tmp.name
+        os.makedirs(os.path.join(cls.project, "cip"))
+        with open(os.path.join(cls.project, "cip", "cip0001.md"), "w") as f:
+            f.write('---\nid: "0001"\ntitle: "First"\nstatus: "Closed"\n---\n\n# CIP-0001\n')
+        cls.interpreter = set(_imports(["-c", "pass"], cls.project))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def _measure(self, args):
+        """Return (modules imported by the script, best import time in ms)."""
+        _imports(args, self.project)  # warm the bytecode cache
+        best = None
+        for _ in range(RUNS if IMPORT_BUDGET_MS is not None else 1):
+            modules = _imports(args, self.project)
+            extra = {name: us for name, us in modules.items() if name not in self.interpreter}
+            total_ms = sum(extra.values()) / 1000
+            best = total_ms if best is None else min(best, total_ms)
+        return set(extra), best
+
+    def _check(self, args, forbidden):
+        modules, best_ms = self._measure(args)
+        self.assertIn("argparse", modules, "importtime output could not be parsed")
+        self.assertEqual(modules & set(forbidden), set())
+        if IMPORT_BUDGET_MS is not None:
+            self.assertLess(best_ms, IMPORT_BUDGET_MS)
+
+    def test_whats_next_help(self):
+        self._check([WHATS_NEXT, "--help"],
+                    ["yaml", "frontmatter", "subprocess", "json", "socket", "pathlib", "hashlib", "tempfile"])
+
+    def test_whats_next_show_doc_spec(self):
+        # yaml is needed to read .vibesafe/documentation.yml
+        self._check([WHATS_NEXT, "--show-doc-spec"],
+                    ["frontmatter", "subprocess", "json", "socket", "hashlib", "tempfile"])
+
+    def test_whats_next_compression_check(self):
+        self._check([WHATS_NEXT, "--compression-check", "--no-cache"],
+                    ["frontmatter", "subprocess", "socket", "json"])
+
+    def test_validator_help(self):
+        self._check([VALIDATOR, "--help"],
+                    ["yaml", "frontmatter", "subprocess", "json", "socket", "hashlib", "tempfile"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -51,6 +51,55 @@ def test_templates_scripts_validator_matches_runtime():
     )
 
 
+def test_templates_scripts_frontmatter_helpers_match_runtime():
+    _assert_files_identical(
+        "scripts/vibesafe_frontmatter.py",
+        "templates/scripts/vibesafe_frontmatter.py",
+    )
+
+
+def test_templates_scripts_project_model_matches_runtime():
+    _assert_files_identical(
+        "scripts/vibesafe_project.py",
+        "templates/scripts/vibesafe_project.py",
+    )
+
+
+def test_templates_scripts_file_watcher_matches_runtime():
+    _assert_files_identical(
+        "scripts/vibesafe_watch.py",
+        "templates/scripts/vibesafe_watch.py",
+    )
+
+
+def test_templates_scripts_daemon_matches_runtime():
+    _assert_files_identical(
+        "scripts/vibesafe_daemon.py",
+        "templates/scripts/vibesafe_daemon.py",
+    )
+
+
+def test_templates_scripts_timings_matches_runtime():
+    _assert_files_identical(
+        "scripts/vibesafe_timings.py",
+        "templates/scripts/vibesafe_timings.py",
+    )
+
+
+def test_templates_scripts_git_matches_runtime():
+    _assert_files_identical(
+        "scripts/vibesafe_git.py",
+        "templates/scripts/vibesafe_git.py",
+    )
+
+
+def test_templates_scripts_prompts_matches_runtime():
+    _assert_files_identical(
+        "scripts/vibesafe_prompts.py",
+        "templates/scripts/vibesafe_prompts.py",
+    )
+
+
 def test_templates_backlog_update_index_matches_runtime():
     _assert_files_identical(
         "backlog/update_index.py",
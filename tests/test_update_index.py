@@ -7,6 +7,7 @@ import os
 import sys
 import tempfile
 import unittest
+from unittest import mock
 from pathlib import Path
 import shutil
 
@@ -331,6 +332,56 @@ last_updated: "2026-01-01"
             if old_file is not None:
                 update_index.__file__ = old_file
 
+    def test_update_index_skips_unchanged_index(self):
+        """index.md is only rewritten when its content changes."""
+        old_file = getattr(update_index, "__file__", None)
+        update_index.__file__ = os.path.join(self.test_dir, "update_index.py")
+        try:
+            task_path = os.path.join(self.test_dir, "bugs", "2026-01-02_bug.md")
+            with open(task_path, "w") as f:
+                f.write('---\nid: "2026-01-02_bug"\ntitle: "First Title"\nstatus: "Ready"\n---\n')
+            index_path = Path(self.test_dir) / "index.md"
+
+            update_index.update_index()
+            os.utime(index_path, ns=(1_000_000_000, 1_000_000_000))
+            update_index.update_index()
+            self.assertEqual(index_path.stat().st_mtime_ns, 1_000_000_000)
+
+            with open(task_path, "w") as f:
+                f.write('---\nid: "2026-01-02_bug"\ntitle: "Second Title"\nstatus: "Ready"\n---\n')
+            update_index.update_index()
+            self.assertNotEqual(index_path.stat().st_mtime_ns, 1_000_000_000)
+            self.assertIn("Second Title", index_path.read_text(encoding="utf-8"))
+        finally:
+            if old_file is not None:
+                update_index.__file__ = old_file
+
+    def test_generate_index_content_reuses_unchanged_sections(self):
+        """Only sections whose tasks changed are sorted and rendered again."""
+        def task(name, status, title):
+            return {
+                'filepath': Path(self.test_dir) / 'features' / name,
+                'title': title,
+                'status': status,
+                'category': 'features',
+                'created': '2026-01-01',
+                'updated': '2026-01-01',
+            }
+
+        tasks = [task('a.md', 'ready', 'A'), task('b.md', 'proposed', 'B')]
+        first = update_index.generate_index_content(tasks)
+        real_relpath = os.path.relpath
+        with mock.patch.object(update_index.os.path, 'relpath', side_effect=real_relpath) as relpath:
+            second = update_index.generate_index_content(tasks)
+            self.assertEqual(second, first)
+            relpath.assert_not_called()
+
+            tasks[1] = task('b.md', 'proposed', 'B renamed')
+            third = update_index.generate_index_content(tasks)
+            self.assertEqual(relpath.call_count, 1)
+        self.assertIn('[B renamed](', third)
+        self.assertIn('[A](', third)
+
     def test_generate_index_content_with_no_completed_or_abandoned(self):
         """Covers 'no recently completed/abandoned' branches + invalid task skipping."""
         tasks = [
@@ -441,7 +492,31 @@ last_updated: "2026-01-01"
         self.assertIn(f"- [{tasks[1]['title']}]({expected_link_2})", content)
         self.assertIn(f"- [{tasks[2]['title']}]({expected_link_3})", content)  # completed section
         self.assertIn(f"- [{tasks[3]['title']}]({expected_link_4})", content)  # abandoned section
-    
+
+    def test_generate_index_content_with_missing_dates(self):
+        """Legacy tasks without Created/Last Updated lines sort alongside dated ones."""
+        tasks = []
+        for n, (status, created, updated) in enumerate([
+            ('ready', None, None), ('ready', '2025-05-12', '2025-05-13'),
+            ('completed', None, None), ('completed', '2025-05-14', '2025-05-15'),
+            ('abandoned', '2025-05-16', None), ('abandoned', '2025-05-16', '2025-05-17'),
+        ]):
+            tasks.append({
+                'filepath': Path(os.path.join(self.test_dir, "features", f"2025-05-1{n}_task.md")),
+                'id': f'2025-05-1{n}_task',
+                'title': f'Task {n}',
+                'status': status,
+                'priority': 'Medium',
+                'created': created,
+                'updated': updated,
+                'category': 'features'
+            })
+
+        content = update_index.generate_index_content(tasks)
+
+        for task in tasks:
+            self.assertIn(f"- [{task['title']}]", content)
+
     def test_case_insensitive_status_matching(self):
         """Test that status values are normalized correctly."""
         # Create a test file with lowercase status
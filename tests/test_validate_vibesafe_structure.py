@@ -730,6 +730,283 @@ author: "Test Human"
         
         cip_fm = extract_frontmatter(cip_file)
         self.assertNotIn('related_requirements', cip_fm)
+    
+    def test_chained_fixes_parse_each_file_once(self):
+        """A requirement fixed in one pass keeps that fix when a later pass rewrites it."""
+        from scripts import validate_vibesafe_structure as v
+        
+        files = {
+            os.path.join('tenets', 'test-tenet.md'): 'id: "test-tenet"\nrelated_requirements: ["0001"]\n',
+            os.path.join('requirements', 'req0001_test.md'): 'id: "0001"\nrelated_tenets: []\nrelated_cips: ["0011", "0012"]\n',
+            os.path.join('cip', 'cip0011.md'): 'id: "0011"\n',
+            os.path.join('cip', 'cip0012.md'): 'id: "0012"\n',
+        }
+        for rel, header in files.items():
+            with open(os.path.join(self.temp_dir, rel), 'w') as f:
+                f.write(f"---\n{header}---\n\n# Body\n")
+        
+        with mock.patch.object(v, 'extract_frontmatter', wraps=v.extract_frontmatter) as m_extract:
+            fixes = fix_reverse_links(self.temp_dir, ValidationResult(), dry_run=False)
+        
+        self.assertEqual(fixes, 3)
+        self.assertEqual(m_extract.call_count, len(files))
+        req_fm = extract_frontmatter(os.path.join(self.temp_dir, 'requirements', 'req0001_test.md'))
+        self.assertEqual(req_fm['related_tenets'], ['test-tenet'])
+        self.assertNotIn('related_cips', req_fm)
+        for name in ('cip0011.md', 'cip0012.md'):
+            cip_fm = extract_frontmatter(os.path.join(self.temp_dir, 'cip', name))
+            self.assertEqual(cip_fm['related_requirements'], ['0001'])
+
+
+class TestFrontmatterWriteBatch(unittest.TestCase):
+    """Test that fixes are batched and written once per file."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.temp_dir, 'requirements'))
+        os.makedirs(os.path.join(self.temp_dir, 'tenets'))
+        self.req_file = os.path.join(self.temp_dir, 'requirements', 'req0001_test.md')
+        with open(self.req_file, 'w') as f:
+            f.write('---\nid: "0001"\ntitle: "Req"\nstatus: "proposed"\nrelated_tenets: []\n---\n\n# Body\n')
+        for name in ('one', 'two', 'three'):
+            with open(os.path.join(self.temp_dir, 'tenets', f'tenet-{name}.md'), 'w') as f:
+                f.write(f'---\nid: "tenet-{name}"\nrelated_requirements: ["0001"]\n---\n\n# Tenet\n')
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def test_validate_writes_each_fixed_file_once(self):
+        from scripts import validate_vibesafe_structure as v
+        
+        with mock.patch.object(v, '_write_temp', wraps=v._write_temp) as m_write, \
+             mock.patch.object(v, 'check_system_file_drift'):
+            result = v.validate(self.temp_dir, auto_fix=True, fix_links=True, governance_drift=False)
+        
+        written = [call.args[0] for call in m_write.call_args_list]
+        self.assertEqual(len(written), len(set(written)))
+        self.assertEqual(written.count(self.req_file), 1)
+        self.assertEqual(len(written), 4)  # the requirement and three tenets
+        self.assertIn("Writing fixes to 4 file(s)", result.info)
+        self.assertIsNone(v._write_batch)
+        
+        req_fm = extract_frontmatter(self.req_file)
+        self.assertEqual(sorted(req_fm['related_tenets']), ['tenet-one', 'tenet-three', 'tenet-two'])
+        self.assertEqual(req_fm['status'], 'Proposed')
+        with open(self.req_file) as f:
+            self.assertTrue(f.read().rstrip().endswith('# Body'))
+        self.assertEqual([n for n in os.listdir(os.path.dirname(self.req_file)) if n.endswith('.tmp')], [])
+    
+    def test_commit_writes_nothing_when_a_file_cannot_be_rendered(self):
+        from scripts import validate_vibesafe_structure as v
+        
+        tenet_file = os.path.join(self.temp_dir, 'tenets', 'tenet-one.md')
+        with open(self.req_file) as f:
+            original = f.read()
+        batch = v.FrontmatterWriteBatch()
+        batch.stage(self.req_file, {'id': '0001', 'title': 'Changed'})
+        batch.stage(tenet_file, {'id': 'tenet-one'})
+        real_render = v._render_frontmatter
+        
+        def render(path, metadata):
+            if path == os.path.abspath(tenet_file):
+                raise ValueError("boom")
+            return real_render(path, metadata)
+        
+        with mock.patch.object(v, '_render_frontmatter', side_effect=render):
+            failures = batch.commit()
+        
+        self.assertEqual(len(failures), 1)
+        self.assertIn("boom", failures[0][1])
+        with open(self.req_file) as f:
+            self.assertEqual(f.read(), original)
+        self.assertEqual([n for n in os.listdir(os.path.dirname(self.req_file)) if n.endswith('.tmp')], [])
+
+
+class TestChangedOnly(unittest.TestCase):
+    """Test --changed-only validation against a real git repository."""
+    
+    def setUp(self):
+        if shutil.which('git') is None:
+            self.skipTest("git not available")
+        self.temp_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.temp_dir, 'requirements'))
+        os.makedirs(os.path.join(self.temp_dir, 'cip'))
+        self._write('requirements/req0001_one.md', 'id: "0001"\n')
+        self._write('requirements/req0002_two.md', 'id: "0002"\n')
+        self._write('cip/cip0001.md', 'id: "0001"\nrelated_requirements: ["0001"]\n')
+        self._write('cip/cip0002.md', 'id: "0002"\nrelated_requirements: ["0002"]\n')
+        self._git('init', '-q')
+        self._git('add', '.')
+        self._git('commit', '-q', '-m', 'baseline')
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def _write(self, rel, header):
+        with open(os.path.join(self.temp_dir, rel), 'w') as f:
+            f.write(f"---\n{header}---\n")
+    
+    def _git(self, *args):
+        import subprocess
+        subprocess.run(
+            ['git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com', '-C', self.temp_dir, *args],
+            check=True, capture_output=True,
+        )
+    
+    def _validate(self, **kwargs):
+        from scripts import validate_vibesafe_structure as v
+        
+        validated = []
+        rechecked = []
+        with mock.patch.object(v, 'validate_component', side_effect=lambda _r, _t, path, *_a, **_k: validated.append(path)), \
+             mock.patch.object(v, 'validate_cross_references', side_effect=lambda _t, path, *_a, **_k: rechecked.append(path)), \
+             mock.patch.object(v, 'check_system_file_drift'):
+            result = v.validate(self.temp_dir, governance_drift=False, changed_only=True, **kwargs)
+        rel = lambda paths: sorted(os.path.relpath(p, self.temp_dir) for p in paths)
+        return rel(validated), rel(rechecked), result
+    
+    def test_validates_only_modified_and_untracked_files(self):
+        self._write('requirements/req0002_two.md', 'id: "0002"\ntitle: "Edited"\n')
+        self._write('requirements/req0003_three.md', 'id: "0003"\n')
+        
+        validated, rechecked, _result = self._validate()
+        
+        self.assertEqual(validated, [os.path.join('requirements', 'req0002_two.md'), os.path.join('requirements', 'req0003_three.md')])
+        # cip0002 links to 0002, whose file changed
+        self.assertEqual(rechecked, [os.path.join('cip', 'cip0002.md')])
+    
+    def test_untracked_files_outside_components_are_not_listed(self):
+        from scripts import validate_vibesafe_structure as v
+        
+        os.makedirs(os.path.join(self.temp_dir, 'build', 'out'))
+        with open(os.path.join(self.temp_dir, 'build', 'out', 'artifact.o'), 'w') as f:
+            f.write('binary\n')
+        self._write('requirements/req0003_three.md', 'id: "0003"\n')
+        
+        changes = v._get_git_changes(self.temp_dir)
+        
+        self.assertEqual(changes, [('A', None, 'requirements/req0003_three.md')])
+    
+    def test_deleted_target_rechecks_files_linking_to_it(self):
+        os.remove(os.path.join(self.temp_dir, 'requirements', 'req0001_one.md'))
+        
+        validated, rechecked, _result = self._validate()
+        
+        self.assertEqual(validated, [])
+        self.assertEqual(rechecked, [os.path.join('cip', 'cip0001.md')])
+    
+    def test_since_compares_with_older_revision(self):
+        self._write('requirements/req0002_two.md', 'id: "0002"\ntitle: "Edited"\n')
+        self._git('commit', '-q', '-am', 'edit')
+        
+        self.assertEqual(self._validate()[0], [])
+        self.assertEqual(self._validate(since='HEAD~1')[0], [os.path.join('requirements', 'req0002_two.md')])
+    
+    def test_falls_back_to_all_files_for_unknown_revision(self):
+        validated, _rechecked, result = self._validate(since='no-such-rev')
+        
+        self.assertEqual(len(validated), 4)
+        self.assertTrue(any("validating all files" in message for message in result.info))
+
+
+class TestParallelValidation(unittest.TestCase):
+    """Test that --jobs gives the same result as a serial run."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.temp_dir, 'requirements'))
+        os.makedirs(os.path.join(self.temp_dir, 'cip'))
+        for i in range(12):
+            with open(os.path.join(self.temp_dir, 'requirements', f'req{i:04d}_r.md'), 'w') as f:
+                f.write(f'---\nid: "{i:04d}"\ntitle: "R"\nstatus: "{"ready" if i % 3 else "Ready"}"\n'
+                        f'related_tenets: ["tenet-{i}"]\n---\n')
+            with open(os.path.join(self.temp_dir, 'cip', f'cip{i:04d}.md'), 'w') as f:
+                f.write(f'---\nid: "{i:04d}"\ntitle: "C"\nauthor: "AI"\nrelated_requirements: ["{i + 6:04d}"]\n---\n')
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def _validate(self, jobs, **kwargs):
+        from scripts import validate_vibesafe_structure as v
+        
+        with mock.patch.object(v, 'check_system_file_drift'):
+            return v.validate(self.temp_dir, governance_drift=False, jobs=jobs, **kwargs)
+    
+    def test_parallel_run_matches_serial_run(self):
+        from scripts import validate_vibesafe_structure as v
+        
+        serial = self._validate(1, auto_fix=True, dry_run=True)
+        streamed = []
+        pooled = []
+        real_run_in_pool = v._run_in_pool
+        
+        def run_in_pool(*args, **kwargs):
+            results = real_run_in_pool(*args, **kwargs)
+            pooled.append(results is not None)
+            return results
+        
+        with mock.patch.object(v, '_PARALLEL_MIN_FILES', 1), \
+             mock.patch.object(v, '_run_in_pool', side_effect=run_in_pool):
+            parallel = self._validate(2, auto_fix=True, dry_run=True, on_diagnostic=streamed.append)
+        
+        if not all(pooled):
+            self.skipTest("process pools are not available here")
+        self.assertEqual(len(pooled), 2)  # parsing and validation
+        self.assertTrue(serial.has_errors() and serial.has_fixes())
+        self.assertEqual(parallel.diagnostics, serial.diagnostics)
+        self.assertEqual(parallel.errors, serial.errors)
+        self.assertEqual(parallel.warnings, serial.warnings)
+        self.assertEqual(parallel.fixes, serial.fixes)
+        self.assertEqual(parallel.info, serial.info)
+        self.assertEqual(streamed, serial.diagnostics)
+    
+    def test_diagnostics_are_reported_as_pool_results_arrive(self):
+        from scripts import validate_vibesafe_structure as v
+        
+        events = []
+        
+        def run_in_pool(_function, items, *_args, **_kwargs):
+            def results():
+                for _task, _type, file_path in items:
+                    events.append('result')
+                    task_result = v.ValidationResult()
+                    task_result.add_warning("checked", file_path, rule='test')
+                    yield task_result
+            return results()
+        
+        with mock.patch.object(v, '_run_in_pool', side_effect=run_in_pool):
+            self._validate(2, on_diagnostic=lambda _d: events.append('diagnostic'))
+        
+        self.assertEqual(events[:4], ['result', 'diagnostic', 'result', 'diagnostic'])
+    
+    def test_broken_pool_validates_the_rest_here(self):
+        from concurrent.futures.process import BrokenProcessPool
+        from scripts import validate_vibesafe_structure as v
+        
+        serial = self._validate(1)
+        
+        def broken(*_args, **_kwargs):
+            raise BrokenProcessPool("worker died")
+            yield
+        
+        with mock.patch.object(v, '_PARALLEL_MIN_FILES', 1), \
+             mock.patch.object(v, '_run_in_pool', side_effect=lambda *a, **k: broken()):
+            parallel = self._validate(2)
+        
+        self.assertEqual(parallel.diagnostics, serial.diagnostics)
+    
+    def test_jobs_default_to_one(self):
+        from scripts import validate_vibesafe_structure as v
+        
+        self.assertEqual(v._jobs_arg('auto'), os.cpu_count() or 1)
+        self.assertEqual(v._jobs_arg('3'), 3)
+        with mock.patch.object(v, 'validate', return_value=v.ValidationResult()) as validate, \
+             mock.patch.object(v, 'scan_project'):
+            try:
+                v.main(['--root', self.temp_dir, '--no-cache'])
+            except SystemExit:
+                pass
+        self.assertEqual(validate.call_args.kwargs['jobs'], 1)
 
 
 class TestHumanAttribution(unittest.TestCase):
@@ -918,6 +1195,13 @@ class TestSystemFileDrift(unittest.TestCase):
         # The drift check iterates a fixed set of pairs; create all template sources.
         self._write(root, "templates/scripts/whats_next.py", "# template whats-next\n")
         self._write(root, "templates/scripts/validate_vibesafe_structure.py", "# template validator\n")
+        self._write(root, "templates/scripts/vibesafe_frontmatter.py", "# template frontmatter helpers\n")
+        self._write(root, "templates/scripts/vibesafe_project.py", "# template project model\n")
+        self._write(root, "templates/scripts/vibesafe_watch.py", "# template file watcher\n")
+        self._write(root, "templates/scripts/vibesafe_daemon.py", "# template daemon\n")
+        self._write(root, "templates/scripts/vibesafe_timings.py", "# template timings\n")
+        self._write(root, "templates/scripts/vibesafe_git.py", "# template git\n")
+        self._write(root, "templates/scripts/vibesafe_prompts.py", "# template prompt generation\n")
         self._write(root, "templates/backlog/update_index.py", "# template backlog index\n")
         self._write(root, "templates/tenets/combine_tenets.py", "# template tenets combiner\n")
 
@@ -1043,51 +1327,55 @@ class TestSystemFileDrift(unittest.TestCase):
             self.assertIn("Could not read system file drift pair", combined)
 
 class TestGitChangedPaths(unittest.TestCase):
-    """Unit tests for _get_git_changed_paths parsing logic."""
+    """Unit tests for _get_git_changed_paths, built on vibesafe_git."""
 
     def test_returns_none_when_not_git_repo(self):
         from scripts import validate_vibesafe_structure as v
 
-        with mock.patch("subprocess.run") as m:
-            m.return_value = mock.Mock(returncode=1, stdout="false\n")
+        with mock.patch.object(v.vibesafe_git, "read_git_state", return_value=None):
             self.assertIsNone(v._get_git_changed_paths("/repo"))
 
     def test_returns_none_when_git_status_fails(self):
         from scripts import validate_vibesafe_structure as v
 
-        with mock.patch("subprocess.run") as m:
-            m.side_effect = [
-                mock.Mock(returncode=0, stdout="true\n"),
-                mock.Mock(returncode=2, stdout=""),
-            ]
+        with mock.patch("subprocess.Popen") as m:
+            m.return_value = mock.Mock(returncode=128, communicate=mock.Mock(return_value=(b"", None)))
             self.assertIsNone(v._get_git_changed_paths("/repo"))
 
-    def test_parses_renames_and_skips_blanks(self):
+    def test_parses_renames_and_untracked(self):
         from scripts import validate_vibesafe_structure as v
 
-        with mock.patch("subprocess.run") as m:
-            # First call: rev-parse
-            m.side_effect = [
-                mock.Mock(returncode=0, stdout="true\n"),
-                mock.Mock(
-                    returncode=0,
-                    stdout="\n".join(
-                        [
-                            " M templates/scripts/whats_next.py",
-                            "R  old/name.txt -> new/name.txt",
-                            "?? untracked.file",
-                            "  ",
-                        ]
-                    ),
-                ),
-            ]
-
+        status = mock.Mock(returncode=0, communicate=mock.Mock(return_value=(b"\0".join([
+            b"# branch.oid abc",
+            b"# branch.head main",
+            b"1 .M N... 100644 100644 100644 abc abc templates/scripts/whats_next.py",
+            b"2 R. N... 100644 100644 100644 abc abc R100 new/name.txt",
+            b"old/name.txt",
+            b"? cip/new file.md",
+            b"? src/",
+            b"",
+        ]), None)))
+        prefix = mock.Mock(returncode=0, communicate=mock.Mock(return_value=(b"\n", None)))
+        with mock.patch("subprocess.Popen", side_effect=[status, prefix]) as m:
             changed = v._get_git_changed_paths("/repo")
 
         self.assertEqual(
             changed,
-            ["templates/scripts/whats_next.py", "new/name.txt", "untracked.file"],
+            ["templates/scripts/whats_next.py", "new/name.txt", "cip/new file.md", "src/"],
         )
+        # Untracked files come from the status itself, for the whole repository
+        self.assertIn("--untracked-files=normal", m.call_args_list[0][0][0])
+        self.assertEqual(m.call_count, 2)
+
+    def test_governance_drift_reuses_callers_git_state(self):
+        from scripts import validate_vibesafe_structure as v
+
+        state = v.vibesafe_git.GitState()
+        state.untracked = ["templates/scripts/new_tool.py"]
+        result = ValidationResult()
+        with mock.patch.object(v, "_get_git_changed_paths", side_effect=AssertionError("git run again")):
+            v.check_governance_drift("/repo", result, state)
+        self.assertTrue(result.has_warnings())
 
 
 class TestGovernanceDriftMore(unittest.TestCase):
@@ -1339,12 +1627,217 @@ stakeholders: []
             self.assertIn("0001", all_ids["requirement"])
             self.assertIn("simplicity-of-use", all_ids["tenet"])
 
+    def test_collect_all_ids_scans_the_project_once(self):
+        from scripts import validate_vibesafe_structure as v
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for rel in ["requirements/req0001_a.md", "cip/cip0001.md", "tenets/project/one-tenet.md"]:
+                path = os.path.join(tmp, rel)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write("---\nid: x\n---\n")
+
+            with mock.patch.object(v, "scan_project", wraps=v.scan_project) as scan:
+                v.collect_all_ids(tmp)
+        scan.assert_called_once()
+        self.assertIsNone(v._project)
+
+
+    def test_find_component_files_uses_project_model_of_validate_run(self):
+        from scripts import validate_vibesafe_structure as v
+        from vibesafe_project import scan_project  # pyright: ignore[reportMissingImports]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for rel in [
+                "backlog/features/2026-01-01_a.md",
+                "backlog/bugs/2026-01-02_b.md",
+                "backlog/features/templates/2026-01-03_c.md",
+                "backlog/index.md",
+                "tenets/project/one-tenet.md",
+                "tenets/tenet_template.md",
+            ]:
+                path = os.path.join(tmp, rel)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write("---\nid: x\n---\n")
+
+            walked = {ctype: sorted(v.find_component_files(tmp, ctype)) for ctype in COMPONENT_SPECS}
+            with mock.patch.object(v, "_project", scan_project(tmp, detect_code=False)), \
+                 mock.patch.object(v.os, "walk", side_effect=AssertionError("should use the model")):
+                modelled = {ctype: v.find_component_files(tmp, ctype) for ctype in COMPONENT_SPECS}
+
+        self.assertEqual(modelled, walked)
+        self.assertEqual(len(walked["backlog"]), 2)
+
+
+class TestValidateLibrary(unittest.TestCase):
+    """Test the in-process validate() entry point."""
+
+    def test_validate_returns_result_without_printing(self):
+        from scripts import validate_vibesafe_structure as v
+
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, "requirements"))
+            with open(os.path.join(tmp, "requirements", "req0001_test.md"), "w", encoding="utf-8") as f:
+                f.write("---\nid: \"0001\"\ntitle: \"Req\"\n---\n")
+
+            buf = io.StringIO()
+            with redirect_stdout(buf), mock.patch.object(v, "check_system_file_drift"):
+                result = v.validate(tmp, components=["requirement"], governance_drift=False)
+
+        self.assertIsInstance(result, ValidationResult)
+        self.assertIn("Found 1 requirement file(s)", result.info)
+        self.assertTrue(result.has_errors())  # missing required fields
+        self.assertEqual(buf.getvalue(), "")
+        self.assertIsNone(v._project)
+
+    def test_validate_reads_through_given_cache(self):
+        from scripts import validate_vibesafe_structure as v
+
+        cache = mock.Mock()
+        cache.lookup_header.return_value = {"id": "0001"}
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, "requirements"))
+            Path(tmp, "requirements", "req0001_test.md").write_text("---\nid: x\n---\n", encoding="utf-8")
+            with mock.patch.object(v, "check_system_file_drift"):
+                v.validate(tmp, components=["requirement"], governance_drift=False, cache=cache)
+
+        self.assertTrue(cache.lookup_header.called)
+        self.assertFalse(cache.save.called)
+        self.assertIsNone(v._frontmatter_cache)
+
+
+class TestMachineReadableOutput(unittest.TestCase):
+    """Test diagnostics and --format json/ndjson output."""
+
+    def _write_project(self, tmp):
+        os.makedirs(os.path.join(tmp, "requirements"))
+        with open(os.path.join(tmp, "requirements", "req0001_test.md"), "w", encoding="utf-8") as f:
+            f.write(
+                "---\nid: \"0001\"\ntitle: \"Req\"\nstatus: \"ready\"\npriority: \"High\"\n"
+                "created: \"2026-01-01\"\nlast_updated: \"2026-01-01\"\nrelated_tenets: [\"missing-tenet\"]\n"
+                "stakeholders: []\nrelated_cips: [\"0001\"]\n---\n"
+            )
+
+    def test_diagnostics_carry_rule_and_fix(self):
+        result = ValidationResult()
+        result.add_error("bad", "/tmp/x.md", rule="frontmatter", fix="do it")
+        result.add_warning("meh", rule="governance-drift")
+        result.add_fix("fixed")
+
+        self.assertEqual(result.errors, [("bad", "/tmp/x.md")])
+        self.assertEqual(
+            [(d["severity"], d["rule"], d["fix"]) for d in result.diagnostics],
+            [("error", "frontmatter", "do it"), ("warning", "governance-drift", None), ("fix", None, None)],
+        )
+        self.assertEqual(result.diagnostics[0]["file"], os.path.relpath("/tmp/x.md"))
+        self.assertIsNone(result.diagnostics[1]["file"])
+
+    def test_validate_streams_diagnostics_as_found(self):
+        from scripts import validate_vibesafe_structure as v
+
+        seen = []
+        with tempfile.TemporaryDirectory() as tmp:
+            self._write_project(tmp)
+            with mock.patch.object(v, "check_system_file_drift"):
+                result = v.validate(tmp, components=["requirement"], governance_drift=False, on_diagnostic=seen.append)
+
+        self.assertEqual(seen, result.diagnostics)
+        by_rule = {d["rule"]: d for d in seen}
+        self.assertEqual(by_rule["invalid-status"]["fix"], v._FIX_COMMAND)
+        self.assertEqual(by_rule["bottom-up"]["fix"], v._FIX_LINKS_COMMAND)
+        self.assertEqual(by_rule["broken-reference"]["severity"], "warning")
+
+    def _run_main(self, tmp, fmt):
+        from scripts import validate_vibesafe_structure as v
+
+        buf = io.StringIO()
+        with (
+            mock.patch.object(sys, "argv", ["prog", "--root", tmp, "--format", fmt, "--no-governance-drift", "--no-cache"]),
+            mock.patch.object(v, "check_system_file_drift"),
+            redirect_stdout(buf),
+        ):
+            with self.assertRaises(SystemExit) as se:
+                v.main()
+        return se.exception.code, buf.getvalue()
+
+    def test_main_format_ndjson_streams_lines_then_summary(self):
+        import json
+
+        with tempfile.TemporaryDirectory() as tmp:
+            self._write_project(tmp)
+            code, out = self._run_main(tmp, "ndjson")
+
+        records = [json.loads(line) for line in out.splitlines()]
+        self.assertEqual(code, 1)
+        self.assertEqual([r["type"] for r in records], ["diagnostic"] * (len(records) - 1) + ["summary"])
+        summary = records[-1]
+        self.assertFalse(summary["passed"])
+        self.assertEqual(summary["errors"], sum(r.get("severity") == "error" for r in records))
+        for record in records[:-1]:
+            self.assertEqual(set(record), {"type", "severity", "rule", "file", "message", "fix"})
+
+    def test_main_format_json_prints_single_document(self):
+        import json
+
+        with tempfile.TemporaryDirectory() as tmp:
+            self._write_project(tmp)
+            code, out = self._run_main(tmp, "json")
+
+        document = json.loads(out)
+        self.assertEqual(code, 1)
+        self.assertFalse(document["passed"])
+        self.assertEqual(document["warnings"], sum(d["severity"] == "warning" for d in document["diagnostics"]))
+        self.assertIn("Found 1 requirement file(s)", document["info"])
+        self.assertNotIn("\033[", out)
+
+    def test_main_format_json_paths_are_relative_to_the_root(self):
+        import json
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, "proj")
+            self._write_project(root)
+            original_dir = os.getcwd()
+            os.chdir(tmp)
+            try:
+                _code, out = self._run_main(root, "json")
+            finally:
+                os.chdir(original_dir)
+
+        files = {d["file"] for d in json.loads(out)["diagnostics"] if d["file"]}
+        self.assertEqual(files, {os.path.join("requirements", "req0001_test.md")})
+
+    def test_main_timings_json_records_phases(self):
+        import json
+        from scripts import validate_vibesafe_structure as v
+
+        with tempfile.TemporaryDirectory() as tmp:
+            self._write_project(tmp)
+            path = os.path.join(tmp, "timings.json")
+            with (
+                mock.patch.object(sys, "argv", ["prog", "--root", tmp, "--format", "json", "--no-governance-drift",
+                                                "--no-cache", "--timings-json", path]),
+                redirect_stdout(io.StringIO()) as buf,
+            ):
+                with self.assertRaises(SystemExit):
+                    v.main()
+            with open(path, encoding="utf-8") as f:
+                timings = json.load(f)
+
+        json.loads(buf.getvalue())  # the report on stdout is unchanged
+        phases = {row["phase"]: row for row in timings["phases"]}
+        self.assertEqual(timings["tool"], "validate")
+        self.assertIn("validate_components", phases)
+        self.assertEqual(phases["build_component_index"]["files_read"], 1)
+        self.assertEqual(phases["build_component_index"]["yaml_parses"], 1)
+
 
 class TestWriteFrontmatterAndAutoFix(unittest.TestCase):
     def test_write_frontmatter_returns_false_on_exception(self):
+        import frontmatter
         from scripts import validate_vibesafe_structure as v
 
-        with mock.patch.object(v.frontmatter, "load", side_effect=Exception("boom")):
+        with mock.patch.object(frontmatter, "load", side_effect=Exception("boom")):
             self.assertFalse(v.write_frontmatter("x.md", {"id": "0001"}, dry_run=False))
 
     def test_auto_fix_frontmatter_none_returns_false(self):
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Tests for the warm-cache daemon (templates/scripts/vibesafe_daemon.py).
+"""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+# Add repo root to path so we can import test_support
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from test_support import load_module_from_path
+
+load_module_from_path(
+    "scripts.vibesafe_daemon",
+    Path(__file__).resolve().parents[1] / "templates" / "scripts" / "vibesafe_daemon.py",
+)
+
+from scripts import vibesafe_daemon as vd  # pyright: ignore[reportMissingImports]
+
+
+class TestForward(unittest.TestCase):
+    def test_disabled_by_default(self):
+        with mock.patch.dict(os.environ, {"VIBESAFE_DAEMON": ""}), \
+             mock.patch.object(vd, "_send", side_effect=AssertionError("should not connect")):
+            self.assertIsNone(vd.forward("whats_next", []))
+
+    def test_starts_daemon_when_none_is_running(self):
+        with mock.patch.dict(os.environ, {"VIBESAFE_DAEMON": "1"}), \
+             mock.patch.object(vd, "_send", side_effect=FileNotFoundError), \
+             mock.patch.object(vd, "start") as m_start:
+            self.assertIsNone(vd.forward("whats_next", []))
+        m_start.assert_called_once()
+
+    def test_prints_reply_and_exits_with_its_code(self):
+        reply = {"stdout": "report\n", "stderr": "", "exit_code": 3}
+        out = io.StringIO()
+        with mock.patch.dict(os.environ, {"VIBESAFE_DAEMON": "1"}), \
+             mock.patch.object(vd, "_send", return_value=reply), \
+             redirect_stdout(out):
+            with self.assertRaises(SystemExit) as ctx:
+                vd.forward("validate", ["--strict"])
+        self.assertEqual(ctx.exception.code, 3)
+        self.assertEqual(out.getvalue(), "report\n")
+
+    def test_watch_runs_locally(self):
+        with mock.patch.dict(os.environ, {"VIBESAFE_DAEMON": "1"}), \
+             mock.patch.object(vd, "_send", side_effect=AssertionError("should not connect")):
+            self.assertIsNone(vd.forward("whats_next", ["--watch"]))
+
+    def test_slow_daemon_runs_locally_without_starting_another(self):
+        import socket
+
+        with mock.patch.dict(os.environ, {"VIBESAFE_DAEMON": "1"}), \
+             mock.patch.object(vd, "_send", side_effect=socket.timeout) as m_send, \
+             mock.patch.object(vd, "start") as m_start:
+            self.assertIsNone(vd.forward("whats_next", []))
+        self.assertEqual(m_send.call_args[0][1:], (vd.REPLY_TIMEOUT, vd.CONNECT_TIMEOUT))
+        m_start.assert_not_called()
+
+    @unittest.skipUnless(hasattr(__import__("socket"), "AF_UNIX"), "Unix sockets required")
+    def test_send_gives_up_on_a_daemon_that_never_answers(self):
+        import socket
+
+        original_dir = os.getcwd()
+        test_dir = tempfile.mkdtemp()
+        os.chdir(test_dir)
+        try:
+            os.makedirs(os.path.dirname(vd.SOCKET_PATH))
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+                server.bind(vd.SOCKET_PATH)
+                server.listen(1)
+                start = time.monotonic()
+                with self.assertRaises(socket.timeout):
+                    vd._send({"tool": "whats_next"}, timeout=0.2)
+                self.assertLess(time.monotonic() - start, 5)
+        finally:
+            os.chdir(original_dir)
+            shutil.rmtree(test_dir)
+
+
+@unittest.skipUnless(hasattr(__import__("socket"), "AF_UNIX"), "Unix sockets required")
+class TestDaemonServer(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.original_dir = os.getcwd()
+        os.chdir(self.test_dir)
+        os.makedirs("cip")
+        self._write_cip("Proposed")
+
+        self.thread = threading.Thread(target=vd.serve, kwargs={"idle_timeout": 30}, daemon=True)
+        self.thread.start()
+        deadline = time.monotonic() + 30
+        while not os.path.exists(vd.SOCKET_PATH):
+            self.assertLess(time.monotonic(), deadline, "daemon did not start")
+            time.sleep(0.01)
+
+    def tearDown(self):
+        try:
+            vd._send({"command": "stop"}, timeout=10)
+        except OSError:
+            pass
+        self.thread.join(10)
+        os.chdir(self.original_dir)
+        shutil.rmtree(self.test_dir)
+
+    def _write_cip(self, status):
+        with open("cip/cip0001.md", "w") as f:
+            f.write(f'---\nid: "0001"\ntitle: "First"\nstatus: "{status}"\n---\n\n# CIP-0001\n')
+
+    def _run(self, tool, argv):
+        return vd._send({"tool": tool, "argv": argv, "version": vd.scripts_version(),
+                         "env": vd.tool_environment()}, timeout=30)
+
+    def test_answers_whats_next_and_sees_file_changes(self):
+        argv = ["--no-git", "--no-update", "--no-color", "--skip-validation"]
+        reply = self._run("whats_next", argv)
+        self.assertEqual(reply["exit_code"], 0)
+        self.assertIn("Proposed: 1", reply["stdout"])
+
+        self._write_cip("Accepted")
+        deadline = time.monotonic() + 10
+        while "Accepted: 1" not in reply["stdout"]:
+            self.assertLess(time.monotonic(), deadline, reply["stdout"])
+            time.sleep(0.05)
+            reply = self._run("whats_next", argv)
+
+    def test_no_color_does_not_leak_into_later_requests(self):
+        self._run("whats_next", ["--no-git", "--no-update", "--no-color", "--skip-validation"])
+        reply = self._run("whats_next", ["--no-git", "--no-update", "--skip-validation"])
+        self.assertIn("\033[", reply["stdout"])
+
+    def test_validator_exit_code(self):
+        reply = self._run("validate", ["--no-color", "--no-governance-drift", "--jobs", "1"])
+        # The CIP lacks created/last_updated/author, so validation fails
+        self.assertEqual(reply["exit_code"], 1)
+        self.assertIn("Missing required field: 'author'", reply["stdout"])
+
+    def test_client_with_other_environment_runs_the_tool_itself(self):
+        env = dict(vd.tool_environment(), VIBESAFE_NO_CACHE="1")
+        reply = vd._send({"tool": "whats_next", "argv": ["--no-git", "--no-update"],
+                          "version": vd.scripts_version(), "env": env}, timeout=30)
+        self.assertIn("error", reply)
+        self.assertFalse(reply.get("restart"))
+        # The daemon keeps serving clients with its own environment
+        self.assertEqual(self._run("whats_next", ["--no-git", "--no-update", "--skip-validation"])["exit_code"], 0)
+
+        with mock.patch.dict(os.environ, {"VIBESAFE_DAEMON": "1", "VIBESAFE_NO_CACHE": "1"}), \
+             mock.patch.object(vd, "start", side_effect=AssertionError("restarted")):
+            self.assertIsNone(vd.forward("whats_next", ["--no-git", "--no-update"]))
+
+    def test_stale_client_is_told_to_restart(self):
+        reply = vd._send({"tool": "whats_next", "argv": [], "version": "other"}, timeout=10)
+        self.assertTrue(reply.get("restart"))
+        self.thread.join(10)
+        self.assertFalse(self.thread.is_alive())
+        self.assertFalse(os.path.exists(vd.SOCKET_PATH))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared frontmatter helpers (templates/scripts/vibesafe_frontmatter.py).
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+# Add repo root to path so we can import test_support
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from test_support import load_module_from_path
+
+load_module_from_path(
+    "scripts.vibesafe_frontmatter",
+    Path(__file__).resolve().parents[1] / "templates" / "scripts" / "vibesafe_frontmatter.py",
+)
+
+from scripts import vibesafe_frontmatter as vf  # pyright: ignore[reportMissingImports]
+
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CORPUS_DIRS = ("cip", "backlog", "requirements", "tenets")
+
+
+def _age(path, seconds=60):
+    """Backdate a file so it is outside the racy-mtime window."""
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+class TestReadHeader(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _write(self, data: bytes) -> str:
+        path = os.path.join(self.root, "doc.md")
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_header_and_body_offset(self):
+        path = self._write(b"---\nid: x\ntitle: T\n---\n\n# Body\n")
+        doc = vf.read_header(path)
+        self.assertEqual(doc.header, "id: x\ntitle: T\n")
+        self.assertEqual(doc.body_offset, len(b"---\nid: x\ntitle: T\n---\n"))
+        self.assertEqual(doc.body, "\n# Body\n")
+
+    def test_stops_at_closing_delimiter(self):
+        path = self._write(b"---\nid: x\n---\n" + b"log line\n" * 1000)
+        with open(path, "rb") as f:
+            doc = vf.read_header(f)
+            self.assertEqual(f.tell(), doc.body_offset)
+        self.assertEqual(doc.header, "id: x\n")
+        self.assertEqual(doc.body_offset, len(b"---\nid: x\n---\n"))
+
+    def test_no_frontmatter(self):
+        for data in (b"# Title\n\n---\nnot: header\n---\n", b"---\nid: x\nno closing\n", b""):
+            doc = vf.read_header(self._write(data))
+            self.assertIsNone(doc.header)
+            self.assertEqual(doc.body_offset, 0)
+
+    def test_leading_blank_lines_and_long_delimiters(self):
+        doc = vf.read_header(self._write(b"\n\n----\nid: x\n-----  \nbody\n"))
+        self.assertEqual(doc.header, "id: x\n")
+        self.assertEqual(doc.body, "body\n")
+
+    def test_read_body_prefix_translates_newlines(self):
+        doc = vf.read_header(self._write("---\r\nid: x\r\n---\r\nh\u00e9llo\r\nworld\r\n".encode("utf-8")))
+        self.assertEqual(doc.header, "id: x\r\n")
+        self.assertEqual(doc.read_body(max_chars=7), "h\u00e9llo\nw")
+        self.assertEqual(doc.read_body(), "h\u00e9llo\nworld\n")
+
+
+def _typed(value):
+    """Pair values with their types so 1 == True or date == str mismatches show up."""
+    if isinstance(value, dict):
+        return {k: _typed(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_typed(v) for v in value]
+    return (type(value).__name__, value)
+
+
+class TestParseYamlHeader(unittest.TestCase):
+    """Differential tests: parse_yaml_header() must agree with yaml.SafeLoader."""
+
+    def assertSameAsSafeLoader(self, text):
+        try:
+            expected = yaml.load(text, Loader=yaml.SafeLoader)
+        except (yaml.YAMLError, ValueError) as e:
+            with self.assertRaises(type(e)):
+                vf.parse_yaml_header(text)
+            return
+        self.assertEqual(_typed(vf.parse_yaml_header(text)), _typed(expected), text)
+
+    def test_repo_corpus(self):
+        headers = []
+        for directory in CORPUS_DIRS:
+            for path in sorted((REPO_ROOT / directory).rglob("*.md")):
+                header = vf.read_header(str(path)).header
+                if header is not None:
+                    headers.append((path, header))
+        self.assertGreater(len(headers), 50)
+
+        fast = 0
+        for path, header in headers:
+            with self.subTest(path=str(path.relative_to(REPO_ROOT))):
+                self.assertSameAsSafeLoader(header)
+                try:
+                    vf._parse_flat(header)
+                    fast += 1
+                except vf._Unsupported:
+                    pass
+        # The fast path should handle nearly all real component headers.
+        self.assertGreaterEqual(fast, 0.9 * len(headers))
+
+    def test_scalar_and_layout_cases(self):
+        cases = [
+            "",
+            "# just a comment\n",
+            "id: '0001'\ntitle: Plain title with spaces\n",
+            "id: 0001\nother: 0008\nhex: 0x1F\nsexagesimal: 1:20\nfloat: 1.5\nexp: 1e3\n",
+            "created: 2026-01-03\nquoted: '2026-01-03'\nstamp: 2026-01-03 10:00:00\nbad: 2026-13-01\n",
+            "a: yes\nb: No\nc: ~\nd: null\ne: off\nf:\n",
+            "yes: key resolves to a bool\n",
+            "title: 'It''s quoted'\nother: \"double quoted\"\nescaped: \"tab\\there\"\n",
+            "compressed: true  # set after compressing\nstatus: \"Active\"  # Active, Archived\n",
+            "tags: [a, 'b', \"c\"]  # comment\nempty: []\nspaced: [ ]\ntrailing: [x,]\n",
+            "tags:\n- one\n- two\nnext: value\n",
+            "tags:\n  - one\n\n  - two  # comment\n",
+            "tags: # comment\n  - one\n",
+            "tags:\n- one\n  - two\n",
+            "nested:\n  key: value\n",
+            "text: continues\n  on the next line\n",
+            "block: |\n  literal\n",
+            "anchor: &a value\nalias: *a\n",
+            "merge: <<\nvalue: =\n",
+            "colon: a: b\n",
+            "hash: C# and F#\nurl: http://example.com\n",
+            "crlf: value\r\nlist:\r\n- a\r\n",
+            "dup: 1\ndup: 2\n",
+        ]
+        for text in cases:
+            with self.subTest(text=text):
+                self.assertSameAsSafeLoader(text)
+
+    def test_fast_path_declines_tabs_and_odd_line_breaks(self):
+        # libyaml and the pure-Python loader disagree on some of these, so the
+        # fast path must never make the call itself.
+        for text in ("tabs:\tvalue\n", "a: b\rc: d\n", "\ufeffa: b\n", "a: b\u2028c\n"):
+            with self.subTest(text=text), self.assertRaises(vf._Unsupported):
+                vf._parse_flat(text)
+
+    def test_falls_back_for_unsupported_yaml(self):
+        with mock.patch.object(yaml, "load", wraps=yaml.load) as load:
+            vf.parse_yaml_header("id: '0001'\ntags:\n- a\n")
+            load.assert_not_called()
+            vf.parse_yaml_header("nested:\n  key: value\n")
+            load.assert_called_once()
+
+
+class TestFrontmatterCache(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.root, "cip"))
+        self.path = os.path.join(self.root, "cip", "cip0001.md")
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("---\nid: \"0001\"\ncreated: 2026-01-03\n---\n\n# Body\n")
+        _age(self.path)
+        self.calls = []
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def parse(self, text):
+        self.calls.append(text)
+        return {"len": len(text), "created": date(2026, 1, 3)}
+
+    def test_warm_lookup_does_not_reparse(self):
+        cache = vf.FrontmatterCache(self.root)
+        first = cache.lookup(self.path, "ns", self.parse)
+        cache.save()
+
+        warm = vf.FrontmatterCache(self.root)
+        with mock.patch("builtins.open", side_effect=AssertionError("file should not be read")):
+            second = warm.lookup(self.path, "ns", self.parse)
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(first, second)
+        self.assertEqual(second["created"], date(2026, 1, 3))
+        self.assertEqual(warm.hits, 1)
+
+    def test_changed_file_is_reparsed(self):
+        cache = vf.FrontmatterCache(self.root)
+        cache.lookup(self.path, "ns", self.parse)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("more\n")
+        _age(self.path, 30)
+        cache.lookup(self.path, "ns", self.parse)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_touched_but_identical_file_uses_hash(self):
+        cache = vf.FrontmatterCache(self.root)
+        cache.lookup(self.path, "ns", self.parse)
+        os.utime(self.path, None)  # new mtime, same content
+        cache.lookup(self.path, "ns", self.parse)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_header_lookup_survives_body_edits(self):
+        cache = vf.FrontmatterCache(self.root)
+        cache.lookup_header(self.path, "hdr", self.parse)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("implementation log entry\n")
+        _age(self.path, 30)
+        value = cache.lookup_header(self.path, "hdr", self.parse)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(self.calls[0], 'id: "0001"\ncreated: 2026-01-03\n')
+        self.assertEqual(value["created"], date(2026, 1, 3))
+
+    def test_header_lookup_reparses_header_edits(self):
+        cache = vf.FrontmatterCache(self.root)
+        cache.lookup_header(self.path, "hdr", self.parse)
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("---\nid: \"0002\"\n---\n")
+        _age(self.path, 30)
+        cache.lookup_header(self.path, "hdr", self.parse)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_lookup_headers_parses_misses_in_one_call(self):
+        other = os.path.join(self.root, "cip", "cip0002.md")
+        with open(other, "w", encoding="utf-8") as f:
+            f.write("---\nid: \"0002\"\n---\n")
+        _age(other)
+        cache = vf.FrontmatterCache(self.root)
+        cache.lookup_header(self.path, "hdr", self.parse)
+        batches = []
+
+        def parse_many(headers):
+            batches.append(headers)
+            return [self.parse(header) for header in headers]
+
+        missing = os.path.join(self.root, "cip", "missing.md")
+        values = cache.lookup_headers([self.path, other, missing], "hdr", parse_many, default="gone")
+
+        self.assertEqual(batches, [['id: "0002"\n']])
+        self.assertEqual(values[0], cache.lookup_header(self.path, "hdr", self.parse))
+        self.assertEqual(values[1]["len"], len('id: "0002"\n'))
+        self.assertEqual(values[2], "gone")
+        self.assertEqual(cache.lookup_header(other, "hdr", self.parse), values[1])
+        self.assertEqual(len(self.calls), 2)
+
+    def test_lookups_from_several_threads_share_entries(self):
+        import threading
+
+        cache = vf.FrontmatterCache(self.root)
+        results = {}
+
+        def scan(namespace):
+            results[namespace] = [cache.lookup_header(self.path, namespace, self.parse) for _ in range(50)]
+
+        threads = [threading.Thread(target=scan, args=(f"ns{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        cache.save()
+
+        self.assertEqual(len(self.calls), 4)
+        warm = vf.FrontmatterCache(self.root)
+        for namespace, values in results.items():
+            self.assertEqual(values, [values[0]] * 50)
+            self.assertEqual(warm.lookup_header(self.path, namespace, self.parse), values[0])
+        self.assertEqual(len(self.calls), 4)
+
+    def test_body_edit_invalidates_whole_file_values(self):
+        cache = vf.FrontmatterCache(self.root)
+        cache.lookup(self.path, "full", self.parse)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("more\n")
+        _age(self.path, 30)
+        cache.lookup_header(self.path, "hdr", self.parse)
+        cache.lookup(self.path, "full", self.parse)
+        self.assertEqual(len(self.calls), 3)
+
+    def test_returns_fresh_objects(self):
+        cache = vf.FrontmatterCache(self.root)
+        cache.lookup(self.path, "ns", lambda _t: {"items": []})
+        value = cache.lookup(self.path, "ns", self.parse)
+        value["items"].append("x")
+        self.assertEqual(cache.lookup(self.path, "ns", self.parse)["items"], [])
+
+    def test_parse_errors_are_not_cached(self):
+        cache = vf.FrontmatterCache(self.root)
+
+        def boom(_text):
+            raise ValueError("bad yaml")
+
+        with self.assertRaises(ValueError):
+            cache.lookup(self.path, "ns", boom)
+        cache.lookup(self.path, "ns", self.parse)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_save_merges_namespaces_from_other_writers(self):
+        a = vf.FrontmatterCache(self.root)
+        b = vf.FrontmatterCache(self.root)
+        a.lookup(self.path, "tool_a", lambda _t: "A")
+        b.lookup(self.path, "tool_b", lambda _t: "B")
+        a.save()
+        b.save()
+
+        with open(os.path.join(self.root, vf.CACHE_DIR, vf.CACHE_FILE), encoding="utf-8") as f:
+            data = json.load(f)
+        values = data["entries"][os.path.join("cip", "cip0001.md")]["values"]
+        self.assertEqual(values, {"tool_a": "A", "tool_b": "B"})
+
+    def test_prune_removes_deleted_files(self):
+        cache = vf.FrontmatterCache(self.root)
+        cache.lookup(self.path, "ns", self.parse)
+        cache.save()
+        os.unlink(self.path)
+        cache.prune()
+        cache.save()
+        self.assertEqual(vf.FrontmatterCache(self.root).entries, {})
+
+    def test_corrupt_cache_file_is_ignored(self):
+        os.makedirs(os.path.join(self.root, vf.CACHE_DIR))
+        with open(os.path.join(self.root, vf.CACHE_DIR, vf.CACHE_FILE), "w") as f:
+            f.write("{not json")
+        cache = vf.FrontmatterCache(self.root)
+        self.assertEqual(cache.entries, {})
+
+    def test_open_cache_respects_env(self):
+        with mock.patch.dict(os.environ, {"VIBESAFE_NO_CACHE": "1"}):
+            self.assertIsNone(vf.open_cache(self.root))
+        with mock.patch.dict(os.environ, {"VIBESAFE_NO_CACHE": ""}):
+            self.assertIsNotNone(vf.open_cache(self.root))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared git state provider (templates/scripts/vibesafe_git.py).
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add repo root to path so we can import test_support
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from test_support import load_module_from_path
+
+load_module_from_path(
+    "scripts.vibesafe_git",
+    Path(__file__).resolve().parents[1] / "templates" / "scripts" / "vibesafe_git.py",
+)
+
+from scripts import vibesafe_git as vg  # pyright: ignore[reportMissingImports]
+
+
+class TestParseStatus(unittest.TestCase):
+    def test_branch_headers(self):
+        state = vg.parse_status(b"# branch.oid (initial)\0# branch.head (detached)\0")
+        self.assertIsNone(state.head)
+        self.assertEqual(state.branch, "")
+        self.assertIsNone(state.upstream)
+        self.assertIsNone(state.ahead)
+
+        state = vg.parse_status(
+            b"# branch.oid 0123abc\0# branch.head feature/x\0"
+            b"# branch.upstream origin/feature/x\0# branch.ab +0 -3\0"
+        )
+        self.assertEqual((state.head, state.branch), ("0123abc", "feature/x"))
+        self.assertEqual((state.upstream, state.ahead, state.behind), ("origin/feature/x", 0, 3))
+
+    def test_entries_keep_spaces_and_original_paths(self):
+        state = vg.parse_status(b"\0".join([
+            b"1 .M N... 100644 100644 100644 a b dir/with space.md",
+            b"2 RM N... 100644 100644 100644 a b R087 new name.py",
+            b"old -> name.py",
+            b"2 C. N... 100644 100644 100644 a b C100 copy.md",
+            b"orig.md",
+            b"u UU N... 100644 100644 100644 100644 a b c conflict.md",
+            "? café.md".encode("utf-8"),
+            b"! ignored.log",
+            b"",
+        ]))
+        self.assertEqual(state.changes, [
+            {"status": "M", "path": "dir/with space.md", "orig_path": None},
+            {"status": "RM", "path": "new name.py", "orig_path": "old -> name.py"},
+            {"status": "C", "path": "copy.md", "orig_path": "orig.md"},
+            {"status": "UU", "path": "conflict.md", "orig_path": None},
+        ])
+        self.assertEqual(state.untracked, ["café.md"])
+        self.assertEqual(state.changed_paths()[-1], "café.md")
+
+    def test_paths_relative_to_prefix(self):
+        state = vg.parse_status(b"\0".join([
+            b"2 R. N... 100644 100644 100644 a b R100 sub/new.md",
+            b"top.md",
+            b"? sub/cip/",
+            b"? build/",
+            b"",
+        ]), "sub/")
+        self.assertEqual(state.changes[0]["path"], "new.md")
+        self.assertEqual(state.changes[0]["orig_path"], "../top.md")
+        self.assertEqual(state.untracked, ["cip/", "../build/"])
+
+
+@unittest.skipUnless(shutil.which("git"), "git is not installed")
+class TestReadGitState(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self._git("init", "-q", "-b", "main")
+        self._write("cip/cip0001.md", "---\nid: \"0001\"\n---\n")
+        self._write("old name.md", "text\n")
+        self._git("add", ".")
+        self._git("-c", "user.name=Test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "Initial commit")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _git(self, *args):
+        subprocess.run(["git", "-C", self.root, *args], check=True, capture_output=True)
+
+    def _write(self, rel_path, text):
+        path = os.path.join(self.root, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_reads_branch_renames_untracked_and_log(self):
+        self._git("mv", "old name.md", "new é.md")
+        self._write("cip/cip0001.md", "---\nid: \"0001\"\ntitle: changed\n---\n")
+        self._write("backlog/features/new.md", "new\n")
+        self._write("build/out/artifact.o", "binary\n")
+
+        state = vg.read_git_state(self.root, vg.UNTRACKED_PATHSPECS, recent_commits=5)
+
+        self.assertEqual(state.branch, "main")
+        self.assertIsNotNone(state.head)
+        self.assertEqual(state.recent_commits[0]["message"], "Initial commit")
+        changes = {change["path"]: change for change in state.changes}
+        self.assertEqual(changes["new é.md"]["orig_path"], "old name.md")
+        self.assertEqual(changes["new é.md"]["status"], "R")
+        self.assertEqual(changes["cip/cip0001.md"]["status"], "M")
+        # Untracked directories are collapsed repository-wide; component
+        # scanning gets each file below the VibeSafe pathspecs only
+        self.assertEqual(sorted(state.untracked), ["backlog/", "build/"])
+        self.assertEqual(state.component_untracked, ["backlog/features/new.md"])
+        self.assertEqual(vg.read_git_state(self.root).component_untracked, [])
+
+    def test_paths_are_relative_to_a_subdirectory_project(self):
+        self._write("project/cip/cip0002.md", "new\n")
+        self._write("other/notes.md", "new\n")
+        self._write("project/readme.md", "text\n")
+        self._git("add", "project/readme.md")
+        self._git("-c", "user.name=Test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "Add project")
+        self._write("project/readme.md", "changed\n")
+        self._write("cip/cip0001.md", "changed\n")
+
+        state = vg.read_git_state(os.path.join(self.root, "project"), ["cip"])
+
+        self.assertEqual(sorted(change["path"] for change in state.changes), ["../cip/cip0001.md", "readme.md"])
+        self.assertEqual(sorted(state.untracked), ["../other/", "cip/"])
+        self.assertEqual(state.component_untracked, ["cip/cip0002.md"])
+
+    def test_outside_a_repository(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(vg.read_git_state(tmp))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass project model (templates/scripts/vibesafe_project.py).
+"""
+
+import glob
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add repo root to path so we can import test_support
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from test_support import load_module_from_path
+
+load_module_from_path(
+    "scripts.vibesafe_project",
+    Path(__file__).resolve().parents[1] / "templates" / "scripts" / "vibesafe_project.py",
+)
+
+from scripts import vibesafe_project as vp  # pyright: ignore[reportMissingImports]
+
+
+class TestScanProject(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.original_dir = os.getcwd()
+        os.chdir(self.test_dir)
+
+    def tearDown(self):
+        os.chdir(self.original_dir)
+        shutil.rmtree(self.test_dir)
+
+    def _touch(self, rel):
+        os.makedirs(os.path.dirname(rel) or ".", exist_ok=True)
+        Path(rel).write_text("x\n", encoding="utf-8")
+
+    def test_listings_match_glob(self):
+        for rel in [
+            "cip/cip0001.md",
+            "cip/cip0002.md",
+            "cip/cip_template.md",
+            "cip/.cip0003.md",
+            "cip/notes.txt",
+            "backlog/features/2026-01-01_a.md",
+            "backlog/bugs/2026-01-02_b.md",
+            "tenets/project/tenet-one.md",
+            "tenets/vibesafe/vibesafe-tenet.md",
+            "README.md",
+        ]:
+            self._touch(rel)
+
+        model = vp.scan_project()
+
+        self.assertEqual(model.files("cip", "cip*.md"), sorted(glob.glob("cip/cip*.md")))
+        self.assertEqual(model.files("backlog/features/", "*.md"), sorted(glob.glob("backlog/features/*.md")))
+        self.assertEqual(
+            model.walk("tenets", "*.md"),
+            sorted(str(p) for p in Path("tenets").rglob("*.md")),
+        )
+        self.assertTrue(model.is_dir("backlog/bugs"))
+        self.assertFalse(model.is_dir("requirements"))
+        self.assertTrue(model.exists("README.md"))
+        self.assertFalse(model.exists("cip/missing.md"))
+
+    def test_single_walk_per_directory(self):
+        for rel in ["cip/cip0001.md", "backlog/features/a.md", "tenets/t.md", "src/pkg/mod.py", "docs/x.py"]:
+            self._touch(rel)
+
+        real_scandir = os.scandir
+        seen = []
+
+        def counting_scandir(path):
+            seen.append(os.path.normpath(path))
+            return real_scandir(path)
+
+        with mock.patch.object(vp.os, "scandir", side_effect=counting_scandir):
+            vp.scan_project()
+
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertNotIn("docs", seen)
+
+    def test_has_code_from_source_dir(self):
+        self._touch("src/deep/nested/main.go")
+        self.assertTrue(vp.scan_project().has_code)
+
+    def test_has_code_ignores_excluded_dirs(self):
+        for rel in ["scripts/tool.py", "mypkg/node_modules/lib.js", ".hidden/x.py", "setup.py", "cip/cip0001.md"]:
+            self._touch(rel)
+        self.assertFalse(vp.scan_project().has_code)
+
+    def test_has_code_from_package_dir(self):
+        self._touch("mypkg/mypkg/__init__.py")
+        self.assertTrue(vp.scan_project().has_code)
+
+    def test_refresh_tracks_added_removed_and_new_dirs(self):
+        self._touch("cip/cip0001.md")
+        self._touch("backlog/features/a.md")
+        model = vp.scan_project()
+
+        self._touch("cip/cip0002.md")
+        os.remove("backlog/features/a.md")
+        self._touch("backlog/bugs/new/b.md")
+        for rel in ["cip/cip0002.md", "backlog/features/a.md", "backlog/bugs"]:
+            model.refresh(rel)
+
+        self.assertEqual(model.files("cip", "cip*.md"), sorted(glob.glob("cip/cip*.md")))
+        self.assertEqual(model.files("backlog/features"), [])
+        self.assertEqual(model.walk("backlog", "*.md"), sorted(str(p) for p in Path("backlog").rglob("*.md")))
+
+        shutil.rmtree("backlog/bugs")
+        model.refresh("backlog/bugs")
+        self.assertFalse(model.is_dir("backlog/bugs"))
+        self.assertFalse(model.is_dir("backlog/bugs/new"))
+        self.assertFalse(model.exists("backlog/bugs"))
+
+    def test_counts_as_code_follows_walk_rules(self):
+        self.assertTrue(vp._counts_as_code("src/node_modules/x.js"))
+        self.assertTrue(vp._counts_as_code("mypkg/core.py"))
+        self.assertFalse(vp._counts_as_code("setup.py"))
+        self.assertFalse(vp._counts_as_code("scripts/tool.py"))
+        self.assertFalse(vp._counts_as_code(".github/x.py"))
+        self.assertFalse(vp._counts_as_code("mypkg/node_modules/lib.js"))
+
+    @unittest.skipUnless(shutil.which("git"), "git is not installed")
+    def test_has_code_from_git_skips_ignored_files(self):
+        subprocess.run(["git", "init", "-q"], check=True)
+        Path(".gitignore").write_text("dist/\n", encoding="utf-8")
+        self._touch("dist/bundle/app.py")
+        self._touch("cip/cip0001.md")
+        with mock.patch.object(vp, "_contains_code", side_effect=AssertionError("walked")):
+            self.assertFalse(vp.scan_project().has_code)
+            # Untracked files count as long as they are not ignored
+            self._touch("tools/cli/main.rs")
+            self.assertTrue(vp.scan_project().has_code)
+
+    def test_has_code_outside_git_falls_back_to_walk(self):
+        self._touch("tools/cli/main.rs")
+        with mock.patch.object(vp, "_git_has_code", return_value=None) as git_has_code:
+            self.assertTrue(vp.scan_project().has_code)
+        git_has_code.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Tests for the prompt generation engine (templates/scripts/vibesafe_prompts.py).
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add repo root to path so we can import test_support
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from test_support import load_module_from_path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+load_module_from_path(
+    "scripts.vibesafe_prompts",
+    REPO_ROOT / "templates" / "scripts" / "vibesafe_prompts.py",
+)
+
+from scripts import vibesafe_prompts as vp  # pyright: ignore[reportMissingImports]
+
+
+class TestGenerate(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.prompts_dir = os.path.join(self.root, "vibesafe", "templates", "prompts")
+        self._write("vibesafe/templates/prompts/always-apply/vibesafe_general.md", "# General\n")
+        self._write("vibesafe/templates/prompts/context-specific/cip.md", "# CIPs\n")
+        self._write("vibesafe/templates/prompts/context-specific/custom.md", "# Custom\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _write(self, rel_path, text):
+        path = os.path.join(self.root, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def _read(self, rel_path):
+        with open(os.path.join(self.root, rel_path), encoding="utf-8") as f:
+            return f.read()
+
+    def test_all_platforms_in_one_pass(self):
+        with mock.patch.object(vp, "read_prompts", wraps=vp.read_prompts) as read_prompts:
+            result = vp.generate(self.prompts_dir, vp.PLATFORMS, root=self.root)
+        read_prompts.assert_called_once()
+
+        self.assertEqual(self._read(".cursor/rules/vibesafe_general.mdc"),
+                         "---\ndescription: VibeSafe General Development Guidelines - Best practices "
+                         "for working with VibeSafe projects\nglobs: \"**/*\"\nalwaysApply: true\n---\n# General\n")
+        self.assertIn("globs: cip/**/*.md\n", self._read(".cursor/rules/cip.mdc"))
+        self.assertIn("description: VibeSafe custom guidance\n", self._read(".cursor/rules/custom.mdc"))
+        claude = self._read("CLAUDE.md")
+        self.assertTrue(claude.startswith("# VibeSafe Project Memory for Claude Code\n"))
+        self.assertTrue(claude.endswith("# General\n\n---\n\n# CIPs\n\n---\n\n# Custom\n\n---\n\n"))
+        self.assertIn("# CIPs\n", self._read(".github/copilot-instructions.md"))
+        self.assertIn("# CIPs\n", self._read("AGENTS.md"))
+        self.assertEqual(len(result["written"]), 6)
+
+        with open(os.path.join(self.root, ".vibesafe", "prompts.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest["outputs"]["CLAUDE.md"]["platform"], "claude")
+        self.assertEqual(manifest["outputs"][".cursor/rules/cip.mdc"]["sources"],
+                         ["templates/prompts/context-specific/cip.md"])
+
+    def test_unchanged_outputs_are_not_rewritten(self):
+        vp.generate(self.prompts_dir, vp.PLATFORMS, root=self.root)
+        claude = os.path.join(self.root, "CLAUDE.md")
+        os.utime(claude, ns=(1_000_000_000, 1_000_000_000))
+
+        result = vp.generate(self.prompts_dir, vp.PLATFORMS, root=self.root)
+        self.assertEqual(result["written"], [])
+        self.assertEqual(os.stat(claude).st_mtime_ns, 1_000_000_000)
+
+        self._write("vibesafe/templates/prompts/context-specific/cip.md", "# CIPs, revised\n")
+        result = vp.generate(self.prompts_dir, vp.PLATFORMS, root=self.root)
+        self.assertIn("CLAUDE.md", result["written"])
+        self.assertIn(os.path.join(".cursor", "rules", "cip.mdc"), result["written"])
+        self.assertNotIn(os.path.join(".cursor", "rules", "vibesafe_general.mdc"), result["written"])
+
+    def test_outputs_of_removed_prompts_are_deleted_unless_edited(self):
+        self._write("vibesafe/templates/prompts/context-specific/old.md", "# Old\n")
+        self._write("vibesafe/templates/prompts/context-specific/kept.md", "# Kept\n")
+        vp.generate(self.prompts_dir, ["cursor", "claude"], root=self.root)
+        with open(os.path.join(self.root, ".cursor", "rules", "kept.mdc"), "a") as f:
+            f.write("Local note\n")
+        os.remove(os.path.join(self.prompts_dir, "context-specific", "old.md"))
+        os.remove(os.path.join(self.prompts_dir, "context-specific", "kept.md"))
+
+        result = vp.generate(self.prompts_dir, ["cursor"], root=self.root)
+
+        self.assertEqual(result["removed"], [os.path.join(".cursor", "rules", "old.mdc")])
+        self.assertFalse(os.path.exists(os.path.join(self.root, ".cursor", "rules", "old.mdc")))
+        self.assertTrue(self._read(".cursor/rules/kept.mdc").endswith("Local note\n"))
+        # CLAUDE.md belongs to a platform that was not generated this time
+        self.assertTrue(os.path.exists(os.path.join(self.root, "CLAUDE.md")))
+
+    def test_tenet_rules_come_from_the_projects_combine_tenets(self):
+        tenets_dir = os.path.join(self.root, "tenets")
+        os.makedirs(tenets_dir)
+        shutil.copy(REPO_ROOT / "templates" / "tenets" / "combine_tenets.py", tenets_dir)
+        self._write("tenets/project/focus.md", "## Tenet: focus\n\n**Title**: Focus\n\n**Description**: Do one thing.\n")
+
+        with mock.patch.dict(os.environ, {"VIBESAFE_NO_CACHE": "1"}):
+            vp.generate(self.prompts_dir, ["copilot"], tenets_dir, root=self.root)
+            self.assertFalse(os.path.exists(os.path.join(self.root, ".cursor", "rules", "project_tenet_focus.mdc")))
+            vp.generate(self.prompts_dir, ["cursor"], tenets_dir, root=self.root)
+
+        self.assertIn("# Project Tenet: Focus", self._read(".cursor/rules/project_tenet_focus.mdc"))
+        with open(os.path.join(self.root, ".vibesafe", "prompts.json"), encoding="utf-8") as f:
+            outputs = json.load(f)["outputs"]
+        self.assertEqual(outputs[os.path.join(".cursor", "rules", "project_tenet_focus.mdc")]["sources"],
+                         [os.path.join("tenets", "project", "focus.md")])
+
+    def test_a_broken_combine_tenets_still_records_the_base_outputs(self):
+        tenets_dir = os.path.join(self.root, "tenets")
+        os.makedirs(tenets_dir)
+        shutil.copy(REPO_ROOT / "templates" / "tenets" / "combine_tenets.py", tenets_dir)
+        self._write("tenets/project/focus.md", "## Tenet: focus\n\n**Title**: Focus\n\n**Description**: Do one thing.\n")
+        with mock.patch.dict(os.environ, {"VIBESAFE_NO_CACHE": "1"}):
+            vp.generate(self.prompts_dir, ["cursor"], tenets_dir, root=self.root)
+        self._write("tenets/combine_tenets.py", "raise RuntimeError('broken')\n")
+        self._write("vibesafe/templates/prompts/context-specific/cip.md", "# CIPs, revised\n")
+
+        with mock.patch("sys.stdout"), mock.patch("sys.stderr"):
+            status = vp.main(["--prompts-dir", self.prompts_dir, "--platform", "cursor",
+                              "--tenets-dir", tenets_dir, "--root", self.root])
+        self.assertEqual(status, 3)
+
+        # The tenet rule generated before is kept, and the revised prompt recorded
+        rule = os.path.join(".cursor", "rules", "project_tenet_focus.mdc")
+        self.assertTrue(os.path.exists(os.path.join(self.root, rule)))
+        with open(os.path.join(self.root, ".vibesafe", "prompts.json"), encoding="utf-8") as f:
+            outputs = json.load(f)["outputs"]
+        self.assertIn(rule, outputs)
+        cip = os.path.join(".cursor", "rules", "cip.mdc")
+        self.assertEqual(outputs[cip]["sha256"], vp._file_sha256(os.path.join(self.root, cip)))
+
+        result = vp.generate(self.prompts_dir, ["cursor"], tenets_dir, root=self.root)
+        self.assertEqual(result["tenet_error"], "RuntimeError: broken")
+        self.assertEqual(result["written"], [])
+        self.assertEqual(result["removed"], [])
+        self.assertEqual([name for name in os.listdir(os.path.join(self.root, ".vibesafe"))
+                          if name.endswith(".tmp")], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
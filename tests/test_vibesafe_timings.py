@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-phase timings behind --timings (templates/scripts/vibesafe_timings.py).
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add repo root to path so we can import test_support
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from test_support import load_module_from_path
+
+load_module_from_path(
+    "scripts.vibesafe_timings",
+    Path(__file__).resolve().parents[1] / "templates" / "scripts" / "vibesafe_timings.py",
+)
+
+from scripts import vibesafe_timings as vt  # pyright: ignore[reportMissingImports]
+
+
+class TestTimings(unittest.TestCase):
+    def test_phase_records_counter_deltas(self):
+        timings = vt.Timings("tool")
+        vt.count_read(100)  # before any phase: reported as 'other'
+        with timings.phase("read"):
+            vt.count_read(10)
+            vt.count_read(5)
+            vt.count("yaml_parses", 2)
+        with timings.phase("spawn"):
+            vt.count("subprocesses")
+
+        data = timings.as_dict()
+        phases = {row["phase"]: row for row in data["phases"]}
+        self.assertEqual(data["tool"], "tool")
+        self.assertEqual(
+            {k: phases["read"][k] for k in vt.COUNTERS},
+            {"files_read": 2, "bytes_read": 15, "yaml_parses": 2, "subprocesses": 0},
+        )
+        self.assertEqual(phases["spawn"]["subprocesses"], 1)
+        self.assertEqual(phases["other"]["bytes_read"], 100)
+        self.assertEqual(data["total"]["files_read"], 3)
+        self.assertGreaterEqual(data["total"]["wall_ms"], phases["read"]["wall_ms"])
+
+    def test_phase_is_recorded_when_block_raises(self):
+        timings = vt.Timings()
+        with self.assertRaises(ValueError):
+            with timings.phase("failing"):
+                raise ValueError("boom")
+        self.assertEqual([row["phase"] for row in timings.phases], ["failing"])
+
+    def test_null_phase_without_timings(self):
+        with vt.phase(None, "ignored") as p:
+            pass
+        self.assertIsNotNone(p)
+        timings = vt.Timings()
+        with vt.phase(timings, "kept"):
+            pass
+        self.assertEqual([row["phase"] for row in timings.phases], ["kept"])
+
+    def test_concurrent_phases_count_their_own_thread(self):
+        import threading
+
+        timings = vt.Timings()
+        both_started = threading.Barrier(2)
+
+        def work(name, nbytes):
+            with timings.phase(name):
+                both_started.wait(5)
+                vt.count_read(nbytes)
+                helper = threading.Thread(target=attached_read, args=(vt.current_phase(), nbytes))
+                helper.start()
+                helper.join()
+
+        def attached_read(parent, nbytes):
+            with vt.attach(parent):
+                vt.count_read(nbytes)
+
+        threads = [threading.Thread(target=work, args=(name, n)) for name, n in (("a", 10), ("b", 1000))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        data = timings.as_dict()
+        phases = {row["phase"]: row for row in data["phases"]}
+        self.assertEqual((phases["a"]["files_read"], phases["a"]["bytes_read"]), (2, 20))
+        self.assertEqual((phases["b"]["files_read"], phases["b"]["bytes_read"]), (2, 2000))
+        # Overlapping phases are not counted twice against the total
+        other = phases.get("other", {"wall_ms": 0.0, "files_read": 0})
+        self.assertGreaterEqual(other["wall_ms"], 0.0)
+        self.assertEqual(other["files_read"], 0)
+        self.assertIsNone(vt.current_phase())
+
+    def test_report_and_json(self):
+        timings = vt.Timings("validate")
+        with timings.phase("build_component_index"):
+            vt.count_read(2048)
+
+        out = io.StringIO()
+        timings.report(file=out)
+        lines = out.getvalue().splitlines()
+        self.assertIn("Timings (validate):", lines)
+        self.assertTrue(any(line.split()[:1] == ["build_component_index"] for line in lines))
+        self.assertTrue(any(line.split()[:1] == ["total"] for line in lines))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "timings.json")
+            timings.write_json(path)
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        self.assertEqual(data["phases"][0]["phase"], "build_component_index")
+        self.assertEqual(data["phases"][0]["bytes_read"], 2048)
+        self.assertEqual(set(data["total"]), {"phase", "wall_ms", "cpu_ms"} | set(vt.COUNTERS))
+
+
+if __name__ == "__main__":
+    unittest.main()
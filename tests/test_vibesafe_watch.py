@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the file watcher behind whats_next.py --watch (templates/scripts/vibesafe_watch.py).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add repo root to path so we can import test_support
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from test_support import load_module_from_path
+
+load_module_from_path(
+    "scripts.vibesafe_watch",
+    Path(__file__).resolve().parents[1] / "templates" / "scripts" / "vibesafe_watch.py",
+)
+
+from scripts import vibesafe_watch as vw  # pyright: ignore[reportMissingImports]
+
+
+class _WatcherTests:
+    """Shared behaviour; subclasses provide _open()."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        for rel in ["cip/cip0001.md", "backlog/features/a.md", "README.md"]:
+            self._write(rel, "x\n")
+        self.watcher = self._open()
+
+    def tearDown(self):
+        self.watcher.close()
+        shutil.rmtree(self.root)
+
+    def _write(self, rel, content):
+        path = os.path.join(self.root, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def test_reports_modified_file(self):
+        self._write("cip/cip0001.md", "changed\n")
+        self.assertIn(os.path.join("cip", "cip0001.md"), self.watcher.wait(timeout=5))
+
+    def test_reports_created_and_deleted_files(self):
+        self._write("backlog/features/b.md", "new\n")
+        os.remove(os.path.join(self.root, "cip", "cip0001.md"))
+        changed = set()
+        for _ in range(3):
+            changed |= self.watcher.wait(timeout=1)
+            if {os.path.join("backlog", "features", "b.md"), os.path.join("cip", "cip0001.md")} <= changed:
+                break
+        self.assertIn(os.path.join("backlog", "features", "b.md"), changed)
+        self.assertIn(os.path.join("cip", "cip0001.md"), changed)
+
+    def test_reports_new_component_directory(self):
+        self._write("requirements/req0001.md", "new\n")
+        changed = self.watcher.wait(timeout=5)
+        self.assertTrue(any(p.split(os.sep)[0] == "requirements" for p in changed))
+
+    def test_ignores_files_outside_component_dirs(self):
+        self._write("README.md", "changed\n")
+        self.assertEqual(self.watcher.wait(timeout=0.3), set())
+
+
+class TestPollingWatcher(_WatcherTests, unittest.TestCase):
+    def _open(self):
+        return vw.PollingWatcher(self.root, ["cip", "backlog", "requirements", "tenets"], interval=0.05)
+
+    def test_same_size_rewrite_detected_by_mtime(self):
+        path = os.path.join(self.root, "cip", "cip0001.md")
+        st = os.stat(path)
+        self._write("cip/cip0001.md", "y\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(self.watcher.wait(timeout=5), {os.path.join("cip", "cip0001.md")})
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux-only")
+class TestInotifyWatcher(_WatcherTests, unittest.TestCase):
+    def _open(self):
+        try:
+            return vw.InotifyWatcher(self.root, ["cip", "backlog", "requirements", "tenets"])
+        except (OSError, AttributeError) as e:
+            self.skipTest(f"inotify unavailable: {e}")
+
+
+class TestOpenWatcher(unittest.TestCase):
+    def test_falls_back_to_polling(self):
+        with tempfile.TemporaryDirectory() as root, \
+             mock.patch.object(vw, "InotifyWatcher", side_effect=OSError("no inotify")):
+            watcher = vw.open_watcher(root, ["cip"], interval=0.5)
+            self.assertIsInstance(watcher, vw.PollingWatcher)
+            self.assertEqual(watcher.interval, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
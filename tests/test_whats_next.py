@@ -5,6 +5,7 @@ This module contains tests for the script's functionality, ensuring that it
 properly analyzes the repository status, CIPs, and backlog items.
 """
 
+import argparse
 import os
 import shutil
 import sys
@@ -50,7 +51,11 @@ from scripts.whats_next import (  # pyright: ignore[reportMissingImports]
     generate_documentation_spec_prompts,
     scan_cips,
     scan_backlog,
+    collect_status,
+    print_status,
+    forget_frontmatter,
 )
+from vibesafe_project import ProjectModel  # pyright: ignore[reportMissingImports]
 
 
 class TestWhatsNextCore(unittest.TestCase):
@@ -77,46 +82,133 @@ class TestWhatsNextCore(unittest.TestCase):
 
     @patch("scripts.whats_next.run_command")
     def test_run_update_scripts_success_and_failure(self, mock_run_command):
-        """run_update_scripts should report success and failure for existing scripts."""
+        """Scripts without an in-process updater run with python3 and report success and failure."""
         from scripts import whats_next as wn
 
-        # Only treat two scripts as existing
+        # Only treat two scripts as existing (paths are joined to the project root)
         def exists_side_effect(path: str) -> bool:
-            return path in {"backlog/update_index.py", "cip/update_index.py"}
+            return path.endswith((os.path.join("backlog", "update_index.py"), os.path.join("cip", "update_index.py")))
 
         mock_run_command.side_effect = [
             ("ok", 0),      # backlog/update_index.py
             ("nope", 1),    # cip/update_index.py
         ]
 
-        with mock.patch("os.path.exists", side_effect=exists_side_effect):
+        with mock.patch("os.path.exists", side_effect=exists_side_effect), \
+             mock.patch.dict(wn._UPDATERS, clear=True):
             results = wn.run_update_scripts()
 
         self.assertTrue(any("✓ Updated backlog/update_index.py" in r for r in results))
         self.assertTrue(any("✗ Failed to update cip/update_index.py" in r for r in results))
 
-    @patch("scripts.whats_next.run_command")
-    def test_get_git_status(self, mock_run_command):
+    def test_run_update_scripts_updates_backlog_in_process(self):
+        """The backlog index is regenerated in-process from the project model."""
+        from scripts import whats_next as wn
+
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, "backlog", "features"))
+            shutil.copy(
+                Path(__file__).resolve().parents[1] / "templates" / "backlog" / "update_index.py",
+                os.path.join(tmp, "backlog", "update_index.py"),
+            )
+            with open(os.path.join(tmp, "backlog", "features", "2026-01-01_task.md"), "w") as f:
+                f.write('---\nid: "2026-01-01_task"\ntitle: "In-process Task"\nstatus: "Ready"\n---\n')
+
+            # Scripts are found below the project root, not the current directory
+            project = wn.scan_project(tmp)
+            with mock.patch.object(wn, "run_command", side_effect=AssertionError("spawned")):
+                results = wn.run_update_scripts(project=project)
+
+            self.assertEqual(results, ["✓ Updated backlog/update_index.py"])
+            with open(os.path.join(tmp, "backlog", "index.md"), encoding="utf-8") as f:
+                self.assertIn("[In-process Task](features/2026-01-01_task.md)", f.read())
+            self.assertTrue(project.exists("backlog/index.md"))
+
+    def test_repeated_in_process_updates_only_re_render_changed_sections(self):
+        """The daemon and watch mode keep update_index loaded, so unchanged sections are reused."""
+        from scripts import whats_next as wn
+
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, "backlog", "features"))
+            os.makedirs(os.path.join(tmp, "backlog", "bugs"))
+            script = os.path.join(tmp, "backlog", "update_index.py")
+            shutil.copy(Path(__file__).resolve().parents[1] / "templates" / "backlog" / "update_index.py", script)
+            feature = os.path.join(tmp, "backlog", "features", "2026-01-01_feature.md")
+            with open(feature, "w") as f:
+                f.write('---\nid: "2026-01-01_feature"\ntitle: "Feature"\nstatus: "Ready"\n---\n')
+            with open(os.path.join(tmp, "backlog", "bugs", "2026-01-02_bug.md"), "w") as f:
+                f.write('---\nid: "2026-01-02_bug"\ntitle: "Bug"\nstatus: "Proposed"\n---\n')
+
+            with mock.patch.dict(os.environ, {"VIBESAFE_NO_CACHE": "1"}):
+                wn.run_update_scripts(project=wn.scan_project(tmp))
+                module = wn.load_script(script)
+                first = dict(module._rendered_sections)
+                with open(feature, "w") as f:
+                    f.write('---\nid: "2026-01-01_feature"\ntitle: "Renamed"\nstatus: "Ready"\n---\n')
+                wn.run_update_scripts(project=wn.scan_project(tmp))
+
+            self.assertIs(wn.load_script(script), module)
+            backlog_dir = os.path.dirname(script)
+            second = module._rendered_sections
+            self.assertIsNot(second[(backlog_dir, "features/ready")][1], first[(backlog_dir, "features/ready")][1])
+            self.assertIs(second[(backlog_dir, "bugs/proposed")][1], first[(backlog_dir, "bugs/proposed")][1])
+            with open(os.path.join(tmp, "backlog", "index.md"), encoding="utf-8") as f:
+                self.assertIn("[Renamed](features/2026-01-01_feature.md)", f.read())
+
+    def test_old_update_index_runs_as_a_script(self):
+        """A copy of update_index.py without the in-process API is run with python3 from the project root."""
+        from scripts import whats_next as wn
+
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, "backlog"))
+            with open(os.path.join(tmp, "backlog", "update_index.py"), "w") as f:
+                f.write("def update_index(task_files=None):\n    raise AssertionError('called in-process')\n")
+            project = wn.scan_project(tmp)
+            with mock.patch.object(wn, "run_command", return_value=("ok", 0)) as run_command:
+                results = wn.run_update_scripts(project=project)
+
+        self.assertEqual(results, ["✓ Updated backlog/update_index.py"])
+        run_command.assert_called_once_with(["python3", "backlog/update_index.py"], cwd=project.root)
+
+    def test_get_git_status(self):
         """Test the get_git_status function."""
-        # Mock the output of git branch --show-current
-        mock_run_command.side_effect = [
-            ("main", 0),  # git branch --show-current
-            ("abc123 commit message 1\ndef456 commit message 2", 0),  # git log
-            ("M  file1.txt\n?? file2.txt", 0),  # git status
-        ]
+        from scripts import whats_next as wn
 
-        git_info = get_git_status()
+        # What git status --porcelain=v2 --branch -z and git log --oneline report
+        state = wn.vibesafe_git.parse_status(b"\0".join([
+            b"# branch.oid abc123",
+            b"# branch.head main",
+            b"# branch.upstream origin/main",
+            b"# branch.ab +2 -0",
+            b"1 M. N... 100644 100644 100644 abc abc file1.txt",
+            b"",
+        ]))
+        state.untracked = ["file2.txt"]
+        state.recent_commits = wn.vibesafe_git.parse_log("abc123 commit message 1\ndef456 commit message 2")
+
+        with mock.patch.object(wn.vibesafe_git, "read_git_state", return_value=state):
+            git_info = get_git_status()
 
         # Check the result
         self.assertEqual(git_info["current_branch"], "main")
+        self.assertEqual(git_info["upstream"], "origin/main")
+        self.assertEqual((git_info["ahead"], git_info["behind"]), (2, 0))
         self.assertEqual(len(git_info["recent_commits"]), 2)
         self.assertEqual(git_info["recent_commits"][0]["hash"], "abc123")
         self.assertEqual(git_info["recent_commits"][0]["message"], "commit message 1")
         self.assertEqual(len(git_info["modified_files"]), 1)
-        self.assertEqual(git_info["modified_files"][0]["path"], "file1.txt")
+        self.assertEqual(git_info["modified_files"][0], {"status": "M", "path": "file1.txt"})
         self.assertEqual(len(git_info["untracked_files"]), 1)
         self.assertEqual(git_info["untracked_files"][0], "file2.txt")
 
+    def test_get_git_status_outside_repository(self):
+        from scripts import whats_next as wn
+
+        with mock.patch.object(wn.vibesafe_git, "read_git_state", return_value=None):
+            git_info = get_git_status()
+        self.assertEqual(git_info["current_branch"], "")
+        self.assertEqual(git_info["modified_files"], [])
+
     def test_scan_cips_without_frontmatter_uses_regex(self):
         with tempfile.TemporaryDirectory() as tmp:
             os.makedirs(os.path.join(tmp, "cip"), exist_ok=True)
@@ -351,27 +443,26 @@ status: proposed
 
 def test_scan_requirements_with_framework():
     """Test scanning requirements when the framework exists."""
-    with mock.patch('os.path.isdir', return_value=True), \
-         mock.patch('os.path.exists', return_value=True):
-        
-        result = scan_requirements()
-        
-        assert result['has_framework'] is True
-        assert result['has_template'] is True
-        # Note: patterns/prompts/integrations/examples/guidance are deprecated in simplified requirements framework
-        # The new requirements framework just checks for requirements/*.md files
+    project = ProjectModel()
+    project.dirs['requirements'] = ['requirement_template.md']
+    
+    result = scan_requirements(project)
+    
+    assert result['has_framework'] is True
+    assert result['has_template'] is True
+    # Note: patterns/prompts/integrations/examples/guidance are deprecated in simplified requirements framework
+    # The new requirements framework just checks for requirements/*.md files
 
 def test_scan_requirements_without_framework():
     """Test scanning requirements when the framework doesn't exist."""
-    with mock.patch('os.path.isdir', return_value=False):
-        result = scan_requirements()
-        
-        assert result['has_framework'] is False
-        assert len(result['patterns']) == 0
-        assert all(len(prompts) == 0 for prompts in result['prompts'].values())
-        assert len(result['integrations']) == 0
-        assert len(result['examples']) == 0
-        assert len(result['guidance']) == 0
+    result = scan_requirements(ProjectModel())
+    
+    assert result['has_framework'] is False
+    assert len(result['patterns']) == 0
+    assert all(len(prompts) == 0 for prompts in result['prompts'].values())
+    assert len(result['integrations']) == 0
+    assert len(result['examples']) == 0
+    assert len(result['guidance']) == 0
 
 def test_generate_next_steps_with_requirements():
     """Test generating next steps when the requirements framework exists."""
@@ -458,7 +549,11 @@ def test_cmd_args_requirements_only():
             compression_check=False,  # Don't trigger compression check early return
             show_doc_spec=False,  # Avoid truthy auto-created Mock attributes
             no_update=True,
-            skip_validation=True
+            skip_validation=True,
+            watch=False,
+            timings=False,
+            timings_json=None,
+            jobs=1,
         )
         
         # Setup mock scan_requirements to return a valid result
@@ -509,6 +604,9 @@ def test_cmd_args_show_doc_spec_missing():
             show_doc_spec=True,
             no_update=True,
             skip_validation=True,
+            timings=False,
+            timings_json=None,
+            jobs=1,
         )
 
         from scripts.whats_next import main  # pyright: ignore[reportMissingImports]
@@ -550,6 +648,9 @@ def test_cmd_args_show_doc_spec_present_and_shows_targets_and_files():
             show_doc_spec=True,
             no_update=True,
             skip_validation=True,
+            timings=False,
+            timings_json=None,
+            jobs=1,
         )
 
         from scripts.whats_next import main  # pyright: ignore[reportMissingImports]
@@ -582,6 +683,10 @@ def test_main_runs_update_scripts_when_enabled():
             show_doc_spec=False,
             no_update=False,
             skip_validation=True,
+            watch=False,
+            timings=False,
+            timings_json=None,
+            jobs=1,
         )
 
         from scripts.whats_next import main  # pyright: ignore[reportMissingImports]
@@ -609,6 +714,9 @@ def test_cmd_args_compression_check_no_candidates():
             show_doc_spec=False,
             no_update=True,
             skip_validation=True,
+            timings=False,
+            timings_json=None,
+            jobs=1,
         )
 
         from scripts.whats_next import main  # pyright: ignore[reportMissingImports]
@@ -650,6 +758,9 @@ def test_cmd_args_compression_check_with_candidates():
             show_doc_spec=False,
             no_update=True,
             skip_validation=True,
+            timings=False,
+            timings_json=None,
+            jobs=1,
         )
 
         from scripts.whats_next import main  # pyright: ignore[reportMissingImports]
@@ -1203,6 +1314,232 @@ class TestValidationIntegration(unittest.TestCase):
         
         # Should still work
         self.assertIsInstance(next_steps, list)
+    
+    def test_run_validation_in_process_with_project_model(self):
+        """Validation runs in-process on the given model and summarizes the result."""
+        import validate_vibesafe_structure  # pyright: ignore[reportMissingImports]
+        
+        result = validate_vibesafe_structure.ValidationResult()
+        result.add_error("e1", "a.md")
+        result.add_warning("w1", "b.md")
+        result.add_warning("w2", "c.md")
+        project = ProjectModel()
+        
+        with mock.patch.object(validate_vibesafe_structure, 'validate', return_value=result) as m_validate, \
+             mock.patch('subprocess.run', side_effect=AssertionError("should not spawn")):
+            info = run_validation(project)
+        
+        self.assertEqual(m_validate.call_args.kwargs['project'], project)
+        self.assertEqual(info, {'error_count': 1, 'warning_count': 2, 'has_issues': True, 'exit_code': 1})
+    
+    def test_run_validation_reports_validator_failure(self):
+        """Exceptions from the validator are returned as an error entry."""
+        import validate_vibesafe_structure  # pyright: ignore[reportMissingImports]
+        
+        with mock.patch.object(validate_vibesafe_structure, 'validate', side_effect=RuntimeError("boom")):
+            info = run_validation(ProjectModel())
+        
+        self.assertEqual(info, {'error': 'boom'})
+
+
+class TestWatchMode(unittest.TestCase):
+    """Test the incremental refresh behind --watch."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.original_dir = os.getcwd()
+        os.chdir(self.test_dir)
+        os.makedirs('cip')
+        os.makedirs('backlog/features')
+        self._write('cip/cip0001.md', 'id: "0001"\ntitle: "First"\nstatus: "Proposed"\n')
+        self._write('backlog/features/2026-01-01_task.md',
+                    'id: "2026-01-01_task"\ntitle: "Task"\nstatus: "Proposed"\npriority: "High"\n')
+        self.args = argparse.Namespace(
+            no_git=True, quiet=False, cip_only=False, backlog_only=False,
+            requirements_only=False, skip_validation=True, jobs=1,
+        )
+
+    def tearDown(self):
+        os.chdir(self.original_dir)
+        shutil.rmtree(self.test_dir)
+
+    def _write(self, path, header):
+        with open(path, 'w') as f:
+            f.write(f"---\n{header}---\n\n# Body\n")
+
+    def test_collect_status_rebuilds_only_changed_sections(self):
+        """Sections whose directory did not change are reused as-is."""
+        from vibesafe_project import scan_project  # pyright: ignore[reportMissingImports]
+
+        project = scan_project()
+        status = collect_status(self.args, project)
+        self.assertEqual(status['backlog_info']['by_status']['proposed'][0]['title'], 'Task')
+
+        self._write('backlog/features/2026-01-01_task.md',
+                    'id: "2026-01-01_task"\ntitle: "Task"\nstatus: "In Progress"\npriority: "High"\n')
+        project.refresh('backlog/features/2026-01-01_task.md')
+        with mock.patch('scripts.whats_next.scan_cips', side_effect=AssertionError("cip/ did not change")):
+            updated = collect_status(self.args, project, status, {'backlog'})
+
+        self.assertIs(updated['cips_info'], status['cips_info'])
+        self.assertEqual(updated['backlog_info']['by_status']['in_progress'][0]['title'], 'Task')
+        self.assertFalse(updated['backlog_info']['by_status']['proposed'])
+
+    def test_frontmatter_memo_rereads_only_forgotten_files(self):
+        """In watch mode a file's frontmatter is read again only after forget_frontmatter()."""
+        whats_next = sys.modules['scripts.whats_next']
+        real_read_header = whats_next.read_header
+        reads = []
+
+        def counting_read_header(path):
+            reads.append(os.path.normpath(path))
+            return real_read_header(path)
+
+        with mock.patch.object(whats_next, '_frontmatter_memo', {}), \
+             mock.patch.object(whats_next, '_frontmatter_cache', None), \
+             mock.patch.object(whats_next, 'read_header', side_effect=counting_read_header):
+            extract_frontmatter('cip/cip0001.md')
+            extract_frontmatter('./cip/cip0001.md')
+            self._write('cip/cip0001.md', 'id: "0001"\ntitle: "Renamed"\nstatus: "Proposed"\n')
+            forget_frontmatter('cip')
+            fm = extract_frontmatter('cip/cip0001.md')
+
+        self.assertEqual(reads, ['cip/cip0001.md', 'cip/cip0001.md'])
+        self.assertEqual(fm['title'], 'Renamed')
+
+
+class TestTimings(unittest.TestCase):
+    """Test the per-phase report behind --timings and --timings-json."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.original_dir = os.getcwd()
+        os.chdir(self.test_dir)
+        os.makedirs('cip')
+        with open('cip/cip0001.md', 'w') as f:
+            f.write('---\nid: "0001"\ntitle: "First"\nstatus: "Proposed"\n---\n\n# Body\n')
+        with open('cip/cip0002.md', 'w') as f:
+            f.write('# CIP-0002: Legacy\n\n## Status\n\n- [x] Proposed\n')
+
+    def tearDown(self):
+        os.chdir(self.original_dir)
+        shutil.rmtree(self.test_dir)
+
+    def test_timings_json_reports_phases_and_counters(self):
+        import io
+        import json
+        from contextlib import redirect_stderr, redirect_stdout
+        from scripts.whats_next import main  # pyright: ignore[reportMissingImports]
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            main(['--no-git', '--no-update', '--no-color', '--skip-validation', '--no-cache',
+                  '--timings', '--timings-json', 'timings.json'])
+        with open('timings.json') as f:
+            timings = json.load(f)
+
+        phases = {row['phase']: row for row in timings['phases']}
+        self.assertEqual(timings['tool'], 'whats_next')
+        self.assertIn('scan_project', phases)
+        self.assertNotIn('run_validation', phases)
+        # Two header reads, plus the legacy CIP read in full; one header parsed
+        self.assertEqual(phases['scan_cips']['files_read'], 3)
+        self.assertEqual(phases['scan_cips']['yaml_parses'], 1)
+        self.assertIn('Timings (whats_next):', stderr.getvalue())
+        self.assertNotIn('Timings', stdout.getvalue())
+
+
+class TestConcurrentPhases(unittest.TestCase):
+    """Test the scheduler running independent phases in threads (--jobs)."""
+
+    def test_output_is_written_in_task_order(self):
+        import io
+        import threading
+        from contextlib import redirect_stdout
+        from scripts.whats_next import run_concurrently  # pyright: ignore[reportMissingImports]
+
+        second_done = threading.Event()
+
+        def first():
+            # Finishes last, but its output still comes first
+            self.assertTrue(second_done.wait(5))
+            print("first")
+            return 1
+
+        def second():
+            print("second")
+            second_done.set()
+            return 2
+
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            results = run_concurrently([('first', first, ()), ('second', second, ()),
+                                        ('third', lambda: print("third"), ('first',))], jobs=2)
+        self.assertEqual(stdout.getvalue(), "first\nsecond\nthird\n")
+        self.assertEqual(results, {'first': 1, 'second': 2, 'third': None})
+
+    def test_first_failure_is_raised_and_dependents_skipped(self):
+        from scripts.whats_next import run_concurrently  # pyright: ignore[reportMissingImports]
+
+        ran = []
+
+        def fail(message):
+            raise ValueError(message)
+
+        with self.assertRaisesRegex(ValueError, "first"):
+            run_concurrently([('ok', lambda: ran.append('ok'), ()),
+                              ('first', lambda: fail("first"), ()),
+                              ('second', lambda: fail("second"), ()),
+                              ('dependent', lambda: ran.append('dependent'), ('first',))], jobs=4)
+        self.assertEqual(ran, ['ok'])
+
+    def test_collect_status_matches_sequential_run(self):
+        import io
+        from scripts import whats_next as wn
+        from vibesafe_project import scan_project  # pyright: ignore[reportMissingImports]
+
+        test_dir = tempfile.mkdtemp()
+        original_dir = os.getcwd()
+        os.chdir(test_dir)
+        try:
+            os.makedirs('cip')
+            os.makedirs('backlog/features')
+            os.makedirs('requirements')
+            for i in range(1, 6):
+                with open(f'cip/cip000{i}.md', 'w') as f:
+                    f.write(f'---\nid: "000{i}"\ntitle: "CIP {i}"\nstatus: "Proposed"\n---\n\n# Body\n')
+            with open('backlog/features/2026-01-01_task.md', 'w') as f:
+                f.write('---\nid: "2026-01-01_task"\ntitle: "Task"\nstatus: "Proposed"\n'
+                        'priority: "High"\n---\n\n# Body\n')
+            with open('cip/cip0009.md', 'w') as f:
+                f.write('---\nid: "0009"\ntitle: [unterminated\n---\n')
+
+            statuses = []
+            git_state = wn.vibesafe_git.GitState()
+            git_state.branch = 'main'
+            for jobs in (1, 4):
+                args = argparse.Namespace(
+                    no_git=False, quiet=False, cip_only=False, backlog_only=False,
+                    requirements_only=False, skip_validation=True, jobs=jobs,
+                )
+                with patch('sys.stdout', new_callable=io.StringIO) as stdout, \
+                     patch.object(wn.vibesafe_git, 'read_git_state', return_value=git_state):
+                    status = collect_status(args, scan_project())
+                    collected_output = stdout.getvalue()
+                    print_status(args, status)
+                statuses.append((status, collected_output, stdout.getvalue()))
+        finally:
+            os.chdir(original_dir)
+            shutil.rmtree(test_dir)
+
+        (sequential, sequential_collected, sequential_output), (concurrent, _, concurrent_output) = statuses
+        self.assertEqual(concurrent, sequential)
+        self.assertEqual(sequential_collected, "")
+        # Printed inside the report, where the CIPs are scanned, as before the scans were split out
+        message = sequential_output.index("Error reading frontmatter from cip/cip0009.md")
+        self.assertLess(sequential_output.index("Current Branch:"), message)
+        self.assertLess(message, sequential_output.index("CIPs:"))
+        self.assertEqual(concurrent_output, sequential_output)
 
 
 class TestGapDetection(unittest.TestCase):
@@ -1831,6 +2168,32 @@ class TestCompressionDetection(unittest.TestCase):
         self.assertIn('5 days ago', suggestions_text)
         self.assertIn('High priority', suggestions_text)
     
+    def test_generate_compression_suggestions_uses_scanned_path(self):
+        """Test that the path recorded by scan_cips() is used instead of a glob."""
+        from datetime import datetime, timedelta
+        
+        five_days_ago = (datetime.now() - timedelta(days=5)).strftime('%Y-%m-%d')
+        
+        cips_info = {
+            'by_status': {
+                'closed': [
+                    {
+                        'id': 'cip0012',
+                        'title': 'Test CIP',
+                        'last_updated': five_days_ago,
+                        'compressed': False,
+                        'priority': 'high',
+                        'path': 'cip/cip0012.md'
+                    }
+                ]
+            }
+        }
+        
+        with mock.patch('glob.glob', side_effect=AssertionError('globbed')):
+            suggestions = generate_compression_suggestions(cips_info)
+        
+        self.assertIn('CIP-cip0012', ' '.join(suggestions))
+    
     def test_generate_compression_suggestions_multiple_cips(self):
         """Test suggestion generation with multiple CIPs."""
         from datetime import datetime, timedelta